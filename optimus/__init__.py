@@ -1,11 +1,20 @@
 """Optimus is a static site builder using Jinja2, webassets and Babel."""
-from importlib.metadata import version
-
-
 __pkgname__ = "Optimus"
 
-__version__ = version(__pkgname__)
-
 PROJECT_DIR_ENVVAR = "OPTIMUS_PROJECT_DIR"
 
 SETTINGS_NAME_ENVVAR = "OPTIMUS_SETTINGS_MODULE"
+
+
+def __getattr__(name):
+    """
+    Get package version from its metadata only when it is required, since reading
+    metadata is slow.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = version(__pkgname__)
+        return globals()["__version__"]
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
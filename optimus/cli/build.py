@@ -1,4 +1,5 @@
 import importlib
+import logging
 import os
 
 import click
@@ -8,11 +9,41 @@ from optimus.conf.loader import (
     import_settings_module,
     load_settings,
 )
+from optimus.exceptions import PageBuildError
 from optimus.interfaces.build import builder_interface
+from optimus.pages.reports import write_build_report
 from optimus.setup_project import setup_project
 from optimus.utils import display_settings
 
 
+def parse_shard(context, param, value):
+    """
+    Parse shard option value.
+
+    Arguments:
+        context (click.Context): Command context.
+        param (click.Parameter): Option parameter.
+        value (string): Option value like ``K/N``.
+
+    Returns:
+        tuple: Shard number and number of shards, or ``None`` if value is empty.
+    """
+    if not value:
+        return None
+
+    try:
+        number, count = [int(item) for item in value.split("/")]
+    except ValueError:
+        raise click.BadParameter("Shard must be in format 'K/N' like '1/4'.")
+
+    if count < 1 or not 1 <= number <= count:
+        raise click.BadParameter(
+            "Shard number must be between 1 and the number of shards."
+        )
+
+    return number, count
+
+
 @click.command("build", short_help="Build project pages")
 @click.option(
     "--basedir",
@@ -33,11 +64,69 @@ from optimus.utils import display_settings
     ),
     default="settings",
 )
+@click.option(
+    "--jobs",
+    metavar="INTEGER",
+    type=click.IntRange(min=1),
+    help=(
+        "Number of worker processes to build pages. Default value is '1' to build "
+        "pages serially."
+    ),
+    default=1,
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help=(
+        "Only build pages whose inputs (templates, datas, context, translations "
+        "and settings) have changed since the previous build."
+    ),
+)
+@click.option(
+    "--write-if-changed",
+    is_flag=True,
+    help=(
+        "Leave untouched the built files whose content has not changed, so their "
+        "modification time does not change."
+    ),
+)
+@click.option(
+    "--slowest",
+    metavar="INTEGER",
+    type=click.IntRange(min=0),
+    help=(
+        "Number of slowest built pages to output at the end of build. Default "
+        "value is '0' to output nothing."
+    ),
+    default=0,
+)
+@click.option(
+    "--report",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help=(
+        "File path where to write a JSON report of build timings for every built "
+        "page and their templates."
+    ),
+)
+@click.option(
+    "--shard",
+    metavar="K/N",
+    callback=parse_shard,
+    help=(
+        "Only build the pages from shard K of N shards, pages are distributed in "
+        "shards from their destination. Use command 'merge-reports' to merge "
+        "reports from every shards."
+    ),
+)
 @click.pass_context
-def build_command(context, basedir, settings_name):
+def build_command(context, basedir, settings_name, jobs, incremental,
+                  write_if_changed, slowest, report, shard):
     """
     Build project pages
     """
+    logger = logging.getLogger("optimus")
+
     # Set project before to be able to load its modules
     setup_project(basedir, settings_name)
 
@@ -60,4 +149,32 @@ def build_command(context, basedir, settings_name):
         ("DEBUG", "PROJECT_DIR", "SOURCES_DIR", "TEMPLATES_DIR", "LOCALES_DIR"),
     )
 
-    builder_interface(settings, views)
+    try:
+        build_infos = builder_interface(
+            settings,
+            views,
+            jobs=jobs,
+            incremental=incremental,
+            write_if_changed=write_if_changed,
+            shard=shard,
+        )
+    except PageBuildError as e:
+        logger.error(e)
+        raise click.Abort()
+
+    builder = build_infos["builder"]
+
+    if slowest:
+        builder.log_slowest_pages(limit=slowest)
+
+    if report:
+        logger.info("Writing build report: {}".format(report))
+        write_build_report(
+            report,
+            builder.timings,
+            destinations=[
+                os.path.relpath(path, settings.PUBLISH_DIR)
+                for path in build_infos["builded"] or []
+            ],
+            shard=shard,
+        )
@@ -0,0 +1,95 @@
+import importlib
+import logging
+import os
+
+import click
+
+from jinja2.exceptions import TemplateSyntaxError
+
+from optimus.conf.loader import import_settings_module, load_settings
+from optimus.interfaces.templates import compile_templates_interface
+from optimus.setup_project import setup_project
+from optimus.utils import display_settings
+
+
+@click.command("compile-templates", short_help="Precompile project templates")
+@click.option(
+    "--basedir",
+    metavar="PATH",
+    type=click.Path(exists=True),
+    help=(
+        "Base directory where to search for settings file. "
+        "Default value use current directory."
+    ),
+    default=os.getcwd(),
+)
+@click.option(
+    "--settings-name",
+    metavar="NAME",
+    help=(
+        "Settings file name to use without '.py' extension. "
+        "Default value is 'settings'."
+    ),
+    default="settings",
+)
+@click.option(
+    "--target",
+    metavar="PATH",
+    help=(
+        "Path where to write compiled templates. Default value is the path from "
+        "setting 'JINJA_PRECOMPILED'."
+    ),
+    default=None,
+)
+@click.option(
+    "--directory",
+    is_flag=True,
+    help=(
+        "Compile templates as Python modules in a directory instead of a zip file."
+    ),
+)
+@click.pass_context
+def compile_templates_command(context, basedir, settings_name, target, directory):
+    """
+    Compile every template from templates directory
+
+    Compiled templates are loaded instead of template sources when setting
+    'JINJA_PRECOMPILED' points to them.
+    """
+    logger = logging.getLogger("optimus")
+
+    # Set project before to be able to load its modules
+    setup_project(basedir, settings_name)
+
+    # Load current project settings
+    settings = import_settings_module(settings_name, basedir=basedir)
+    # In test environment, force the module reload to avoid previous test cache to be
+    # used (since the module have the same path).
+    if context.obj["test_env"]:
+        settings = importlib.reload(settings)
+
+    settings = load_settings(settings)
+
+    # Debug output
+    display_settings(
+        settings,
+        ("DEBUG", "PROJECT_DIR", "TEMPLATES_DIR", "JINJA_PRECOMPILED"),
+    )
+
+    target = target or settings.JINJA_PRECOMPILED
+    if not target:
+        logger.error(
+            "A target path is required either from option '--target' or setting "
+            "'JINJA_PRECOMPILED'."
+        )
+        raise click.Abort()
+
+    try:
+        compile_templates_interface(
+            settings,
+            target,
+            zip_method=None if directory else "deflated",
+        )
+    except TemplateSyntaxError as e:
+        logger.error("Template '{}' has a syntax error: {}".format(e.name, e))
+        raise click.Abort()
@@ -1,14 +1,10 @@
 """
 Main entrance to commandline actions
 """
+import importlib
+
 import click
 
-from optimus.cli.version import version_command
-from optimus.cli.startproject import startproject_command
-from optimus.cli.build import build_command
-from optimus.cli.watch import watch_command
-from optimus.cli.po import po_command
-from optimus.cli.runserver import runserver_command
 from optimus.logs import init_logger
 
 
@@ -18,8 +14,58 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 # Default logger conf
 OPTIMUS_LOGGER_CONF = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", None)
 
+# Command paths indexed on command names, command modules are only imported when
+# their command is invoked
+COMMANDS = {
+    "version": "optimus.cli.version:version_command",
+    "init": "optimus.cli.startproject:startproject_command",
+    "build": "optimus.cli.build:build_command",
+    "watch": "optimus.cli.watch:watch_command",
+    "po": "optimus.cli.po:po_command",
+    "runserver": "optimus.cli.runserver:runserver_command",
+    "compile-templates": "optimus.cli.compile_templates:compile_templates_command",
+    "merge-reports": "optimus.cli.merge_reports:merge_reports_command",
+    "serve-builds": "optimus.cli.serve_builds:serve_builds_command",
+    "request-build": "optimus.cli.request_build:request_build_command",
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Command group which imports command modules only when their command is
+    invoked, so a command does not pay the import of every other commands and
+    their dependencies.
+
+    Keyword Arguments:
+        lazy_commands (dict): Command paths like ``package.module:attribute``
+            indexed on command names.
+        **kwargs: Arbitrary keyword arguments for ``click.Group``.
+
+    Attributes:
+        lazy_commands (dict): As given from arguments.
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_path, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_path), attribute)
+            self.add_command(command, name=cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands=COMMANDS,
+    context_settings=CONTEXT_SETTINGS,
+)
 @click.option(
     "-v",
     "--verbose",
@@ -62,12 +108,3 @@ def cli_frontend(ctx, verbose, test_env):
         "logger": root_logger,
         "test_env": test_env,
     }
-
-
-# Attach commands methods to the main grouper
-cli_frontend.add_command(version_command, name="version")
-cli_frontend.add_command(startproject_command, name="init")
-cli_frontend.add_command(build_command, name="build")
-cli_frontend.add_command(watch_command, name="watch")
-cli_frontend.add_command(po_command, name="po")
-cli_frontend.add_command(runserver_command, name="runserver")
@@ -0,0 +1,89 @@
+import json
+import logging
+
+import click
+
+from optimus.exceptions import DestinationCollisionError
+from optimus.pages.reports import merge_build_reports
+from optimus.utils.jsons import ExtendedJsonEncoder
+
+
+def format_shard(shard):
+    """
+    Format a shard for output.
+
+    Arguments:
+        shard (list): Shard number and number of shards, or ``None``.
+
+    Returns:
+        string: Formatted shard like ``1/4``, or ``-`` for an unsharded build.
+    """
+    if not shard:
+        return "-"
+
+    return "{}/{}".format(*shard)
+
+
+@click.command("merge-reports", short_help="Merge build reports from shards")
+@click.argument(
+    "reports",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--output",
+    metavar="PATH",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="File path where to write the merged build report.",
+)
+@click.pass_context
+def merge_reports_command(context, reports, output):
+    """
+    Merge build reports from sharded builds
+
+    Merged reports are checked for destinations built from more than one shard and
+    for missing shards.
+    """
+    logger = logging.getLogger("optimus")
+
+    loaded = []
+    for path in reports:
+        with open(path, "r") as fp:
+            loaded.append(json.load(fp))
+
+    try:
+        merged = merge_build_reports(loaded)
+    except DestinationCollisionError as e:
+        for destination, shards in sorted(e.collisions.items()):
+            msg = "Destination '{}' has been built from shards: {}"
+            logger.error(msg.format(
+                destination,
+                ", ".join([format_shard(shard) for shard in shards]),
+            ))
+        raise click.Abort()
+
+    # Warn about missing shards
+    shards = [tuple(shard) for shard in merged["shards"] if shard]
+    counts = set([count for number, count in shards])
+    if len(counts) > 1:
+        logger.warning("Merged reports are from different numbers of shards")
+    elif counts:
+        count = counts.pop()
+        missing = [
+            (number, count) for number in range(1, count + 1)
+            if (number, count) not in shards
+        ]
+        if missing:
+            msg = "Missing reports for shards: {}"
+            logger.warning(msg.format(
+                ", ".join([format_shard(shard) for shard in missing])
+            ))
+
+    logger.info("Writing merged build report: {}".format(output))
+    with open(output, "w") as fp:
+        json.dump(merged, fp, indent=4, cls=ExtendedJsonEncoder)
+
+    msg = "Merged {} reports with {} destinations"
+    logger.info(msg.format(len(loaded), len(merged["destinations"])))
@@ -0,0 +1,103 @@
+import logging
+import os
+
+import click
+
+from optimus.interfaces.serve_builds import DEFAULT_SOCKET_NAME, send_build_request
+
+
+@click.command("request-build", short_help="Send a build request to build daemon")
+@click.option(
+    "--basedir",
+    metavar="PATH",
+    type=click.Path(exists=True),
+    help=(
+        "Base directory where to search for the default socket file. "
+        "Default value use current directory."
+    ),
+    default=os.getcwd(),
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help=(
+        "Unix socket file path of the build daemon. Default value is '{}' in base "
+        "directory."
+    ).format(DEFAULT_SOCKET_NAME),
+)
+@click.option(
+    "--template",
+    "templates",
+    metavar="NAME",
+    multiple=True,
+    help="Build pages using this template name. Can be used multiple times.",
+)
+@click.option(
+    "--data",
+    "datas",
+    metavar="PATH",
+    multiple=True,
+    help=(
+        "Build pages using this data file path, relative to datas directory. Can "
+        "be used multiple times."
+    ),
+)
+@click.option(
+    "--destination",
+    "destinations",
+    metavar="PATH",
+    multiple=True,
+    help="Build page with this destination. Can be used multiple times.",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Stop the build daemon instead of building.",
+)
+@click.pass_context
+def request_build_command(context, basedir, socket_path, templates, datas,
+                          destinations, stop):
+    """
+    Send a build request to a build daemon started with command 'serve-builds'
+
+    Without any template, data or destination, every pages are built.
+    """
+    logger = logging.getLogger("optimus")
+
+    socket_path = socket_path or os.path.join(basedir, DEFAULT_SOCKET_NAME)
+
+    if stop:
+        request = {"action": "stop"}
+    else:
+        request = {
+            "action": "build",
+            "templates": list(templates),
+            "datas": list(datas),
+            "destinations": list(destinations),
+        }
+
+    try:
+        response = send_build_request(socket_path, request)
+    except OSError as e:
+        msg = "Unable to reach build daemon on socket '{}': {}"
+        logger.error(msg.format(socket_path, e))
+        raise click.Abort()
+
+    if response["status"] != "ok":
+        logger.error(response["error"])
+        raise click.Abort()
+
+    if stop:
+        logger.info("Build daemon has been stopped")
+        return
+
+    for item in response["unknown"]:
+        logger.warning("Unknown template, data or destination: {}".format(item))
+
+    for path in response["built"]:
+        logger.info(" - Built: {}".format(path))
+
+    msg = "Built {} pages in {:.3f}s"
+    logger.info(msg.format(len(response["built"]), response["time"]))
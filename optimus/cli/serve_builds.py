@@ -0,0 +1,113 @@
+import importlib
+import logging
+import os
+
+import click
+
+from optimus.conf.loader import (
+    import_pages_module,
+    import_settings_module,
+    load_settings,
+)
+from optimus.exceptions import BuildDaemonError
+from optimus.interfaces.build import builder_interface
+from optimus.interfaces.serve_builds import (
+    DEFAULT_SOCKET_NAME,
+    check_pages_module,
+    serve_builds_interface,
+)
+from optimus.setup_project import setup_project
+from optimus.utils import display_settings
+
+
+@click.command("serve-builds", short_help="Serve build requests from a socket")
+@click.option(
+    "--basedir",
+    metavar="PATH",
+    type=click.Path(exists=True),
+    help=(
+        "Base directory where to search for settings file. "
+        "Default value use current directory."
+    ),
+    default=os.getcwd(),
+)
+@click.option(
+    "--settings-name",
+    metavar="NAME",
+    help=(
+        "Settings file name to use without '.py' extension. "
+        "Default value is 'settings'."
+    ),
+    default="settings",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    help=(
+        "Unix socket file path where to listen for build requests. Default value "
+        "is '{}' in base directory."
+    ).format(DEFAULT_SOCKET_NAME),
+)
+@click.pass_context
+def serve_builds_command(context, basedir, settings_name, socket_path):
+    """
+    Build project pages then serve build requests from a Unix socket
+
+    Project settings, pages, assets and the page builder are loaded once and kept
+    between requests. Use command 'request-build' to send build requests.
+    """
+    logger = logging.getLogger("optimus")
+
+    socket_path = socket_path or os.path.join(basedir, DEFAULT_SOCKET_NAME)
+
+    # Set project before to be able to load its modules
+    setup_project(basedir, settings_name)
+
+    # Load current project settings and page map
+    settings = import_settings_module(settings_name, basedir=basedir)
+    # In test environment, force the module reload to avoid previous test cache to be
+    # used (since the module have the same path).
+    if context.obj["test_env"]:
+        settings = importlib.reload(settings)
+
+    settings = load_settings(settings)
+
+    views = import_pages_module(settings.PAGES_MAP, basedir=basedir)
+    if context.obj["test_env"]:
+        views = importlib.reload(views)
+
+    # Debug output
+    display_settings(
+        settings,
+        ("DEBUG", "PROJECT_DIR", "SOURCES_DIR", "TEMPLATES_DIR", "LOCALES_DIR"),
+    )
+
+    try:
+        check_pages_module(views)
+    except BuildDaemonError as e:
+        logger.error(e)
+        raise click.Abort()
+
+    logger.debug("Trigger pages build to start")
+    # Page dependencies are registered while pages are built
+    build_env = builder_interface(settings, views, track_dependencies=True)
+
+    try:
+        server = serve_builds_interface(settings, views, build_env, socket_path)
+    except BuildDaemonError as e:
+        logger.error(e)
+        raise click.Abort()
+
+    logger.warning(
+        "Serving build requests on: {}, use CTRL+C to stop it".format(socket_path)
+    )
+    try:
+        # Do not serve during tests since we cannot manage interruption
+        if not context.obj["test_env"]:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        logger.warning("Stopping build daemon..")
+    finally:
+        server.server_close()
@@ -1,16 +1,24 @@
+from importlib.metadata import PackageNotFoundError, version
+
 import click
 
 from optimus import __version__ as optimus_version
 
-from babel import __version__ as babel_version
-from jinja2 import __version__ as jinja2_version
-from webassets import __version__ as webassets_version
-from watchdog.version import VERSION_STRING as watchdog_version
 
-try:
-    from cherrypy import __version__ as cherrypy_version
-except ImportError:
-    cherrypy_version = "Not installed"
+def get_distribution_version(name):
+    """
+    Get version of an installed distribution without to import it.
+
+    Arguments:
+        name (string): Distribution name.
+
+    Returns:
+        string: Distribution version or ``Not installed``.
+    """
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "Not installed"
 
 
 @click.command("version", short_help="Print out versions informations")
@@ -21,12 +29,12 @@ def version_command(context):
     """
     versions = (
         ("Optimus", optimus_version),
-        ("Babel", babel_version),
-        ("cherrypy", cherrypy_version),
-        ("click", click.__version__),
-        ("Jinja2", jinja2_version),
-        ("watchdog", watchdog_version),
-        ("webassets", ".".join([str(i) for i in webassets_version])),
+        ("Babel", get_distribution_version("Babel")),
+        ("cherrypy", get_distribution_version("CherryPy")),
+        ("click", get_distribution_version("click")),
+        ("Jinja2", get_distribution_version("Jinja2")),
+        ("watchdog", get_distribution_version("watchdog")),
+        ("webassets", get_distribution_version("webassets")),
     )
 
     for i, data in enumerate(versions, start=1):
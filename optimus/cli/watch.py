@@ -67,7 +67,8 @@ def watch_command(context, basedir, settings_name):
     )
 
     logger.debug("Trigger pages build to start")
-    build_env = builder_interface(settings, views)
+    # Page dependencies are registered while pages are built
+    build_env = builder_interface(settings, views, track_dependencies=True)
 
     # Init and configure observer with events
     observer = watcher_interface(settings, views, build_env)
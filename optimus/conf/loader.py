@@ -134,6 +134,27 @@ def import_pages_module(name, basedir=None):
     )
 
 
+def load_pages(views):
+    """
+    Get page views from a pages module.
+
+    The ``PAGES`` attribute may be a list of page views, an iterable like a
+    generator which yields page views, or a callable without argument which returns
+    such a list or iterable.
+
+    Arguments:
+        views (object): Pages module, in fact any object with a ``PAGES``
+            attribute.
+
+    Returns:
+        iterable: Page views.
+    """
+    if callable(views.PAGES):
+        return views.PAGES()
+
+    return views.PAGES
+
+
 def load_settings(settings_module):
     """
     Load settings module.
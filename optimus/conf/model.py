@@ -86,6 +86,18 @@ class SettingsModel(object):
         if not hasattr(self, "JINJA_FILTERS"):
             self.JINJA_FILTERS = {}
 
+        # Directory where to store compiled templates, disabled if empty
+        if not hasattr(self, "JINJA_BYTECODE_CACHE"):
+            self.JINJA_BYTECODE_CACHE = None
+
+        # File where to persist template introspection cache, disabled if empty
+        if not hasattr(self, "JINJA_INTROSPECTION_CACHE"):
+            self.JINJA_INTROSPECTION_CACHE = None
+
+        # Path to precompiled templates to load, disabled if empty
+        if not hasattr(self, "JINJA_PRECOMPILED"):
+            self.JINJA_PRECOMPILED = None
+
     def _default_watchdog(self):
         """
         Set default attributes for required settings Watchdog
@@ -136,6 +148,62 @@ class SettingsModel(object):
         if not hasattr(self, "ENABLED_BUNDLES"):
             self.ENABLED_BUNDLES = list(self.BUNDLES.keys())
 
+    def _default_builder(self):
+        """
+        Set default attributes for required settings around page builder
+        """
+        # The file where incremental builds store page fingerprints
+        if not hasattr(self, "BUILD_MANIFEST"):
+            self.BUILD_MANIFEST = os.path.join(self.PROJECT_DIR, ".build-manifest.json")
+
+        # Durability mode for page writes, either None, "file" or "directory"
+        if not hasattr(self, "BUILD_DURABILITY"):
+            self.BUILD_DURABILITY = None
+
+        # Hooks to call on build lifecycle events
+        if not hasattr(self, "BUILD_HOOKS"):
+            self.BUILD_HOOKS = {}
+
+        # File where to persist page registry, disabled if empty
+        if not hasattr(self, "REGISTRY_DATABASE"):
+            self.REGISTRY_DATABASE = None
+
+        # Use the compact page registry
+        if not hasattr(self, "REGISTRY_COMPACT"):
+            self.REGISTRY_COMPACT = False
+
+        # Directory of the render cache, disabled if empty
+        if not hasattr(self, "RENDER_CACHE"):
+            self.RENDER_CACHE = None
+
+        # Callables to apply to rendered page contents before they are written
+        if not hasattr(self, "POST_RENDER_PROCESSORS"):
+            self.POST_RENDER_PROCESSORS = []
+
+        # Additional data file parsers for views, indexed on file extensions
+        if not hasattr(self, "DATAS_PARSERS"):
+            self.DATAS_PARSERS = {}
+
+        # Write gzip sidecar files for built pages and static files
+        if not hasattr(self, "GZIP_SIDECARS"):
+            self.GZIP_SIDECARS = False
+
+        # Files smaller than this size in bytes are not compressed
+        if not hasattr(self, "GZIP_MIN_SIZE"):
+            self.GZIP_MIN_SIZE = 1024
+
+        # Extensions of static files to compress
+        if not hasattr(self, "GZIP_EXTENSIONS"):
+            self.GZIP_EXTENSIONS = (
+                ".css",
+                ".js",
+                ".json",
+                ".svg",
+                ".html",
+                ".xml",
+                ".txt",
+            )
+
     def _default_babel(self):
         """
         Set default attributes for required settings around Babel
@@ -192,6 +260,7 @@ class SettingsModel(object):
         self._default_watchdog()
         self._default_jinja()
         self._default_webassets()
+        self._default_builder()
         self._default_babel()
 
     def load_from_kwargs(self, check=True, defaults=True, **kwargs):
@@ -83,5 +83,43 @@ class InvalidHostname(ServerConfigurationError):
 class DataProcessError(OptimusBaseException):
     """
     Exception to be raised from a view which attempt to parse a data file.
+
+    Keyword Arguments:
+        name (string): Path of the data file which has failed.
+    """
+    def __init__(self, *args, name=None):
+        self.name = name
+        super().__init__(*args)
+
+
+class PageBuildError(OptimusBaseException):
+    """
+    Exception to be raised when a parallel build has failed to build some pages.
+
+    Keyword Arguments:
+        failures (list): List of failure details from build workers.
+    """
+    def __init__(self, *args, failures=None):
+        self.failures = failures or []
+        super().__init__(*args)
+
+
+class BuildDaemonError(OptimusBaseException):
+    """
+    Exception to be raised when a build daemon can not be started.
     """
     pass
+
+
+class DestinationCollisionError(OptimusBaseException):
+    """
+    Exception to be raised when merged build reports have destinations built by
+    more than one build.
+
+    Keyword Arguments:
+        collisions (dict): Shards which have built a destination, indexed on
+            colliding destinations.
+    """
+    def __init__(self, *args, collisions=None):
+        self.collisions = collisions or {}
+        super().__init__(*args)
@@ -1,9 +1,16 @@
+import logging
+import time
+
 from optimus.assets.registry import register_assets
+from optimus.conf.loader import load_pages
 from optimus.pages.builder import PageBuilder
 from optimus.utils import initialize
+from optimus.utils.compress import compress_files, find_files
 
 
-def builder_interface(settings, views):
+def builder_interface(settings, views, jobs=1, incremental=False,
+                      write_if_changed=False, hooks=None, shard=None,
+                      track_dependencies=False):
     """
     Build all enabled pages from given views module.
 
@@ -11,26 +18,74 @@ def builder_interface(settings, views):
         settings (optimus.conf.model.SettingsModel): Settings object which defines
             everything required for building.
         views (object): Module which defines page views to build, in fact the module
-            object require only a ``PAGES`` attribute that is a list of Page view.
+            object require only a ``PAGES`` attribute that is a list of Page view,
+            an iterable of Page view or a callable returning one of them (see
+            ``optimus.conf.loader.load_pages``).
+
+    Keyword Arguments:
+        jobs (integer): Number of worker processes to build pages. Default to ``1``
+            for a serial build.
+        incremental (boolean): Enable incremental build to reuse pages whose inputs
+            have not changed since the previous build. Default to ``False``.
+        write_if_changed (boolean): Enable write if changed mode to leave untouched
+            the destination files whose content has not changed. Default to
+            ``False``.
+        hooks (dict): Hooks to register additionally to the ones from setting
+            ``BUILD_HOOKS``, a list of callables indexed on event names.
+        shard (tuple): Only build pages from a shard, a tuple of the shard number
+            (from ``1``) and the number of shards.
+        track_dependencies (boolean): Enable dependency tracking to register page
+            templates in builder registry while pages are rendered. Default to
+            ``False``.
 
     Returns:
         dict: A dictionnary with initialized builder (``builder`` item), asset manager
-        (``assets_env`` item) and the list of builded pages (``builded`` item).
+        (``assets_env`` item), the list of builded pages (``builded`` item) and the
+        list of written gzip sidecar files (``compressed`` item) which is empty
+        unless setting ``GZIP_SIDECARS`` is enabled.
     """
+    logger = logging.getLogger("optimus")
+
     # Initialize required structure according to settings
     initialize(settings)
 
     # Init asset manager
+    started = time.perf_counter()
     assets_env = register_assets(settings)
+    assets_time = time.perf_counter() - started
 
     # Init page builder
-    builder = PageBuilder(settings, assets_env=assets_env)
+    builder = PageBuilder(
+        settings,
+        assets_env=assets_env,
+        jobs=jobs,
+        incremental=incremental,
+        write_if_changed=write_if_changed,
+        hooks=hooks,
+        shard=shard,
+        track_dependencies=track_dependencies,
+    )
+
+    if builder.hooks:
+        builder.emit("after_assets", assets_env=assets_env, time=assets_time)
+
+    # Proceed to page building from registered pages, builder compresses them
+    builded = builder.build_bulk(load_pages(views))
 
-    # Proceed to page building from registered pages
-    builded = builder.build_bulk(views.PAGES)
+    # Optional gzip sidecars for static files
+    compressed = []
+    if settings.GZIP_SIDECARS and builded:
+        logger.info("Compressing static files")
+        compressed = builder.compressed + compress_files(
+            find_files(settings.STATIC_DIR, settings.GZIP_EXTENSIONS),
+            min_size=settings.GZIP_MIN_SIZE,
+            jobs=jobs if jobs > 1 else None,
+        )
+        logger.info("Written {} gzip sidecar files".format(len(compressed)))
 
     return {
         "assets_env": assets_env,
         "builded": builded,
         "builder": builder,
+        "compressed": compressed,
     }
@@ -0,0 +1,386 @@
+import importlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+import types
+
+from ..conf.loader import load_pages
+from ..exceptions import BuildDaemonError
+
+
+# Default socket file name in project base directory
+DEFAULT_SOCKET_NAME = ".optimus-builds.sock"
+
+
+def check_pages_module(views):
+    """
+    Check page views can be loaded again from a pages module, as required for a
+    build daemon which loads them for every full build request.
+
+    Arguments:
+        views (object): Pages module.
+
+    Raises:
+        BuildDaemonError: If ``PAGES`` is neither a callable, a list or a tuple,
+        like a generator which can only be consumed once.
+    """
+    if not callable(views.PAGES) and not isinstance(views.PAGES, (list, tuple)):
+        msg = (
+            "Build daemon requires pages module attribute 'PAGES' to be a list, a "
+            "tuple or a callable which returns pages, not: {}"
+        )
+        raise BuildDaemonError(msg.format(type(views.PAGES).__name__))
+
+
+def reload_pages_module(views):
+    """
+    Reload a pages module and its submodules so changes from page views are used.
+
+    Submodules are reloaded first, deepest ones first, so the pages module gets
+    their reloaded page views. Other modules are not reloaded.
+
+    Arguments:
+        views (object): Pages module. An object which is not a module is returned
+            unchanged.
+
+    Raises:
+        BuildDaemonError: If ``PAGES`` from reloaded module can not be loaded
+        again, see ``check_pages_module``.
+
+    Returns:
+        object: Reloaded pages module.
+    """
+    if not isinstance(views, types.ModuleType):
+        return views
+
+    prefix = views.__name__ + "."
+    submodules = [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith(prefix) and module is not None
+    ]
+
+    for module in sorted(
+        submodules, key=lambda item: item.__name__.count("."), reverse=True
+    ):
+        importlib.reload(module)
+
+    views = importlib.reload(views)
+    check_pages_module(views)
+
+    return views
+
+
+class BuildDaemon(object):
+    """
+    Process build requests with a builder kept between requests.
+
+    Arguments:
+        settings (optimus.conf.model.SettingsModel): Settings object which defines
+            everything required for building.
+        views (object): Module which defines page views to build, see
+            ``optimus.interfaces.watch.watcher_interface``.
+        build_env (dict): A dictionnary with initialized builder (``builder``
+            item) and asset manager (``assets_env`` item).
+
+    Attributes:
+        settings (optimus.conf.model.SettingsModel): As given from arguments.
+        views (object): As given from arguments.
+        builder (optimus.pages.builder.PageBuilder): Page builder from
+            ``build_env``.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, settings, views, build_env):
+        check_pages_module(views)
+
+        self.settings = settings
+        self.views = views
+        self.builder = build_env["builder"]
+        self.logger = logging.getLogger("optimus")
+
+    def scan(self, reload=False, build=False):
+        """
+        Load page views into a new builder registry.
+
+        Pages are scanned unless builder has dependency tracking enabled, they are
+        then registered once they are built. The new registry replaces the builder
+        registry only once pages have been registered, so on failure the builder
+        keeps its previous registry.
+
+        Keyword Arguments:
+            reload (boolean): Reload pages module before loading page views, see
+                ``reload_pages_module``. Default to ``False``.
+            build (boolean): Build loaded pages. Default to ``False``.
+
+        Returns:
+            tuple: List of loaded page instances and list of built page paths.
+        """
+        views = reload_pages_module(self.views) if reload else self.views
+        pages = list(load_pages(views))
+
+        previous = self.builder.registry
+        self.builder.registry = self.builder.get_registry()
+
+        built = []
+        try:
+            if not self.builder.track_dependencies:
+                self.builder.scan_bulk(pages)
+            if build and pages:
+                built = self.builder.build_bulk(pages) or []
+        except Exception:
+            self.builder.registry = previous
+            raise
+
+        self.views = views
+
+        return pages, built
+
+    def get_pages(self, templates=None, datas=None, destinations=None):
+        """
+        Get registered pages depending from given templates, datas and
+        destinations.
+
+        Keyword Arguments:
+            templates (list): Template names.
+            datas (list): Data file paths, relative to ``DATAS_DIR``.
+            destinations (list): Page destinations.
+
+        Returns:
+            tuple: List of page instances without duplicates and list of unknown
+            items.
+        """
+        registry = self.builder.registry
+        pages = {}
+        unknown = []
+
+        for name in templates or []:
+            if not registry.has_template(name):
+                unknown.append(name)
+            for page in registry.get_pages_from_template(name):
+                pages[page.get_destination()] = page
+
+        for name in datas or []:
+            # Parsed data are outdated
+            self.builder.data_loader.invalidate(
+                os.path.join(self.settings.DATAS_DIR, name)
+            )
+            if name not in registry.datas:
+                unknown.append(name)
+            for page in registry.get_pages_from_data(name):
+                pages[page.get_destination()] = page
+
+        for destination in destinations or []:
+            destination = os.path.normpath(destination)
+            page = registry.get_page(destination)
+            if page is None:
+                unknown.append(destination)
+            else:
+                pages[destination] = page
+
+        return list(pages.values()), unknown
+
+    def process(self, request):
+        """
+        Process a build request.
+
+        Request ``action`` item is either:
+
+        ``ping``
+            To check the daemon is running;
+        ``stop``
+            To stop the daemon once response has been sent;
+        ``build``
+            To build pages. If request has any of ``templates``, ``datas`` or
+            ``destinations`` items, only the pages depending from them are built,
+            else pages module is reloaded and every pages are scanned again and
+            built, see ``scan``.
+
+        Arguments:
+            request (dict): Build request.
+
+        Returns:
+            dict: Response with ``status`` item either ``ok`` or ``error``. A build
+            response also has the list of built page paths (``built`` item), the
+            list of unknown templates, datas and destinations (``unknown`` item) and
+            the build time in seconds (``time`` item). An error response has the
+            error message (``error`` item).
+        """
+        action = request.get("action", "build")
+
+        if action in ("ping", "stop"):
+            return {"status": "ok"}
+        elif action != "build":
+            return {
+                "status": "error",
+                "error": "Unknown action: {}".format(action),
+            }
+
+        started = time.perf_counter()
+        unknown = []
+
+        if any([request.get(name) for name in ("templates", "datas", "destinations")]):
+            pages, unknown = self.get_pages(
+                templates=request.get("templates"),
+                datas=request.get("datas"),
+                destinations=request.get("destinations"),
+            )
+            msg = "--- Build request for {} pages ---"
+            self.logger.warning(msg.format(len(pages)))
+
+            built = []
+            if pages:
+                built = self.builder.build_bulk(pages) or []
+        else:
+            self.logger.warning("--- Build request for every pages ---")
+            built = self.scan(reload=True, build=True)[1]
+
+        return {
+            "status": "ok",
+            "built": built,
+            "unknown": unknown,
+            "time": time.perf_counter() - started,
+        }
+
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle a build request connection.
+
+    A request is a single line of JSON and its response is written back as a single
+    line of JSON.
+    """
+
+    def handle(self):
+        logger = logging.getLogger("optimus")
+
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            response = self.server.daemon.process(request)
+        except Exception as e:
+            logger.exception("Build request has failed")
+            request = {}
+            response = {
+                "status": "error",
+                "error": "{}: {}".format(e.__class__.__name__, e),
+            }
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+        if request.get("action") == "stop":
+            logger.warning("Stopping build daemon..")
+            # Shutdown waits for the serve loop which is running this handler
+            threading.Thread(target=self.server.shutdown).start()
+
+
+class BuildServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server for build requests.
+
+    Requests are processed one after another, since the builder is not safe to
+    share between threads.
+
+    Arguments:
+        socket_path (string): Path to the Unix socket file.
+        daemon (BuildDaemon): Build daemon to process requests.
+
+    Attributes:
+        daemon (BuildDaemon): As given from arguments.
+    """
+
+    def __init__(self, socket_path, daemon):
+        self.daemon = daemon
+        super().__init__(socket_path, BuildRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def send_build_request(socket_path, request, timeout=None):
+    """
+    Send a build request to a build daemon and return its response.
+
+    Arguments:
+        socket_path (string): Path to the build daemon Unix socket file.
+        request (dict): Build request, see ``BuildDaemon.process``.
+
+    Keyword Arguments:
+        timeout (float): Timeout in seconds for the response. Default to ``None``
+            to wait until the build has finished.
+
+    Returns:
+        dict: Build response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with client.makefile("rb") as fp:
+            return json.loads(fp.readline().decode("utf-8"))
+
+
+def serve_builds_interface(settings, views, build_env, socket_path):
+    """
+    Initialize a build server on a Unix socket.
+
+    Commonly before using this function you will use ``builder_interface`` first to
+    init the builder environment as expected in ``build_env`` argument, like with
+    ``watcher_interface``. If the builder has dependency tracking enabled, pages
+    have already been registered from the first build, else they are scanned.
+    Pages module must be checked with ``check_pages_module`` before the first build
+    since a generator would be consumed by it.
+
+    Once this interface returns the server object, you may use it like so: ::
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    Arguments:
+        settings (optimus.conf.model.SettingsModel): Settings object which defines
+            everything required for building.
+        views (object): Module which defines page views to build.
+        build_env (dict): A dictionnary with initialized builder (``builder``
+            item) and asset manager (``assets_env`` item).
+        socket_path (string): Path to the Unix socket file to create.
+
+    Returns:
+        BuildServer: The initialized server.
+
+    Raises:
+        BuildDaemonError: If a daemon is already running on socket, if socket path
+        is not a socket or if pages can not be loaded again from pages module.
+    """
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            msg = "Build daemon socket path already exists and is not a socket: {}"
+            raise BuildDaemonError(msg.format(socket_path))
+
+        try:
+            send_build_request(socket_path, {"action": "ping"}, timeout=1)
+        except (OSError, ValueError):
+            # Left over from a daemon which has not been stopped properly
+            os.remove(socket_path)
+        else:
+            msg = "A build daemon is already running on socket: {}"
+            raise BuildDaemonError(msg.format(socket_path))
+
+    daemon = BuildDaemon(settings, views, build_env)
+    # Pages have already been registered from the first build
+    if not daemon.builder.track_dependencies:
+        daemon.scan()
+
+    return BuildServer(socket_path, daemon)
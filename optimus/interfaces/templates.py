@@ -0,0 +1,46 @@
+import logging
+
+from optimus.assets.registry import register_assets
+from optimus.pages.builder import PageBuilder
+
+
+def compile_templates_interface(settings, target, zip_method="deflated"):
+    """
+    Compile every template from templates directory.
+
+    Templates are compiled with the same Jinja environment than the one used to build
+    pages, so they can be loaded from the setting ``JINJA_PRECOMPILED``.
+
+    Raises:
+        jinja2.exceptions.TemplateSyntaxError: If a template has a syntax error.
+
+    Arguments:
+        settings (optimus.conf.model.SettingsModel): Settings object which defines
+            everything required for building.
+        target (string): Path where to write compiled templates, either a zip file
+            or a directory.
+
+    Keyword Arguments:
+        zip_method (string): Zip compression method, either ``deflated`` or
+            ``stored``. If empty, templates are compiled as Python modules in
+            a directory. Default to ``deflated``.
+
+    Returns:
+        string: Path where templates have been compiled.
+    """
+    logger = logging.getLogger("optimus")
+
+    # Webassets extension is required to compile templates using assets tags
+    assets_env = register_assets(settings)
+    builder = PageBuilder(settings, assets_env=assets_env)
+
+    logger.info("Compiling templates to: {}".format(target))
+
+    builder.jinja_env.compile_templates(
+        target,
+        zip=zip_method or None,
+        log_function=logger.debug,
+        ignore_errors=False,
+    )
+
+    return target
@@ -1,5 +1,6 @@
 from watchdog.observers import Observer
 
+from ..conf.loader import load_pages
 from ..watchers.assets import AssetsWatchEventHandler
 from ..watchers.datas import DatasWatchEventHandler
 from ..watchers.templates import TemplatesWatchEventHandler
@@ -12,7 +13,9 @@ def watcher_interface(settings, views, build_env):
 
     Commonly before using this function you will use ``builder_interface`` first since
     it will perform a first (required) build and init the builder environment as
-    expected in ``build_env`` argument.
+    expected in ``build_env`` argument. If the builder has dependency tracking
+    enabled, pages have already been registered from the first build, else they are
+    scanned.
 
     Once this interface returns the observer object, you may use it like so: ::
 
@@ -28,7 +31,11 @@ def watcher_interface(settings, views, build_env):
         settings (optimus.conf.model.SettingsModel): Settings object which defines
             everything required for building.
         views (object): Module which defines page views to build, in fact the module
-            object require only a ``PAGES`` attribute that is a list of Page view.
+            object require only a ``PAGES`` attribute that is a list of Page view,
+            an iterable of Page view or a callable returning one of them (see
+            ``optimus.conf.loader.load_pages``). Since an iterable like a generator
+            can only be consumed once and it has already been consumed by the first
+            build, a callable should be used instead.
         build_env (dict): A dictionnary with initialized builder (``builder`` item),
             asset manager (``assets_env`` item) and the list of builded pages
             (``builded`` item).
@@ -37,8 +44,9 @@ def watcher_interface(settings, views, build_env):
         watchdog.observers.Observer: The initialized and configured observer for
         setted watchers.
     """
-    # Perform a first scanning of page views
-    build_env["builder"].scan_bulk(views.PAGES)
+    # Perform a first scanning of page views if not already registered from build
+    if not build_env["builder"].track_dependencies:
+        build_env["builder"].scan_bulk(load_pages(views))
 
     # Bind watcher events for view templates
     templates_event_handler = TemplatesWatchEventHandler(
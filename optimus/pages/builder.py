@@ -1,9 +1,18 @@
+import gettext
+import hashlib
 import logging
 import io
+import math
+import multiprocessing
 import os
-
-from jinja2 import Environment as Jinja2Environment
-from jinja2 import FileSystemLoader
+import time
+import traceback
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from jinja2 import __version__ as jinja2_version
+from jinja2 import FileSystemBytecodeCache, FileSystemLoader
 from webassets.ext.jinja2 import AssetsExtension
 
 # Optional babel import
@@ -13,8 +22,147 @@ except ImportError:
     babel_support = None
 
 from optimus import __version__
-from optimus.pages.registry import PageRegistry
-from optimus.exceptions import ViewImproperlyConfigured
+from optimus.assets.registry import register_assets
+from optimus.pages.datas import DataLoader
+from optimus.pages.introspection import IntrospectionCache
+from optimus.pages.loaders import PrecompiledLoader
+from optimus.pages.manifest import BuildManifest, get_file_digest, get_fingerprint
+from optimus.pages.registry import CompactPageRegistry, PageRegistry
+from optimus.pages.registrydb import RegistryDatabase
+from optimus.pages.rendercache import RenderCache
+from optimus.pages.tracking import TrackingEnvironment
+from optimus.pages.reports import get_slowest_pages
+from optimus.utils.compress import compress_files
+from optimus.exceptions import (
+    InvalidSettings,
+    PageBuildError,
+    ViewImproperlyConfigured,
+)
+
+
+# Buffer size for streamed page writes
+STREAM_BUFFER_SIZE = 65536
+
+# Available durability modes for page writes
+DURABILITY_MODES = (None, "file", "directory")
+
+# Available build lifecycle events for hooks
+HOOK_EVENTS = (
+    "before_scan",
+    "after_scan",
+    "before_render",
+    "after_render",
+    "after_write",
+    "after_assets",
+)
+
+# Worker state for parallel builds, inherited from parent process through fork
+_worker_builder = None
+_worker_pages = None
+
+
+def _init_build_worker(builder, page_list):
+    """
+    Initialize a build worker process with its own builder.
+
+    This is executed once in each worker process. Since workers are forked, given
+    arguments are inherited from the parent process and never pickled.
+
+    Arguments:
+        builder (PageBuilder): Parent builder to get options from.
+        page_list (list): List of page instances shared with every worker.
+    """
+    global _worker_builder, _worker_pages
+
+    _worker_builder = builder.get_worker_builder()
+    _worker_pages = page_list
+
+
+def get_destination_shard(destination, count):
+    """
+    Get the shard of a page destination.
+
+    Shard is computed from a hash of the destination, so a destination is always
+    in the same shard whatever the page list or the machine are.
+
+    Arguments:
+        destination (string): Page destination.
+        count (integer): Number of shards.
+
+    Returns:
+        integer: Shard number, from ``1`` to ``count``.
+    """
+    digest = hashlib.sha1(destination.encode("utf-8")).hexdigest()
+
+    return int(digest, 16) % count + 1
+
+
+def _timed_chunks(chunks, timing):
+    """
+    Iterate over content chunks and add the time spent to produce them and their
+    length to the render time and the content length of given page timing.
+
+    Arguments:
+        chunks (iterable): Content chunks.
+        timing (dict): Page timing to update.
+
+    Yields:
+        string: Content chunk.
+    """
+    iterator = iter(chunks)
+
+    while True:
+        started = time.perf_counter()
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            timing["render"] += time.perf_counter() - started
+            return
+        timing["render"] += time.perf_counter() - started
+        timing["length"] += len(chunk)
+
+        yield chunk
+
+
+def _build_partition(indexes):
+    """
+    Build a partition of pages from a build worker.
+
+    The partition build stops on the first failure, the failure is returned
+    instead of raised since exception and traceback objects are not safe to send
+    back to the parent process.
+
+    Arguments:
+        indexes (list): Index positions of pages to build from worker page list.
+
+    Returns:
+        dict: Worker process id (``pid`` item), list of built pages as tuples of
+        index position and destination path (``builded`` item), possible
+        failure (``failure`` item) which is either ``None`` or a dictionnary and
+        the worker builder state to merge (``state`` item).
+    """
+    builded = []
+    failure = None
+
+    for index in indexes:
+        page = _worker_pages[index]
+        try:
+            builded.append((index, _worker_builder.build_item(page)))
+        except Exception as e:
+            failure = {
+                "index": index,
+                "page": repr(page),
+                "error": "{}: {}".format(e.__class__.__name__, e),
+                "traceback": traceback.format_exc(),
+            }
+            break
+
+    return {
+        "pid": os.getpid(),
+        "builded": builded,
+        "failure": failure,
+        "state": _worker_builder.export_state(),
+    }
 
 
 class PageBuilder(object):
@@ -30,6 +178,26 @@ class PageBuilder(object):
         assets_env (webassets.Environment): Webasset environment. Default is
             ``None``.
         dry_run (boolean): Enable dry run mode. Default is ``False``.
+        jobs (integer): Number of worker processes to build pages. Default is
+            ``1`` to build pages serially in the current process.
+        incremental (boolean): Enable incremental build mode, pages whose
+            inputs have not changed since the previous build are not built
+            again. Default is ``False``.
+        write_if_changed (boolean): Enable write if changed mode, destination
+            files are left untouched when their content is identical to the
+            rendered content. Default is ``False``.
+        hooks (dict): Hooks to register additionally to the ones from setting
+            ``BUILD_HOOKS``, a list of callables indexed on event names. Default is
+            ``None``.
+        shard (tuple): Only build pages from a shard, a tuple of the shard number
+            (from ``1``) and the number of shards. Default is ``None`` to build
+            every pages.
+        track_dependencies (boolean): Enable dependency tracking, the templates
+            loaded while a page is rendered are registered in registry, so pages
+            do not have to be scanned. Pages which are not rendered are scanned.
+            Dependencies are only tracked with a Jinja environment from
+            ``optimus.pages.tracking.TrackingEnvironment``, which is the default
+            one, else pages are scanned. Default is ``False``.
 
     Attributes:
         logger (logging.Logger): Optimus logger.
@@ -43,29 +211,192 @@ class PageBuilder(object):
             enable the i18n extension.
         translations (dict): Dictionnary of translation catalog indexed on
             language identifier.
+        installed_language (string): Language identifier of translations
+            currently installed in Jinja environment.
         registry (optimus.pages.registry.PageRegistry): Registry of all knowed
             page from scanning. Registry will be automatically filled only if you use
-            the  ``PageBuilder.scan_bulk(..)`` method.
+            the  ``PageBuilder.scan_bulk(..)`` method. It is a
+            ``CompactPageRegistry`` if setting ``REGISTRY_COMPACT`` is enabled.
         dry_run (boolean): Dry run mode.
+        jobs (integer): Number of worker processes to build pages.
+        incremental (boolean): Incremental build mode.
+        manifest (optimus.pages.manifest.BuildManifest): Manifest of page
+            fingerprints from previous builds, only set in incremental build
+            mode, else it is ``None``.
+        write_if_changed (boolean): Write if changed mode.
+        summary (collections.Counter): Counters of built pages (``built`` item),
+            reused pages (``reused`` item), avoided writes (``unchanged`` item) and
+            pages restored from render cache (``restored`` item) from the last
+            build.
+        timings (list): Timings of built pages from the last build, see
+            ``optimus.pages.reports`` for details.
+        hooks (dict): Registered hooks, a list of callables indexed on event names.
+            Only events with at least one hook are present.
+        known_dirs (set): Destination directories which have been created before
+            page builds from ``PageBuilder.build_bulk``, their existence is not
+            checked again for each page. It is only filled during bulk build.
+        durability (string): Durability mode for page writes from setting
+            ``BUILD_DURABILITY``.
+        written_files (set): Page files which have been written, to synchronize
+            at the end of bulk build with ``directory`` durability.
+        written_dirs (set): Directories where pages have been written, to
+            synchronize at the end of bulk build with ``directory`` durability.
+        compressed (list): Gzip sidecar files written for built pages from the
+            last build, only when setting ``GZIP_SIDECARS`` is enabled.
+        shard (tuple): Shard number and number of shards to build, ``None`` to
+            build every pages.
+        track_dependencies (boolean): Dependency tracking mode.
+        tracked (dict): Templates and template references tracked from the
+            current bulk build, indexed on page destinations. It is used to
+            register pages built from worker processes.
+        processors (list): Post render processors from setting
+            ``POST_RENDER_PROCESSORS``.
+        processed (dict): Cache of processed contents, a tuple of rendered content
+            digest and processed content digest indexed on page destinations, so
+            contents are not kept in memory. It is kept
+            between builds.
+        data_loader (optimus.pages.datas.DataLoader): Data loader shared by every
+            page, data files are resolved from setting ``DATAS_DIR`` and parsers
+            from setting ``DATAS_PARSERS`` are registered. It is kept between
+            builds.
+        render_cache (optimus.pages.rendercache.RenderCache): Cache of rendered
+            pages from setting ``RENDER_CACHE``, ``None`` if it is disabled.
+        introspection (optimus.pages.introspection.IntrospectionCache): Cache of
+            templates directly referenced by templates, used from page
+            introspection. It is attached to Jinja environment as
+            ``optimus_introspection`` attribute and persisted to the file from
+            setting ``JINJA_INTROSPECTION_CACHE`` if any.
+        registry_database (optimus.pages.registrydb.RegistryDatabase): Database
+            where registry is persisted from setting ``REGISTRY_DATABASE``, pages
+            with a valid saved entry are registered without to be scanned. It is
+            ``None`` if it is disabled.
 
     """
 
-    def __init__(self, settings, jinja_env=None, assets_env=None, dry_run=False):
+    def __init__(self, settings, jinja_env=None, assets_env=None, dry_run=False,
+                 jobs=1, incremental=False, write_if_changed=False, hooks=None,
+                 shard=None, track_dependencies=False):
         self.logger = logging.getLogger("optimus")
 
         self.settings = settings
 
+        self.hooks = {}
+        for hooks_map in (getattr(self.settings, "BUILD_HOOKS", {}), hooks or {}):
+            for event, callbacks in hooks_map.items():
+                for callback in callbacks:
+                    self.add_hook(event, callback)
+
         self.assets_env = assets_env
 
         self.internationalized = False
         self.translations = {}
+        self.installed_language = None
 
+        # Remember if environment has been given so workers can reuse it
+        self.custom_jinja_env = jinja_env is not None
         self.jinja_env = jinja_env or self.get_environnement(assets_env)
         self.jinja_env.globals.update(self.get_globals())
+
+        # Template introspection cache shared by views through Jinja environment
+        self.introspection = IntrospectionCache(
+            path=getattr(self.settings, "JINJA_INTROSPECTION_CACHE", None)
+        )
+        self.introspection.load()
+        self.jinja_env.optimus_introspection = self.introspection
+
         self.logger.debug("PageBuilder initialized")
 
-        self.registry = PageRegistry()
+        self.registry = self.get_registry()
+        self.registry_database = None
+        if getattr(self.settings, "REGISTRY_DATABASE", None):
+            self.registry_database = RegistryDatabase(self.settings.REGISTRY_DATABASE)
+            self.registry_database.load()
         self.dry_run = dry_run
+        self.jobs = jobs
+        self.write_if_changed = write_if_changed
+
+        self.incremental = incremental
+        self.manifest = None
+        if self.incremental:
+            self.manifest = BuildManifest(self.settings.BUILD_MANIFEST)
+            self.manifest.load()
+
+        self.durability = getattr(self.settings, "BUILD_DURABILITY", None)
+        if self.durability not in DURABILITY_MODES:
+            msg = "Invalid build durability '{}', available values are: {}"
+            raise InvalidSettings(msg.format(
+                self.durability,
+                ", ".join([str(item) for item in DURABILITY_MODES]),
+            ))
+        self.written_files = set()
+        self.written_dirs = set()
+
+        self.shard = shard
+
+        self.track_dependencies = track_dependencies
+        self.tracked = {}
+
+        self.processors = list(getattr(self.settings, "POST_RENDER_PROCESSORS", []))
+        self.processed = {}
+
+        self.data_loader = DataLoader(
+            basedir=getattr(self.settings, "DATAS_DIR", None),
+            parsers=getattr(self.settings, "DATAS_PARSERS", {}),
+        )
+
+        self.render_cache = None
+        if getattr(self.settings, "RENDER_CACHE", None):
+            self.render_cache = RenderCache(self.settings.RENDER_CACHE)
+
+        self.summary = Counter()
+        self.timings = []
+        self.compressed = []
+        self.known_dirs = set()
+        self._build_fingerprint = {}
+        self._digests = {}
+
+    def get_registry(self):
+        """
+        Get a new empty page registry.
+
+        Returns:
+            optimus.pages.registry.PageRegistry: Page registry, it is a
+            ``CompactPageRegistry`` if setting ``REGISTRY_COMPACT`` is enabled.
+        """
+        if getattr(self.settings, "REGISTRY_COMPACT", False):
+            return CompactPageRegistry()
+
+        return PageRegistry()
+
+    def add_hook(self, event, callback):
+        """
+        Register a hook for a build lifecycle event.
+
+        Arguments:
+            event (string): Event name, one of ``HOOK_EVENTS``.
+            callback (callable): Hook to call on event. It receives the builder as
+                positional argument and the event payload as keyword arguments.
+        """
+        if event not in HOOK_EVENTS:
+            msg = "Unknown build hook event '{}', available events are: {}"
+            raise InvalidSettings(msg.format(event, ", ".join(HOOK_EVENTS)))
+
+        self.hooks.setdefault(event, []).append(callback)
+
+    def emit(self, event, **payload):
+        """
+        Call every hooks registered for an event.
+
+        Event name is always given to hooks in payload as ``event`` item. Since
+        payload building has a cost, callers should only emit an event if
+        ``PageBuilder.hooks`` is not empty.
+
+        Arguments:
+            event (string): Event name.
+            **payload: Event payload to give to hooks.
+        """
+        for callback in self.hooks.get(event, []):
+            callback(self, event=event, **payload)
 
     def get_environnement(self, assets_env=None):
         """
@@ -102,9 +433,28 @@ class PageBuilder(object):
             self.internationalized = True
             self.logger.debug("'i18n' enabled")
 
+        # Optional persistent cache for compiled templates
+        bytecode_cache = None
+        if self.settings.JINJA_BYTECODE_CACHE:
+            cache_dir = self.get_bytecode_cache_dir()
+            self.logger.debug("Jinja bytecode cache: {}".format(cache_dir))
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+        # Load precompiled templates if enabled, else from their sources
+        if self.settings.JINJA_PRECOMPILED:
+            msg = "Loading precompiled templates from: {}"
+            self.logger.debug(msg.format(self.settings.JINJA_PRECOMPILED))
+            loader = PrecompiledLoader(
+                self.settings.JINJA_PRECOMPILED, self.settings.TEMPLATES_DIR
+            )
+        else:
+            loader = FileSystemLoader(self.settings.TEMPLATES_DIR)
+
         # Boot Jinja environment
-        env = Jinja2Environment(
-            loader=FileSystemLoader(self.settings.TEMPLATES_DIR), extensions=exts
+        env = TrackingEnvironment(
+            loader=loader,
+            extensions=exts,
+            bytecode_cache=bytecode_cache,
         )
 
         # Enable Jinja filters
@@ -116,6 +466,25 @@ class PageBuilder(object):
 
         return env
 
+    def get_bytecode_cache_dir(self):
+        """
+        Get directory for Jinja bytecode cache and create it if needed.
+
+        Directory is a subdirectory of setting ``JINJA_BYTECODE_CACHE`` named from
+        Optimus and Jinja versions, so compiled templates from other versions are
+        never used.
+
+        Returns:
+            string: Path to the cache directory.
+        """
+        cache_dir = os.path.join(
+            self.settings.JINJA_BYTECODE_CACHE,
+            "optimus-{}_jinja-{}".format(__version__, jinja2_version),
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+
+        return cache_dir
+
     def serialize_settings(self):
         """
         Get and return valid settings variables.
@@ -133,6 +502,30 @@ class PageBuilder(object):
 
         return items
 
+    def get_portable_settings(self):
+        """
+        Get valid settings variables with paths from project directory made
+        relative to it.
+
+        Returns:
+            dict: Settings variables which do not depend on the project location.
+        """
+        project_dir = os.path.abspath(self.settings.PROJECT_DIR)
+
+        def portable(value):
+            if isinstance(value, str) and (
+                value == project_dir or value.startswith(project_dir + os.sep)
+            ):
+                return os.path.relpath(value, project_dir)
+            elif isinstance(value, (list, tuple)):
+                return [portable(item) for item in value]
+            elif isinstance(value, dict):
+                return {key: portable(item) for key, item in value.items()}
+
+            return value
+
+        return portable(self.serialize_settings())
+
     def get_globals(self):
         """
         Get global context variables.
@@ -164,7 +557,8 @@ class PageBuilder(object):
         it in Jinja2.
 
         It does not reload a language translations if a previous page has
-        allready loaded it.
+        allready loaded it and does not install it again if it is already the
+        installed one.
 
         Arguments:
             page_item (optimus.pages.views.PageViewBase): Page instance which
@@ -189,36 +583,196 @@ class PageBuilder(object):
                 self.settings.LOCALES_DIR, lang.code, "messages"
             )
 
-        # Install it in the Jinja env
-        self.jinja_env.install_gettext_translations(
-            self.translations[lang.code], newstyle=False
-        )
+        # Install it in the Jinja env if not already done
+        if self.installed_language != lang.code:
+            self.jinja_env.install_gettext_translations(
+                self.translations[lang.code], newstyle=False
+            )
+            self.installed_language = lang.code
 
         return self.translations[lang.code]
 
-    def scan_item(self, page_item):
+    def get_digest(self, kind, name):
         """
-        Scan given page to retrieve template dependancies.
+        Get digest of a template or a file.
 
-        Possibly connect settings to page instance if not allready done.
+        Digests are cached until the next bulk build, so shared templates and files
+        are only read once.
+
+        Arguments:
+            kind (string): Either ``template`` for a template name to get from
+                Jinja loader or ``file`` for a file path.
+            name (string): Template name or file path.
+
+        Returns:
+            string: Digest or ``None`` if file does not exist.
+        """
+        key = (kind, name)
+
+        if key not in self._digests:
+            if kind == "template":
+                source = self.jinja_env.loader.get_source(self.jinja_env, name)[0]
+                self._digests[key] = get_fingerprint(source)
+            else:
+                self._digests[key] = get_file_digest(name)
+
+        return self._digests[key]
+
+    def get_build_fingerprint(self, portable=False):
+        """
+        Get fingerprint for inputs common to all pages.
+
+        It involves Optimus version, settings and asset bundle urls.
+
+        Keyword Arguments:
+            portable (boolean): If enabled, paths from project directory in
+                settings are made relative so the fingerprint does not depend on
+                the project location. Default is ``False``.
+
+        Returns:
+            string: Fingerprint.
+        """
+        if portable not in self._build_fingerprint:
+            bundles = []
+            if self.assets_env is not None:
+                bundles = [bundle.urls() for bundle in self.assets_env]
+
+            self._build_fingerprint[portable] = get_fingerprint(
+                __version__,
+                self.get_portable_settings() if portable else self.serialize_settings(),
+                bundles,
+            )
+
+        return self._build_fingerprint[portable]
+
+    def get_page_fingerprint(self, page_item, portable=False):
+        """
+        Get fingerprint for all inputs of a page.
+
+        It involves common build fingerprint, page templates, page datas, page
+        context and translation catalog for page language.
+
+        A page using a template which references templates from a variable has no
+        fingerprint since its templates can not be all known without to render it.
 
         Arguments:
             page_item (optimus.pages.views.PageViewBase): Page instance.
 
+        Keyword Arguments:
+            portable (boolean): If enabled, the fingerprint does not depend on the
+                project location, see ``get_build_fingerprint()``. Default is
+                ``False``.
+
         Returns:
-            string: All used templates from given page.
+            string: Fingerprint, ``None`` if page has no fingerprint.
+        """
+        if page_item.get_dynamic_templates(self.jinja_env):
+            return None
+
+        templates = [
+            (name, self.get_digest("template", name))
+            for name in page_item.introspect(self.jinja_env)
+        ]
+
+        datas = [
+            (name, self.get_digest("file", os.path.join(self.settings.DATAS_DIR, name)))
+            for name in page_item.get_datas()
+        ]
+
+        catalog = None
+        if self.internationalized:
+            catalog = gettext.find(
+                "messages", self.settings.LOCALES_DIR, [page_item.get_lang().code]
+            )
+            if catalog:
+                catalog = self.get_digest("file", catalog)
+
+        return get_fingerprint(
+            self.get_build_fingerprint(portable=portable),
+            "{}.{}".format(
+                page_item.__class__.__module__, page_item.__class__.__qualname__
+            ),
+            page_item.get_destination(),
+            templates,
+            datas,
+            dict(page_item.get_context()),
+            catalog,
+        )
+
+    def connect_page(self, page_item):
+        """
+        Connect stored settings to page if not allready set and connect the
+        builder data loader to page.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
         """
-        # Connect stored settings to page if not allready set
         try:
             page_item.settings
         except ViewImproperlyConfigured:
             page_item.settings = self.settings
 
+        page_item.data_loader = self.data_loader
+
+    def scan_item(self, page_item):
+        """
+        Scan given page to retrieve template dependancies.
+
+        Possibly connect settings to page instance if not allready done.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
+
+        Returns:
+            string: All used templates from given page.
+        """
+        self.connect_page(page_item)
+
         msg = " Scanning page: {}"
         self.logger.info(msg.format(page_item.get_destination()))
 
         return page_item.introspect(self.jinja_env)
 
+    def register_page(self, page_item, templates=None, references=None):
+        """
+        Register page templates and datas in registry.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
+
+        Keyword Arguments:
+            templates (list): Page templates, the first one is the page template.
+                Default to ``None`` to get them from the registry database entry if
+                it is still valid, else to scan page.
+            references (dict): Names of templates directly referenced, indexed on
+                template names. Only used with ``templates`` argument.
+
+        Returns:
+            list: Registered page templates.
+        """
+        saved = None
+        if templates is None and self.registry_database is not None:
+            self.connect_page(page_item)
+            saved = self.registry_database.get_page(page_item)
+
+        if saved is not None:
+            templates, references = saved
+        elif templates is None:
+            # Scan possible view template to find templates inheritances
+            templates = self.scan_item(page_item)
+            references = page_item.get_template_references(self.jinja_env)
+
+        if self.registry_database is not None:
+            self.registry_database.add_page(page_item, scanned=saved is None)
+
+        if templates:
+            self.registry.add_page(page_item, templates, references=references)
+
+        # Possible view datas to register
+        self.registry.add_data(page_item, page_item.get_datas())
+
+        return templates
+
     def scan_bulk(self, page_list):
         """
         Scan all given pages to register their dependancy templates.
@@ -241,21 +795,369 @@ class PageBuilder(object):
             ))
             return None
 
+        if self.hooks:
+            self.emit("before_scan", pages=page_list)
+        started = time.perf_counter()
+
+        # Templates may have changed since a previous scan
+        self.introspection.reset()
+
         knowed = set([])
         for page in page_list:
-            # Scan possible view template to find templates inheritances to register
-            found = self.scan_item(page)
-            if found:
-                self.registry.add_page(page, found)
-                knowed.update(found)
-
-            # Scan possible view datas to register
-            self.registry.add_data(page, page.get_datas())
+            knowed.update(self.register_page(page))
             if getattr(page, "template_name", None):
                 knowed.add(page.template_name)
 
+        self.introspection.save()
+        if self.registry_database is not None:
+            self.registry_database.save(self.registry, self.jinja_env)
+
+        if self.hooks:
+            self.emit(
+                "after_scan",
+                pages=page_list,
+                templates=knowed,
+                time=time.perf_counter() - started,
+            )
+
         return knowed
 
+    def is_unchanged(self, destination_path, size, digest):
+        """
+        Check if a destination file content is identical to a content from its
+        size and digest.
+
+        File sizes are compared first so the file is not read when sizes differ,
+        else the file digest is compared to the content digest.
+
+        Arguments:
+            destination_path (string): Destination file path.
+            size (integer): Content size in bytes.
+            digest (string): Content SHA256 hexadecimal digest.
+
+        Returns:
+            boolean: ``True`` if destination file exists and its content is
+            identical.
+        """
+        try:
+            destination_size = os.stat(destination_path).st_size
+        except FileNotFoundError:
+            return False
+
+        if destination_size != size:
+            return False
+
+        return get_file_digest(destination_path) == digest
+
+    def get_temporary_path(self, destination_path):
+        """
+        Get a unique temporary file path for a destination.
+
+        Temporary file is in the same directory than the destination so it can be
+        renamed to the destination.
+
+        Arguments:
+            destination_path (string): Destination file path.
+
+        Returns:
+            string: Temporary file path.
+        """
+        destination_dir, destination_file = os.path.split(destination_path)
+
+        return os.path.join(
+            destination_dir,
+            ".{}.{}.tmp".format(destination_file, uuid.uuid4().hex),
+        )
+
+    def sync_file(self, fp):
+        """
+        Flush a file content to disk if durability is set to ``file``.
+
+        Arguments:
+            fp (io.BufferedWriter): Opened file object.
+        """
+        if self.durability == "file":
+            fp.flush()
+            os.fsync(fp.fileno())
+
+    def replace_file(self, temp_path, destination_path):
+        """
+        Atomically replace destination file with a written temporary file.
+
+        If durability is set to ``directory``, destination file and its directory
+        are remembered to be synchronized at the end of bulk build.
+
+        Arguments:
+            temp_path (string): Temporary file path.
+            destination_path (string): Destination file path.
+        """
+        os.replace(temp_path, destination_path)
+
+        if self.durability == "directory":
+            self.written_files.add(destination_path)
+            self.written_dirs.add(os.path.dirname(destination_path))
+
+    def sync_directories(self):
+        """
+        Flush written page files to disk then synchronize directories where pages
+        have been written.
+
+        This is only done once at the end of bulk build if durability is set to
+        ``directory``. Only the written pages are synchronized, not the whole
+        filesystem.
+        """
+        if self.durability != "directory" or not self.written_dirs:
+            return
+
+        self.logger.debug("Synchronizing written files to disk")
+
+        # Files first so directory entries never point to unsynchronized contents
+        for path in sorted(self.written_files) + sorted(self.written_dirs):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                # Some platforms can not open directories and a file may have been
+                # removed since it has been written
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        self.written_files = set()
+        self.written_dirs = set()
+
+    def write_page(self, destination_path, content):
+        """
+        Write page content to its destination file, encoded in UTF-8.
+
+        Content is written to a temporary file which then replaces the destination
+        file, so the destination file is never left truncated.
+
+        With write if changed mode enabled, an identical destination file is left
+        untouched so its modification time does not change.
+
+        Arguments:
+            destination_path (string): Destination file path.
+            content (string): Page content to write.
+
+        Returns:
+            tuple: A boolean ``True`` if file has been written or ``False`` if it
+            has been left untouched, and the content size in bytes.
+        """
+        data = content.encode("utf-8")
+
+        if self.write_if_changed and self.is_unchanged(
+            destination_path, len(data), hashlib.sha256(data).hexdigest()
+        ):
+            self.logger.debug(" - Unchanged: {}".format(destination_path))
+            self.summary["unchanged"] += 1
+            return False, len(data)
+
+        temp_path = self.get_temporary_path(destination_path)
+
+        try:
+            with io.open(temp_path, "xb") as fp:
+                fp.write(data)
+                self.sync_file(fp)
+        except BaseException:
+            # Temporary file may not have been created
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.logger.debug(" - Writing to: {}".format(destination_path))
+        self.replace_file(temp_path, destination_path)
+
+        return True, len(data)
+
+    def write_page_stream(self, destination_path, chunks):
+        """
+        Write page content chunks to its destination file, encoded in UTF-8.
+
+        Chunks are written through a buffer as they come, so the full content is
+        never held in memory. They are written to a temporary file which then
+        replaces the destination file, so the destination file is never left
+        truncated.
+
+        With write if changed mode enabled, the temporary file replaces the
+        destination file only if their contents differ.
+
+        Arguments:
+            destination_path (string): Destination file path.
+            chunks (iterable): Page content chunks as strings.
+
+        Returns:
+            tuple: A boolean ``True`` if file has been written or ``False`` if it
+            has been left untouched, and the content size in bytes.
+        """
+        temp_path = self.get_temporary_path(destination_path)
+
+        size = 0
+        digest = hashlib.sha256() if self.write_if_changed else None
+        try:
+            with io.open(temp_path, "xb", buffering=STREAM_BUFFER_SIZE) as fp:
+                for chunk in chunks:
+                    data = chunk.encode("utf-8")
+                    size += fp.write(data)
+                    if digest is not None:
+                        digest.update(data)
+                self.sync_file(fp)
+        except BaseException:
+            # Temporary file may not have been created
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if digest is not None and self.is_unchanged(
+            destination_path, size, digest.hexdigest()
+        ):
+            self.logger.debug(" - Unchanged: {}".format(destination_path))
+            self.summary["unchanged"] += 1
+            os.remove(temp_path)
+            return False, size
+
+        self.logger.debug(" - Streaming to: {}".format(destination_path))
+        self.replace_file(temp_path, destination_path)
+
+        return True, size
+
+    def create_directory(self, path):
+        """
+        Create a destination directory with its parents if it does not exist yet.
+
+        In dry run mode, directory is not created.
+
+        Arguments:
+            path (string): Directory path.
+
+        Returns:
+            boolean: ``True`` if directory did not exist, else ``False``.
+        """
+        if os.path.exists(path):
+            return False
+
+        msg = " - Creating new directory : {}"
+        self.logger.debug(msg.format(path))
+        if not self.dry_run:
+            os.makedirs(path, exist_ok=True)
+
+        return True
+
+    def prepare_directories(self, page_list):
+        """
+        Create the destination directory tree for all given pages at once.
+
+        Created directories are stored in ``PageBuilder.known_dirs`` so page
+        builds do not have to check them again. In dry run mode, the directory
+        tree is not created but only reported to logger.
+
+        Arguments:
+            page_list (list): List of page instances.
+
+        Returns:
+            list: Sorted destination directory paths.
+        """
+        directories = set()
+        for page in page_list:
+            self.connect_page(page)
+            directories.add(
+                os.path.dirname(
+                    os.path.join(self.settings.PUBLISH_DIR, page.get_destination())
+                )
+            )
+        directories = sorted(directories)
+
+        if self.dry_run:
+            self.logger.info("Planned directory tree:")
+
+        for path in directories:
+            created = self.create_directory(path)
+            if self.dry_run:
+                msg = " - {} (new)" if created else " - {}"
+                self.logger.info(msg.format(path))
+
+        self.known_dirs = set(directories)
+
+        return directories
+
+    def process_content(self, page_item, destination, content):
+        """
+        Apply post render processors to a page content.
+
+        Processed content digest is cached on page destination with the rendered
+        content digest. An unchanged rendered content is not processed again if the
+        destination file still has the processed content, it is then read from
+        this file.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
+            destination (string): Page destination.
+            content (string): Rendered page content.
+
+        Returns:
+            string: Processed page content.
+        """
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        cached = self.processed.get(destination)
+        if cached is not None and cached[0] == digest:
+            try:
+                with io.open(
+                    os.path.join(self.settings.PUBLISH_DIR, destination), "rb"
+                ) as fp:
+                    written = fp.read()
+            except OSError:
+                written = None
+
+            if (
+                written is not None and
+                hashlib.sha256(written).hexdigest() == cached[1]
+            ):
+                self.logger.debug(" - Reusing processed content")
+                return written.decode("utf-8")
+
+        for processor in self.processors:
+            content = processor(content, page_item)
+
+        self.processed[destination] = (
+            digest,
+            hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        )
+
+        return content
+
+    def get_page_timing(self, page_item, destination):
+        """
+        Get a new empty timing for given page.
+
+        See ``optimus.pages.reports`` for timing details.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
+            destination (string): Page destination.
+
+        Returns:
+            dict: Page timing.
+        """
+        template = None
+        if hasattr(page_item, "get_template_name"):
+            template = page_item.get_template_name()
+
+        return {
+            "destination": destination,
+            "view": "{}.{}".format(
+                page_item.__class__.__module__, page_item.__class__.__qualname__
+            ),
+            "template": template,
+            "context": 0.0,
+            "render": 0.0,
+            "write": 0.0,
+            "total": 0.0,
+            "length": 0,
+            "size": 0,
+        }
+
     def build_item(self, page_item):
         """
         Build given page.
@@ -268,52 +1170,550 @@ class PageBuilder(object):
         Returns:
             string: Destination path from builded page.
         """
-        # Connect stored settings to page if not allready set
-        try:
-            page_item.settings
-        except ViewImproperlyConfigured:
-            page_item.settings = self.settings
+        self.connect_page(page_item)
+
+        destination = page_item.get_destination()
+        destination_path = os.path.join(self.settings.PUBLISH_DIR, destination)
+
+        # Reuse page from previous build if its inputs have not changed
+        if self.manifest is not None:
+            fingerprint = self.get_page_fingerprint(page_item)
+            if (
+                fingerprint is not None and
+                self.manifest.get(destination) == fingerprint and
+                os.path.exists(destination_path)
+            ):
+                self.logger.info(" Reusing page: {}".format(destination))
+                self.summary["reused"] += 1
+                if self.track_dependencies:
+                    self.register_page(page_item)
+                return destination_path
+
+        # Restore page from render cache if its inputs have already been rendered,
+        # pages without fingerprint bypass the cache
+        cache_key = None
+        if self.render_cache is not None and not self.dry_run:
+            cache_key = self.get_page_fingerprint(page_item, portable=True)
+            cached = None
+            if cache_key is not None:
+                cached = self.render_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(" Restoring page: {}".format(destination))
+                destination_dir = os.path.dirname(destination_path)
+                if destination_dir not in self.known_dirs:
+                    self.create_directory(destination_dir)
+                self.write_page(destination_path, cached.decode("utf-8"))
+                if self.manifest is not None and fingerprint is not None:
+                    self.manifest.set(destination, fingerprint)
+                self.summary["restored"] += 1
+                if self.track_dependencies:
+                    self.register_page(page_item)
+                return destination_path
 
         msg = " Building page: {}"
-        self.logger.info(msg.format(page_item.get_destination()))
+        self.logger.info(msg.format(destination))
+
+        timing = self.get_page_timing(page_item, destination)
 
         # Optional i18n
         if self.internationalized:
             self.get_translation_for_item(page_item)
 
-        # Template render
-        content = page_item.render(self.jinja_env)
+        if self.hooks:
+            self.emit("before_render", page=page_item, destination=destination)
 
-        # Creating destination path if needed
-        destination_path = os.path.join(
-            self.settings.PUBLISH_DIR, page_item.get_destination()
+        # Record templates loaded while rendering
+        tracking = self.track_dependencies and isinstance(
+            self.jinja_env, TrackingEnvironment
         )
-        destination_dir, destination_file = os.path.split(destination_path)
-        if not os.path.exists(destination_dir):
-            msg = " - Creating new directory : {}"
-            self.logger.debug(msg.format(destination_dir))
+        if tracking:
+            self.jinja_env.start_tracking()
+
+        # Template render, streamed views are rendered when written
+        page_item.context_time = 0.0
+        started = time.perf_counter()
+        if page_item.streaming:
+            chunks = _timed_chunks(page_item.render_stream(self.jinja_env), timing)
+        else:
+            content = page_item.render(self.jinja_env)
+            # Streamed pages are not processed since content is never complete
+            if self.processors:
+                content = self.process_content(page_item, destination, content)
+            timing["length"] = len(content)
+        timing["render"] += time.perf_counter() - started
+
+        if self.hooks and not page_item.streaming:
+            self.emit(
+                "after_render",
+                page=page_item,
+                destination=destination,
+                time=timing["render"],
+                context_time=page_item.context_time,
+                length=timing["length"],
+            )
+
+        # Creating destination path if needed and not already created from bulk
+        destination_dir = os.path.dirname(destination_path)
+        if destination_dir not in self.known_dirs:
+            self.create_directory(destination_dir)
+        # Write it, streamed render time is removed from write time
+        streamed_time = timing["render"]
+        started = time.perf_counter()
+        written = False
+        if self.dry_run:
+            # Stream still have to be rendered to raise possible errors
+            if page_item.streaming:
+                for chunk in chunks:
+                    timing["size"] += len(chunk.encode("utf-8"))
+            else:
+                timing["size"] = len(content.encode("utf-8"))
+        else:
+            if page_item.streaming:
+                written, timing["size"] = self.write_page_stream(
+                    destination_path, chunks
+                )
+            else:
+                written, timing["size"] = self.write_page(destination_path, content)
+
+            if self.manifest is not None and fingerprint is not None:
+                self.manifest.set(destination, fingerprint)
+            if cache_key is not None:
+                self.render_cache.set(cache_key, destination_path)
+        timing["write"] = (
+            time.perf_counter() - started - (timing["render"] - streamed_time)
+        )
+
+        if tracking:
+            references = self.jinja_env.stop_tracking()
+            self.tracked[destination] = (list(references), references)
+            self.register_page(page_item, *self.tracked[destination])
+        elif self.track_dependencies:
+            self.register_page(page_item)
+
+        # Context is built during render
+        timing["context"] = page_item.context_time
+        timing["render"] = max(0.0, timing["render"] - timing["context"])
+        timing["total"] = timing["context"] + timing["render"] + timing["write"]
+        self.timings.append(timing)
+
+        if self.hooks:
+            # Streamed content is only known once written
+            if page_item.streaming:
+                self.emit(
+                    "after_render",
+                    page=page_item,
+                    destination=destination,
+                    time=timing["context"] + timing["render"],
+                    context_time=timing["context"],
+                    length=timing["length"],
+                )
             if not self.dry_run:
-                os.makedirs(destination_dir)
-        # Write it
-        self.logger.debug(" - Writing to: {}".format(destination_path))
-        if not self.dry_run:
-            with io.open(destination_path, "w") as fp:
-                fp.write(content)
+                self.emit(
+                    "after_write",
+                    page=page_item,
+                    destination=destination,
+                    destination_path=destination_path,
+                    written=written,
+                    time=timing["write"],
+                    size=timing["size"],
+                    timing=timing,
+                )
+
+        self.summary["built"] += 1
 
         return destination_path
 
+    def get_worker_builder(self):
+        """
+        Get a new builder for a build worker process.
+
+        The worker builder is initialized with the same options and hooks than the
+        current one, except for the number of jobs. It has its own Jinja environment
+        (unless a custom one has been given to current builder), translations and
+        webassets environment.
+
+        Returns:
+            PageBuilder: New builder instance.
+        """
+        assets_env = None
+        if self.assets_env is not None:
+            assets_env = register_assets(self.settings)
+
+        builder = self.__class__(
+            self.settings,
+            jinja_env=self.jinja_env if self.custom_jinja_env else None,
+            assets_env=assets_env,
+            dry_run=self.dry_run,
+            incremental=self.incremental,
+            write_if_changed=self.write_if_changed,
+            track_dependencies=self.track_dependencies,
+        )
+        # Share hooks, including the ones not registered from settings
+        builder.hooks = self.hooks
+        # Destination directories have already been created from bulk build
+        builder.known_dirs = self.known_dirs
+        # Start from data already parsed and templates already introspected in
+        # current process
+        builder.data_loader = self.data_loader
+        builder.introspection = self.introspection
+        builder.jinja_env.optimus_introspection = self.introspection
+        builder.registry_database = self.registry_database
+
+        return builder
+
+    def export_state(self):
+        """
+        Export builder state that has been changed from builds.
+
+        This is used to send back the state from a worker builder to the parent
+        builder. Exported state is flushed from builder so each export only
+        contains the changes since the previous export.
+
+        Returns:
+            dict: Builder state.
+        """
+        state = {
+            "summary": dict(self.summary),
+            "timings": self.timings,
+            "written_files": self.written_files,
+            "written_dirs": self.written_dirs,
+            "manifest": {},
+            "tracked": self.tracked,
+        }
+        self.summary = Counter()
+        self.timings = []
+        self.written_files = set()
+        self.written_dirs = set()
+        self.tracked = {}
+
+        if self.manifest is not None:
+            state["manifest"] = self.manifest.updated
+            self.manifest.updated = {}
+
+        return state
+
+    def merge_state(self, state):
+        """
+        Merge a builder state exported from another builder.
+
+        Arguments:
+            state (dict): Builder state as returned from
+                ``PageBuilder.export_state()``.
+        """
+        self.summary.update(state["summary"])
+        self.timings.extend(state["timings"])
+        self.written_files.update(state["written_files"])
+        self.written_dirs.update(state["written_dirs"])
+        self.tracked.update(state["tracked"])
+
+        if self.manifest is not None:
+            self.manifest.update(state["manifest"])
+
+    def reset_build(self):
+        """
+        Reset summary and caches from a previous build.
+        """
+        self.summary = Counter()
+        self.timings = []
+        self.written_files = set()
+        self.written_dirs = set()
+        self.compressed = []
+        self._build_fingerprint = {}
+        self._digests = {}
+        self.introspection.reset()
+        self.tracked = {}
+
+    def log_summary(self):
+        """
+        Output build summary to logger.
+        """
+        msg = "Build summary: {built} built, {reused} reused, {unchanged} unchanged"
+        if self.render_cache is not None:
+            msg += ", {restored} restored from render cache"
+        self.logger.info(msg.format(
+            built=self.summary["built"],
+            reused=self.summary["reused"],
+            unchanged=self.summary["unchanged"],
+            restored=self.summary["restored"],
+        ))
+
+    def log_slowest_pages(self, limit=10):
+        """
+        Output the slowest built pages to logger.
+
+        Keyword Arguments:
+            limit (integer): Maximum number of pages to output.
+        """
+        self.logger.info("Slowest pages:")
+
+        msg = (
+            " - {destination}: {total:.3f}s (context {context:.3f}s, "
+            "render {render:.3f}s, write {write:.3f}s)"
+        )
+        for item in get_slowest_pages(self.timings, limit=limit):
+            self.logger.info(msg.format(**item))
+
+    def get_build_order(self, page_list):
+        """
+        Get the order to build pages.
+
+        When internationalization is enabled, pages are grouped by language so
+        language translations are installed once per language group instead of
+        once per page. Languages are ordered by their first appearance in page list
+        and pages keep their page list order inside their language group.
+
+        Arguments:
+            page_list (list): List of page instances.
+
+        Returns:
+            list: Index positions from page list in build order.
+        """
+        if not self.internationalized:
+            return list(range(len(page_list)))
+
+        groups = {}
+        for index, page in enumerate(page_list):
+            self.connect_page(page)
+            groups.setdefault(page.get_lang().code, []).append(index)
+
+        return [index for indexes in groups.values() for index in indexes]
+
+    def get_partitions(self, order):
+        """
+        Split build order into partitions of index positions to distribute to
+        workers.
+
+        There are more partitions than workers so the load is balanced between
+        workers even if some pages are longer to build. Partitions are contiguous
+        parts of build order, so they mostly hold pages from a single language.
+
+        Arguments:
+            order (list): Index positions from page list in build order.
+
+        Returns:
+            list: List of partitions, each partition is a list of index positions
+            from page list.
+        """
+        size = max(1, math.ceil(len(order) / (self.jobs * 4)))
+
+        return [order[start:start + size] for start in range(0, len(order), size)]
+
+    def build_parallel(self, page_list):
+        """
+        Build all given pages with multiple worker processes.
+
+        Workers are forked from the current process so the page instances are not
+        pickled, each worker only receive partitions of index positions.
+
+        Webassets bundles are built before starting workers, so workers don't race
+        each other to write the same bundle files.
+
+        Arguments:
+            page_list (list): List of page instances.
+
+        Raises:
+            optimus.exceptions.PageBuildError: If any worker has failed to build a
+                page. Exception attribute ``failures`` contains the failure details
+                from every failed worker.
+
+        Returns:
+            list: List of destination paths from builded pages, in the same order
+            than the page list.
+        """
+        msg = "Starting parallel build with {} workers"
+        self.logger.info(msg.format(self.jobs))
+
+        if self.assets_env is not None:
+            for bundle in self.assets_env:
+                bundle.urls()
+
+        builded = [None] * len(page_list)
+        failures = []
+
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_build_worker,
+            initargs=(self, page_list),
+        ) as executor:
+            partitions = self.get_partitions(self.get_build_order(page_list))
+            for result in executor.map(_build_partition, partitions):
+                for index, destination in result["builded"]:
+                    builded[index] = destination
+
+                self.merge_state(result["state"])
+
+                if result["failure"] is not None:
+                    result["failure"]["pid"] = result["pid"]
+                    failures.append(result["failure"])
+
+        if failures:
+            for failure in failures:
+                msg = "Worker {pid} failed to build page {page}: {error}"
+                self.logger.error(msg.format(**failure))
+                self.logger.debug(failure["traceback"])
+
+            msg = "Parallel build failed for {} page(s)"
+            raise PageBuildError(msg.format(len(failures)), failures=failures)
+
+        return builded
+
+    def in_shard(self, page_item):
+        """
+        Check if a page belongs to the shard to build.
+
+        Arguments:
+            page_item (optimus.pages.views.PageViewBase): Page instance.
+
+        Returns:
+            boolean: ``True`` if page is in builder shard or if builder has no
+            shard, else ``False``.
+        """
+        if self.shard is None:
+            return True
+
+        self.connect_page(page_item)
+        number, count = self.shard
+
+        return get_destination_shard(page_item.get_destination(), count) == number
+
+    def compress_pages(self, paths):
+        """
+        Write gzip sidecar files for built pages if setting ``GZIP_SIDECARS`` is
+        enabled.
+
+        Pages whose sidecar is newer than the page are not compressed again and
+        outdated sidecars from pages smaller than setting ``GZIP_MIN_SIZE`` are
+        removed, see ``optimus.utils.compress.compress_files``.
+
+        Arguments:
+            paths (list): Built page paths.
+
+        Returns:
+            list: Written sidecar file paths.
+        """
+        if not getattr(self.settings, "GZIP_SIDECARS", False) or self.dry_run:
+            return []
+
+        compressed = compress_files(
+            paths,
+            min_size=getattr(self.settings, "GZIP_MIN_SIZE", 0),
+            jobs=self.jobs if self.jobs > 1 else None,
+        )
+        self.logger.info(
+            "Written {} gzip sidecar files for pages".format(len(compressed))
+        )
+
+        return compressed
+
+    def finish_build(self, builded=None):
+        """
+        Finish a build once all pages have been built.
+
+        Written files are synchronized to disk if needed, built pages are
+        compressed if needed, manifest is saved if needed and the build summary is
+        output to logger.
+
+        Keyword Arguments:
+            builded (list): Paths of built pages. Default to ``None``.
+        """
+        if not self.dry_run:
+            self.sync_directories()
+
+        if self.manifest is not None and not self.dry_run:
+            self.manifest.save()
+
+        self.introspection.save()
+
+        if self.registry_database is not None and not self.dry_run:
+            self.registry_database.save(self.registry, self.jinja_env)
+
+        self.compressed = self.compress_pages(builded or [])
+
+        self.log_summary()
+
+    def iter_build(self, pages):
+        """
+        Build pages from an iterable in a single streaming pass.
+
+        Each page is built as soon as it is given from the iterable and its
+        destination path is yielded, so pages do not have to be all held in memory.
+        Pages are built in the iterable order, serially.
+
+        Arguments:
+            pages (iterable): Iterable of page instances, like a generator.
+
+        Yields:
+            string: Destination path from builded page.
+        """
+        self.logger.info("Starting page builds")
+
+        self.reset_build()
+
+        builded = []
+        try:
+            for page in pages:
+                destination_path = self.build_item(page)
+                # Directory does not have to be checked again for next pages
+                self.known_dirs.add(os.path.dirname(destination_path))
+                builded.append(destination_path)
+
+                yield destination_path
+        finally:
+            # Directories may be removed before next page builds
+            self.known_dirs = set()
+
+        if not builded:
+            self.logger.warning(
+                "Page management is skipped because there are no registered pages"
+            )
+            return
+
+        self.finish_build(builded=builded)
+
     def build_bulk(self, page_list):
         """
         Build all given pages.
 
-        Return all the effective builded pages
+        Return all the effective builded pages. If builder has been configured with
+        more than one job, pages are built with worker processes (see
+        ``PageBuilder.build_parallel``) which requires the ``fork`` start method
+        from multiprocessing, else pages are built serially.
+
+        Pages are not built in page list order but grouped by language (see
+        ``PageBuilder.get_build_order``), however returned destinations are
+        always in the same order than the page list, whatever the build mode is.
+
+        The destination directory tree is created once before page builds (see
+        ``PageBuilder.prepare_directories``). With ``directory`` durability,
+        written files are synchronized to disk once all pages have been built.
+
+        Page list may also be an iterable which is not a list or a tuple, like a
+        generator. It is then built serially in a single streaming pass with
+        ``PageBuilder.iter_build``, without language grouping nor directory tree
+        creation, unless builder has more than one job since the iterable has to be
+        turned to a list to be distributed to workers.
+
+        If builder has a shard, only pages from this shard are built (see
+        ``PageBuilder.in_shard``).
 
         Arguments:
-            page_list (list): List of page instances.
+            page_list (iterable): List or iterable of page instances.
 
         Returns:
             list: List of destination paths from builded pages.
         """
+        if not isinstance(page_list, (list, tuple)):
+            if self.shard is not None:
+                page_list = filter(self.in_shard, page_list)
+
+            if self.jobs > 1:
+                page_list = list(page_list)
+            else:
+                return list(self.iter_build(page_list)) or None
+        elif self.shard is not None:
+            page_list = [page for page in page_list if self.in_shard(page)]
+
         self.logger.info("Starting page builds")
 
         if not page_list:
@@ -322,8 +1722,34 @@ class PageBuilder(object):
             )
             return None
 
-        builded = []
-        for page in page_list:
-            builded.append(self.build_item(page))
+        self.reset_build()
+        self.prepare_directories(page_list)
+
+        parallel = self.jobs > 1 and len(page_list) > 1
+        if parallel and "fork" not in multiprocessing.get_all_start_methods():
+            self.logger.warning(
+                "Parallel build is not available on this platform, fallback to a "
+                "serial build"
+            )
+            parallel = False
+
+        try:
+            if parallel:
+                builded = self.build_parallel(page_list)
+                # Pages have been registered in worker registries
+                if self.track_dependencies:
+                    for page in page_list:
+                        self.register_page(
+                            page, *self.tracked.get(page.get_destination(), ())
+                        )
+            else:
+                builded = [None] * len(page_list)
+                for index in self.get_build_order(page_list):
+                    builded[index] = self.build_item(page_list[index])
+        finally:
+            # Directories may be removed before next page builds
+            self.known_dirs = set()
+
+        self.finish_build(builded=builded)
 
         return builded
@@ -0,0 +1,145 @@
+"""
+Data loader
+===========
+
+The data loader parses data files for views and caches the parsed data, so a data
+file used by many pages is opened and parsed only once per build.
+
+Parsed data are cached on file path and invalidated when the file modification
+time or size change. Since parsed data are shared between every page, views must
+not modify them.
+
+"""
+import json
+import logging
+import os
+
+from optimus.exceptions import DataProcessError
+
+
+class DataLoader(object):
+    """
+    Load and cache parsed data files.
+
+    Keyword Arguments:
+        basedir (string): Directory to resolve relative data file paths, commonly
+            from setting ``DATAS_DIR``. Default is ``None`` to resolve them from
+            current directory.
+        parsers (dict): Parsers to register additionally to the JSON one, indexed
+            on file extensions. Default is ``None``.
+
+    Attributes:
+        logger (logging.Logger): Optimus logger.
+        basedir (string): Directory to resolve relative data file paths.
+        parsers (dict): Registered parsers indexed on file extensions (like
+            ``.json``). A parser receives the file content as a string and returns
+            the parsed data.
+        cache (dict): Cached data indexed on absolute file paths, each item is a
+            tuple of file modification time, file size and parsed data.
+    """
+
+    def __init__(self, basedir=None, parsers=None):
+        self.logger = logging.getLogger("optimus")
+        self.basedir = basedir
+        self.parsers = {".json": json.loads}
+        self.cache = {}
+
+        for extension, parser in (parsers or {}).items():
+            self.register_format(extension, parser)
+
+    def register_format(self, extension, parser):
+        """
+        Register a parser for a file extension.
+
+        Arguments:
+            extension (string): File extension with its leading dot, like
+                ``.yaml``.
+            parser (callable): Parser which receives the file content as a string
+                and returns the parsed data.
+        """
+        self.parsers[extension.lower()] = parser
+
+    def get_path(self, path):
+        """
+        Get absolute path for a data file.
+
+        Arguments:
+            path (string): Data file path, relative paths are resolved from
+                ``basedir``.
+
+        Returns:
+            string: Absolute path.
+        """
+        if self.basedir and not os.path.isabs(path):
+            path = os.path.join(self.basedir, path)
+
+        return os.path.abspath(path)
+
+    def get_parser(self, path):
+        """
+        Get the parser for a data file from its extension.
+
+        Arguments:
+            path (string): Data file path.
+
+        Returns:
+            callable: Registered parser.
+        """
+        extension = os.path.splitext(path)[-1].lower()
+
+        try:
+            return self.parsers[extension]
+        except KeyError:
+            msg = "No parser registered for data file '{}', available formats are: {}"
+            raise DataProcessError(
+                msg.format(path, ", ".join(sorted(self.parsers))),
+                name=path,
+            )
+
+    def load(self, path):
+        """
+        Load parsed data from a data file.
+
+        Data file is only parsed if it is not in cache or if it has changed since
+        it has been cached.
+
+        Arguments:
+            path (string): Data file path, relative paths are resolved from
+                ``basedir``.
+
+        Returns:
+            object: Parsed data.
+        """
+        path = self.get_path(path)
+        stat = os.stat(path)
+
+        cached = self.cache.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        parser = self.get_parser(path)
+
+        self.logger.debug(" - Parsing data file: {}".format(path))
+        try:
+            with open(path, "r", encoding="utf-8") as fp:
+                data = parser(fp.read())
+        except Exception as e:
+            msg = "Unable to parse data file '{}': {}"
+            raise DataProcessError(msg.format(path, e), name=path) from e
+
+        self.cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+
+        return data
+
+    def invalidate(self, path=None):
+        """
+        Remove parsed data from cache.
+
+        Keyword Arguments:
+            path (string): Data file path to remove, relative paths are resolved
+                from ``basedir``. Default is ``None`` to clear the whole cache.
+        """
+        if path is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(self.get_path(path), None)
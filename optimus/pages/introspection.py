@@ -0,0 +1,195 @@
+"""
+Template introspection
+======================
+
+Page introspection finds every template involved in a page by parsing its
+template and then every referenced template. Templates are shared by many pages so
+the introspection cache stores the templates directly referenced by each template,
+it is owned by the builder and attached to its Jinja environment so every view use
+it.
+
+Cached references are validated against the template source file modification
+time, or against the template source for templates without a source file. The
+cache can be persisted to a file so it is reused from a build to another.
+
+"""
+import json
+import logging
+import os
+
+from jinja2 import __version__ as jinja2_version
+from jinja2 import meta as Jinja2Meta
+
+from optimus import __version__
+from optimus.pages.manifest import get_fingerprint
+
+
+class IntrospectionCache(object):
+    """
+    Cache of templates directly referenced by templates.
+
+    Keyword Arguments:
+        path (string): Path to the file where to persist cache. Default to ``None``
+            to not persist it.
+
+    Attributes:
+        path (string): Path to the file where to persist cache.
+        entries (dict): Cache entries indexed on template names, each entry is a
+            dict with template source file path (``filename`` item), its
+            modification time (``mtime`` item), the template source digest when
+            there is no source file (``digest`` item), names of the directly
+            referenced templates (``references`` item) and if template has
+            references which can not be resolved, like a template included from a
+            variable (``dynamic`` item).
+        checked (set): Template names whose entry has been validated since the last
+            ``reset()``, they are not validated again.
+        updated (boolean): ``True`` if entries have changed since cache has been
+            loaded or saved.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.checked = set()
+        self.updated = False
+        self.logger = logging.getLogger("optimus")
+
+    def get_versions(self):
+        """
+        Get versions which invalidate the persisted cache when they change.
+
+        Returns:
+            list: Optimus and Jinja versions.
+        """
+        return [__version__, jinja2_version]
+
+    def load(self):
+        """
+        Load entries from cache file if it exists.
+
+        An invalid cache file or a cache file from other versions is ignored.
+
+        Returns:
+            dict: Loaded entries.
+        """
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as fp:
+                    payload = json.load(fp)
+            except ValueError:
+                msg = "Ignored invalid template introspection cache: {}"
+                self.logger.warning(msg.format(self.path))
+            else:
+                if payload.get("versions") == self.get_versions():
+                    self.entries = payload["entries"]
+
+        return self.entries
+
+    def save(self):
+        """
+        Write entries to cache file if they have changed.
+        """
+        if not self.path or not self.updated:
+            return
+
+        msg = "Writing template introspection cache: {}"
+        self.logger.debug(msg.format(self.path))
+
+        with open(self.path, "w") as fp:
+            json.dump(
+                {"versions": self.get_versions(), "entries": self.entries},
+                fp,
+                sort_keys=True,
+            )
+
+        self.updated = False
+
+    def reset(self):
+        """
+        Forget validated entries so they are validated again on their next usage.
+        """
+        self.checked = set()
+
+    def is_valid(self, entry):
+        """
+        Check if an entry is still valid from its source file modification time.
+
+        Arguments:
+            entry (dict): Cache entry.
+
+        Returns:
+            boolean: ``True`` if entry source file has not been modified, ``False``
+            if it has been modified or if entry has no source file.
+        """
+        if not entry.get("filename"):
+            return False
+
+        try:
+            return os.stat(entry["filename"]).st_mtime_ns == entry["mtime"]
+        except OSError:
+            return False
+
+    def is_dynamic(self, template_name):
+        """
+        Check if a template has references which can not be resolved from its
+        source.
+
+        Arguments:
+            template_name (string): Template name, its references must have been
+                get before.
+
+        Returns:
+            boolean: ``True`` if template has unresolved references.
+        """
+        return self.entries.get(template_name, {}).get("dynamic", False)
+
+    def get_references(self, env, template_name):
+        """
+        Get the templates directly referenced by a template.
+
+        References which can not be resolved from template source are ignored, see
+        ``is_dynamic()``.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+            template_name (string): Template name.
+
+        Returns:
+            list: Names of directly referenced templates.
+        """
+        entry = self.entries.get(template_name)
+
+        if entry and (template_name in self.checked or self.is_valid(entry)):
+            self.checked.add(template_name)
+            return entry["references"]
+
+        source, filename = env.loader.get_source(env, template_name)[:2]
+
+        mtime = None
+        digest = None
+        if filename and os.path.exists(filename):
+            mtime = os.stat(filename).st_mtime_ns
+        else:
+            filename = None
+            digest = get_fingerprint(source)
+
+        if entry and digest is not None and entry.get("digest") == digest:
+            references = entry["references"]
+        else:
+            references = list(
+                Jinja2Meta.find_referenced_templates(env.parse(source))
+            )
+            self.entries[template_name] = {
+                "filename": filename,
+                "mtime": mtime,
+                "digest": digest,
+                "references": [item for item in references if item is not None],
+                "dynamic": None in references,
+            }
+            references = self.entries[template_name]["references"]
+            self.updated = True
+
+        self.checked.add(template_name)
+
+        return references
@@ -0,0 +1,45 @@
+"""
+Template loaders
+================
+
+Custom Jinja template loaders used by the page builder.
+
+"""
+from jinja2 import FileSystemLoader, ModuleLoader
+from jinja2.exceptions import TemplateNotFound
+
+
+class PrecompiledLoader(ModuleLoader):
+    """
+    Load templates from precompiled templates, as made with command
+    ``compile-templates``.
+
+    Template sources are still available from templates directory since they are
+    required for page introspection. Templates missing from precompiled templates
+    are loaded from their sources.
+
+    Arguments:
+        path (string): Path to the precompiled templates, either a zip file or a
+            directory.
+        searchpath (string): Path to the templates directory.
+
+    Attributes:
+        source_loader (jinja2.FileSystemLoader): Loader for template sources.
+    """
+    has_source_access = True
+
+    def __init__(self, path, searchpath):
+        super().__init__(path)
+        self.source_loader = FileSystemLoader(searchpath)
+
+    def get_source(self, environment, template):
+        return self.source_loader.get_source(environment, template)
+
+    def list_templates(self):
+        return self.source_loader.list_templates()
+
+    def load(self, environment, name, globals=None):
+        try:
+            return super().load(environment, name, globals=globals)
+        except TemplateNotFound:
+            return self.source_loader.load(environment, name, globals=globals)
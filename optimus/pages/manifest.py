@@ -0,0 +1,173 @@
+"""
+Build manifest
+==============
+
+The build manifest stores a fingerprint of inputs for every built page, it is used
+from incremental builds to know which pages can be reused from a previous build.
+
+"""
+import hashlib
+import json
+import logging
+import os
+
+from webassets import Bundle
+
+from optimus.utils.jsons import ExtendedJsonEncoder
+
+
+class FingerprintJsonEncoder(ExtendedJsonEncoder):
+    """
+    Extended JSON encoder to serialize any object as part of a fingerprint.
+
+    Asset bundles are serialized to their output, contents, dependencies and
+    filter names, callables are serialized to their Python path and every other
+    unsupported objects are serialized to their representation. An object
+    representation which includes a memory address will change on every build so
+    any fingerprint using it won't never match, this is a safe behavior since the
+    page will just be rebuilt.
+    """
+    def default(self, obj):
+        if isinstance(obj, Bundle):
+            return {
+                "output": obj.output,
+                "contents": list(obj.contents),
+                "depends": obj.depends,
+                "filters": [
+                    item.name or "{}.{}".format(
+                        item.__class__.__module__, item.__class__.__qualname__
+                    )
+                    for item in obj.filters
+                ],
+            }
+
+        try:
+            return super().default(obj)
+        except TypeError:
+            if callable(obj) and hasattr(obj, "__qualname__"):
+                return "{}.{}".format(obj.__module__, obj.__qualname__)
+
+            return repr(obj)
+
+
+def get_fingerprint(*items):
+    """
+    Compute a fingerprint from given items.
+
+    Arguments:
+        *items: Any object that can be serialized by ``FingerprintJsonEncoder``.
+
+    Returns:
+        string: A SHA256 hexadecimal digest.
+    """
+    payload = json.dumps(items, sort_keys=True, cls=FingerprintJsonEncoder)
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_file_digest(path, chunk_size=65536):
+    """
+    Compute a digest from a file content.
+
+    Arguments:
+        path (string): File path.
+
+    Keyword Arguments:
+        chunk_size (integer): Size of chunks to read from file.
+
+    Returns:
+        string: A SHA256 hexadecimal digest or ``None`` if file does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class BuildManifest(object):
+    """
+    Persistent manifest of page fingerprints indexed on their destination.
+
+    Arguments:
+        path (string): Path to the manifest file.
+
+    Attributes:
+        path (string): Path to the manifest file.
+        entries (dict): Fingerprints indexed on destinations.
+        updated (dict): Fingerprints which have been set since manifest has been
+            loaded, indexed on destinations.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.updated = {}
+        self.logger = logging.getLogger("optimus")
+
+    def load(self):
+        """
+        Load entries from manifest file if it exists.
+
+        An invalid manifest file is ignored, every page will be rebuilt.
+
+        Returns:
+            dict: Loaded entries.
+        """
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as fp:
+                    self.entries = json.load(fp)
+            except ValueError:
+                msg = "Ignored invalid build manifest: {}"
+                self.logger.warning(msg.format(self.path))
+                self.entries = {}
+
+        return self.entries
+
+    def save(self):
+        """
+        Write entries to manifest file.
+        """
+        self.logger.debug("Writing build manifest: {}".format(self.path))
+
+        with open(self.path, "w") as fp:
+            json.dump(self.entries, fp, indent=4, sort_keys=True)
+
+    def get(self, destination):
+        """
+        Get fingerprint for a destination.
+
+        Arguments:
+            destination (string): Page destination.
+
+        Returns:
+            string: Fingerprint if destination is registered, else ``None``.
+        """
+        return self.entries.get(destination)
+
+    def set(self, destination, fingerprint):
+        """
+        Set fingerprint for a destination.
+
+        Arguments:
+            destination (string): Page destination.
+            fingerprint (string): Page fingerprint.
+        """
+        self.entries[destination] = fingerprint
+        self.updated[destination] = fingerprint
+
+    def update(self, entries):
+        """
+        Set fingerprints from given entries.
+
+        Arguments:
+            entries (dict): Fingerprints indexed on destinations.
+        """
+        for destination, fingerprint in entries.items():
+            self.set(destination, fingerprint)
@@ -0,0 +1,79 @@
+"""
+Post render processors
+======================
+
+Processors are callables applied by the builder to the rendered content of a page
+before it is written, they are enabled from setting ``POST_RENDER_PROCESSORS``.
+
+A processor receives the rendered content and the page instance as positional
+arguments and returns the processed content. Processor results are cached so a
+page with the same rendered content is not processed again, a processor should
+then only depend on the content and the page attributes.
+
+"""
+import re
+
+
+# Either a comment, an element whose content must be preserved or any other tag
+# markup, attribute values may contain a ">"
+HTML_TOKENS = re.compile(
+    r"(?P<comment><!--.*?-->)|"
+    r"(?P<preserved><(?P<tag>pre|textarea|script|style)\b.*?</(?P=tag)\s*>)|"
+    r"(?P<markup><[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# HTML whitespaces, non breaking space is not a whitespace for HTML
+HTML_WHITESPACES = re.compile(r"[ \t\n\r\f]+")
+
+
+def _collapse_whitespaces(text):
+    """
+    Collapse whitespace runs to a single newline if they contain one, else to a
+    single space.
+
+    Arguments:
+        text (string): Text to collapse.
+
+    Returns:
+        string: Collapsed text.
+    """
+    return HTML_WHITESPACES.sub(
+        lambda match: "\n" if "\n" in match.group(0) else " ",
+        text,
+    )
+
+
+def minify_html(content, page=None):
+    """
+    Minify HTML content by removing comments and collapsing whitespaces in text
+    between tags.
+
+    Minification is safe since it never removes whitespaces, it only collapses
+    them so inline elements keep their spacing. Tags with their attributes, content
+    of ``pre``, ``textarea``, ``script`` and ``style`` elements and conditional
+    comments like ``<!--[if IE]>`` are left untouched.
+
+    Arguments:
+        content (string): HTML content to minify.
+
+    Keyword Arguments:
+        page (optimus.pages.views.PageViewBase): Page instance, unused.
+
+    Returns:
+        string: Minified HTML content.
+    """
+    minified = []
+    position = 0
+
+    for match in HTML_TOKENS.finditer(content):
+        minified.append(_collapse_whitespaces(content[position:match.start()]))
+
+        if not match.group("comment") or match.group(0).startswith("<!--[if"):
+            minified.append(match.group(0))
+
+        position = match.end()
+
+    minified.append(_collapse_whitespaces(content[position:]))
+
+    return "".join(minified)
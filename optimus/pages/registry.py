@@ -1,4 +1,6 @@
 import logging
+from array import array
+from bisect import bisect_left
 
 
 class PageRegistry(object):
@@ -7,40 +9,122 @@ class PageRegistry(object):
 
     Index templates and memorize page destination that use them.
 
+    Templates are stored as a graph where each template has edges to the templates
+    it references (from ``extends``, ``include`` and ``import`` tags) and each page
+    is only linked to its own template. Pages depending from a template are found
+    by walking the graph in reverse from this template to the page templates.
+
     Keyword Arguments:
         templates (dict): Initial element dictionnary. Default to an empty dict.
 
     Attributes:
-        templates (string): Dictionnary indexed on template names which contain
-            destinations using them.
+        references (dict): Dictionnary indexed on template names which contain the
+            names of templates they directly reference.
+        referrers (dict): Dictionnary indexed on template names which contain the
+            names of templates directly referencing them, the reverse of
+            ``references``.
+        roots (dict): Dictionnary indexed on page template names which contain
+            destinations of pages using them.
+        destinations_templates_index (dict): Dictionnary indexed on destinations
+            which contain their page template name.
         destinations_pages_index (string): Dictionnary indexed on destinations which
             contain their related page view.
         logger (logging.Logger): Optimus logger.
     """
 
     def __init__(self, templates={}):
-        self.templates = {}
+        self.references = {}
+        self.referrers = {}
+        self.roots = {}
+        self.destinations_templates_index = {}
         self.datas = {}
         self.destinations_pages_index = {}
         self.destinations_datas_index = {}
         self.logger = logging.getLogger("optimus")
 
-    def add_page(self, page, templates):
+    @property
+    def templates(self):
+        """
+        Every template names and destinations of pages using them.
+
+        This is computed from the whole template graph so it should not be used to
+        check if a template is registered, use ``has_template()`` instead.
+
+        Returns:
+            dict: Dictionnary indexed on template names which contain destinations
+            using them.
+        """
+        templates = {}
+
+        for name in self.get_all_templates():
+            destinations = self.get_destinations_from_template(name)
+            if destinations:
+                templates[name] = destinations
+
+        return templates
+
+    def add_template(self, template_name, references):
+        """
+        Set the templates directly referenced by a template.
+
+        Arguments:
+            template_name (string): Template name.
+            references (list): Names of templates directly referenced by given
+                template. They replace the previous references of template.
+        """
+        previous = self.references.get(template_name, set())
+        references = set(references)
+
+        for name in previous - references:
+            self.referrers[name].discard(template_name)
+
+        for name in references - previous:
+            self.referrers.setdefault(name, set()).add(template_name)
+            self.references.setdefault(name, set())
+
+        self.references[template_name] = references
+
+    def add_page(self, page, templates, references=None):
         """
         Add a page to registry.
 
         Arguments:
             page (optimus.pages.views.PageViewBase): Page instance
             templates (list): List of templates names to link to given page
-                instance.
+                instance, the first one is the page template.
+
+        Keyword Arguments:
+            references (dict): Names of templates directly referenced, indexed on
+                template names. If not given, every templates are assumed to be
+                referenced from the page template. They are added to the
+                previously registered references since a template may reference
+                different templates for different pages, like with an include
+                from a variable.
         """
-        self.destinations_pages_index[page.get_destination()] = page
+        destination = page.get_destination()
+        self.destinations_pages_index[destination] = page
 
-        for k in templates:
-            if k in self.templates:
-                self.templates[k].add(page.get_destination())
-            else:
-                self.templates[k] = set([page.get_destination()])
+        if not templates:
+            return
+
+        root = templates[0]
+
+        # Page template may have changed
+        previous = self.destinations_templates_index.get(destination)
+        if previous is not None and previous != root:
+            self.roots[previous].discard(destination)
+
+        self.destinations_templates_index[destination] = root
+        self.roots.setdefault(root, set()).add(destination)
+
+        if references is None:
+            references = {root: templates[1:]}
+
+        for name in templates:
+            self.references.setdefault(name, set())
+
+        for name, items in references.items():
+            self.add_template(name, self.references[name] | set(items))
 
     def add_data(self, page, datas):
         """
@@ -59,6 +143,85 @@ class PageRegistry(object):
             else:
                 self.datas[k] = set([page.get_destination()])
 
+    def has_template(self, template_name):
+        """
+        Check if a template is registered.
+
+        Arguments:
+            template_name (string): Template name to search for.
+
+        Returns:
+            boolean: ``True`` if template is registered.
+        """
+        return template_name in self.references
+
+    def get_page(self, destination):
+        """
+        Get a registered page from its destination.
+
+        Arguments:
+            destination (string): Page destination.
+
+        Returns:
+            optimus.pages.views.PageViewBase: Page instance, ``None`` if destination
+            is not registered.
+        """
+        return (
+            self.destinations_pages_index.get(destination) or
+            self.destinations_datas_index.get(destination)
+        )
+
+    def get_page_template(self, destination):
+        """
+        Get the page template name of a registered page.
+
+        Arguments:
+            destination (string): Page destination.
+
+        Returns:
+            string: Page template name, ``None`` if page has no template or
+            destination is not registered.
+        """
+        return self.destinations_templates_index.get(destination)
+
+    def get_referrer_templates(self, template_name):
+        """
+        Get every templates depending from a template, directly or not.
+
+        Arguments:
+            template_name (string): Template name to search for.
+
+        Returns:
+            set: Template names including the given one.
+        """
+        found = set([template_name])
+        pending = [template_name]
+
+        while pending:
+            for name in self.referrers.get(pending.pop(), ()):
+                if name not in found:
+                    found.add(name)
+                    pending.append(name)
+
+        return found
+
+    def get_destinations_from_template(self, template_name):
+        """
+        Get destinations of pages depending from a template.
+
+        Arguments:
+            template_name (string): Template name to search for.
+
+        Returns:
+            set: Page destinations.
+        """
+        destinations = set()
+
+        for name in self.get_referrer_templates(template_name):
+            destinations.update(self.roots.get(name, ()))
+
+        return destinations
+
     def get_pages_from_template(self, template_name):
         """
         Get page list depending from a template.
@@ -66,7 +229,7 @@ class PageRegistry(object):
         This method is not safe out of the context of scanned pages, because
         it use an internal map builded from the scan use by the add_page
         method. In short, it will raise a KeyError exception for every
-        destination that is unknowned from internal map.
+        destination that is unknowed from internal map.
 
         Arguments:
             template_name (string): Template name to search for.
@@ -74,14 +237,14 @@ class PageRegistry(object):
         Returns:
             list: List of page instances depending from given template name.
         """
-        if template_name not in self.templates:
+        if not self.has_template(template_name):
             msg = "Given template name is not registered: {}"
             self.logger.warning(msg.format(template_name))
             return []
 
         return [
             self.destinations_pages_index[item]
-            for item in self.templates[template_name]
+            for item in self.get_destinations_from_template(template_name)
         ]
 
     def get_pages_from_data(self, data):
@@ -104,6 +267,42 @@ class PageRegistry(object):
             for item in self.datas[data]
         ]
 
+    def get_all_templates(self):
+        """
+        Return all registered templates
+
+        Returns:
+            list: List of all template names.
+        """
+        return list(self.references)
+
+    def get_orphan_templates(self, template_names=None):
+        """
+        Get templates which are not used by any page.
+
+        Keyword Arguments:
+            template_names (list): Template names to check, like every template
+                names from the Jinja loader. Default to ``None`` to check every
+                registered templates, they may be orphaned once no page use them
+                anymore.
+
+        Returns:
+            list: Sorted names of orphaned templates.
+        """
+        used = set()
+        pending = [name for name, destinations in self.roots.items() if destinations]
+
+        while pending:
+            name = pending.pop()
+            if name not in used:
+                used.add(name)
+                pending.extend(self.references.get(name, ()))
+
+        if template_names is None:
+            template_names = self.get_all_templates()
+
+        return sorted([name for name in template_names if name not in used])
+
     def get_all_destinations(self):
         """
         Return all registered destinations
@@ -121,3 +320,260 @@ class PageRegistry(object):
             list: List of all page instances.
         """
         return [page for dest, page in self.destinations_pages_index.items()]
+
+
+class CompactPageRegistry(PageRegistry):
+    """
+    Page registry with a compact memory representation for large sites.
+
+    Each page destination is interned once with an integer identifier and pages
+    depending from a template or a data are stored as sorted arrays of identifiers
+    instead of sets of destinations. The template graph is the same than from
+    ``PageRegistry`` since there are much less templates than pages.
+
+    Page indexes from ``PageRegistry`` are only available as dictionnaries computed
+    on each access, ``get_page()`` and ``get_page_template()`` should be used
+    instead.
+
+    Attributes:
+        references (dict): Dictionnary indexed on template names which contain the
+            names of templates they directly reference.
+        referrers (dict): Dictionnary indexed on template names which contain the
+            names of templates directly referencing them, the reverse of
+            ``references``.
+        roots (dict): Dictionnary indexed on page template names which contain
+            the sorted array of identifiers of pages using them.
+        datas (dict): Dictionnary indexed on data paths which contain the sorted
+            array of identifiers of pages using them.
+        destinations (list): Page destinations indexed on their identifier.
+        destination_ids (dict): Page identifiers indexed on their destination.
+        pages (list): Page instances indexed on their identifier.
+        page_templates (list): Page template names indexed on page identifiers,
+            ``None`` for pages without template.
+        page_flags (bytearray): Registration flags indexed on page identifiers,
+            ``1`` for pages added from ``add_page()``, ``2`` for pages added from
+            ``add_data()``.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, templates={}):
+        self.references = {}
+        self.referrers = {}
+        self.roots = {}
+        self.datas = {}
+        self.destinations = []
+        self.destination_ids = {}
+        self.pages = []
+        self.page_templates = []
+        self.page_flags = bytearray()
+        self.logger = logging.getLogger("optimus")
+
+    @property
+    def destinations_templates_index(self):
+        return {
+            self.destinations[index]: name
+            for index, name in enumerate(self.page_templates)
+            if name is not None
+        }
+
+    @property
+    def destinations_pages_index(self):
+        return self.get_flagged_pages(1)
+
+    @property
+    def destinations_datas_index(self):
+        return self.get_flagged_pages(2)
+
+    def get_flagged_pages(self, flag):
+        """
+        Get registered pages with a registration flag.
+
+        Arguments:
+            flag (integer): Registration flag.
+
+        Returns:
+            dict: Page instances indexed on their destination.
+        """
+        return {
+            self.destinations[index]: self.pages[index]
+            for index, flags in enumerate(self.page_flags)
+            if flags & flag
+        }
+
+    def intern(self, page, flag):
+        """
+        Get identifier of a page, a new identifier is given to unknown
+        destinations.
+
+        Arguments:
+            page (optimus.pages.views.PageViewBase): Page instance.
+            flag (integer): Registration flag to add to page.
+
+        Returns:
+            integer: Page identifier.
+        """
+        destination = page.get_destination()
+        index = self.destination_ids.get(destination)
+
+        if index is None:
+            index = len(self.destinations)
+            self.destination_ids[destination] = index
+            self.destinations.append(destination)
+            self.pages.append(page)
+            self.page_templates.append(None)
+            self.page_flags.append(flag)
+        else:
+            self.pages[index] = page
+            self.page_flags[index] |= flag
+
+        return index
+
+    def insert(self, postings, index):
+        """
+        Insert an identifier into a sorted array if it is not already in.
+
+        Arguments:
+            postings (array.array): Sorted array of identifiers.
+            index (integer): Identifier to insert.
+        """
+        # Pages are commonly registered in identifier order
+        if not postings or postings[-1] < index:
+            postings.append(index)
+            return
+
+        position = bisect_left(postings, index)
+        if position == len(postings) or postings[position] != index:
+            postings.insert(position, index)
+
+    def discard(self, postings, index):
+        """
+        Remove an identifier from a sorted array if it is in.
+
+        Arguments:
+            postings (array.array): Sorted array of identifiers.
+            index (integer): Identifier to remove.
+        """
+        position = bisect_left(postings, index)
+        if position < len(postings) and postings[position] == index:
+            del postings[position]
+
+    def add_page(self, page, templates, references=None):
+        """
+        Add a page to registry.
+
+        Arguments:
+            page (optimus.pages.views.PageViewBase): Page instance
+            templates (list): List of templates names to link to given page
+                instance, the first one is the page template.
+
+        Keyword Arguments:
+            references (dict): Names of templates directly referenced, indexed on
+                template names, see ``PageRegistry.add_page()``.
+        """
+        index = self.intern(page, 1)
+
+        if not templates:
+            return
+
+        root = templates[0]
+
+        # Page template may have changed
+        previous = self.page_templates[index]
+        if previous is not None and previous != root:
+            self.discard(self.roots[previous], index)
+
+        self.page_templates[index] = root
+        self.insert(self.roots.setdefault(root, array("I")), index)
+
+        if references is None:
+            references = {root: templates[1:]}
+
+        for name in templates:
+            self.references.setdefault(name, set())
+
+        for name, items in references.items():
+            self.add_template(name, self.references[name] | set(items))
+
+    def add_data(self, page, datas):
+        """
+        Index view datas into registry.
+
+        Arguments:
+            page (optimus.pages.views.PageViewBase): Page instance
+            datas (list): List of view datas to link to given page
+                instance.
+        """
+        index = self.intern(page, 2)
+
+        for k in datas:
+            self.insert(self.datas.setdefault(k, array("I")), index)
+
+    def get_page(self, destination):
+        index = self.destination_ids.get(destination)
+
+        return None if index is None else self.pages[index]
+
+    def get_page_template(self, destination):
+        index = self.destination_ids.get(destination)
+
+        return None if index is None else self.page_templates[index]
+
+    def get_page_ids_from_template(self, template_name):
+        """
+        Get identifiers of pages depending from a template.
+
+        Arguments:
+            template_name (string): Template name to search for.
+
+        Returns:
+            list: Sorted page identifiers.
+        """
+        postings = [
+            self.roots[name]
+            for name in self.get_referrer_templates(template_name)
+            if name in self.roots
+        ]
+
+        if len(postings) == 1:
+            return list(postings[0])
+
+        return sorted(set().union(*postings))
+
+    def get_destinations_from_template(self, template_name):
+        return set([
+            self.destinations[index]
+            for index in self.get_page_ids_from_template(template_name)
+        ])
+
+    def get_pages_from_template(self, template_name):
+        if not self.has_template(template_name):
+            msg = "Given template name is not registered: {}"
+            self.logger.warning(msg.format(template_name))
+            return []
+
+        return [
+            self.pages[index]
+            for index in self.get_page_ids_from_template(template_name)
+        ]
+
+    def get_pages_from_data(self, data):
+        if data not in self.datas:
+            msg = "Given data is not registered: {}"
+            self.logger.warning(msg.format(data))
+            return []
+
+        return [self.pages[index] for index in self.datas[data]]
+
+    def get_all_destinations(self):
+        return [
+            self.destinations[index]
+            for index, flags in enumerate(self.page_flags)
+            if flags & 1
+        ]
+
+    def get_all_pages(self):
+        return [
+            self.pages[index]
+            for index, flags in enumerate(self.page_flags)
+            if flags & 1
+        ]
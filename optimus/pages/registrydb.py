@@ -0,0 +1,343 @@
+"""
+Registry database
+=================
+
+The registry database persists page registry to a SQLite file so pages are
+registered from it instead of being scanned again on the next builder start. A
+page entry is only used if the page template has not changed and every template
+it depends from has not been modified since the entry has been saved, else page is
+scanned again.
+
+The database is a plain SQLite file which can be queried from other tools without
+importing the project, it has the following tables:
+
+``pages``
+    Page destination (``destination`` column) and its page template name
+    (``template`` column), the latter is empty for pages without template.
+``page_datas``
+    Data file paths (``data`` column) used by page destinations (``destination``
+    column).
+``templates``
+    Template names (``name`` column) with their source file path (``filename``
+    column) and its modification time in nanoseconds (``mtime`` column), both are
+    empty for templates without a source file.
+``template_references``
+    Template names (``template`` column) and the names of templates they directly
+    reference (``reference`` column).
+``meta``
+    Database metadatas, the Optimus version which has written the database is
+    stored in ``version`` item. Database is emptied when version changes.
+
+"""
+import logging
+import os
+import sqlite3
+from contextlib import closing
+
+from jinja2 import TemplateNotFound
+
+from optimus import __version__
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    destination TEXT PRIMARY KEY,
+    template TEXT
+);
+CREATE TABLE IF NOT EXISTS page_datas (
+    destination TEXT,
+    data TEXT,
+    PRIMARY KEY (destination, data)
+);
+CREATE TABLE IF NOT EXISTS templates (
+    name TEXT PRIMARY KEY,
+    filename TEXT,
+    mtime INTEGER
+);
+CREATE TABLE IF NOT EXISTS template_references (
+    template TEXT,
+    reference TEXT,
+    PRIMARY KEY (template, reference)
+);
+"""
+
+
+class RegistryDatabase(object):
+    """
+    Page registry persisted to a SQLite file.
+
+    Arguments:
+        path (string): Path to the SQLite database file.
+
+    Attributes:
+        path (string): Path to the SQLite database file.
+        pages (dict): Saved pages indexed on destinations, each one is a tuple of
+            page template name and sorted data paths.
+        templates (dict): Saved templates indexed on names, each one is a tuple of
+            source file path and its modification time.
+        references (dict): Saved names of directly referenced templates indexed on
+            template names.
+        checked (dict): Validity of saved templates indexed on names, a template
+            is only checked once.
+        changed (dict): Page instances registered from scanning since the last
+            save, indexed on destinations.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+        self.templates = {}
+        self.references = {}
+        self.checked = {}
+        self.changed = {}
+        self.logger = logging.getLogger("optimus")
+
+    def connect(self):
+        """
+        Open a connection to database, creating its tables if needed.
+
+        Returns:
+            sqlite3.Connection: Database connection.
+        """
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+
+        return connection
+
+    def load(self):
+        """
+        Load saved entries from database.
+
+        Database is emptied if it has been written from another Optimus version.
+        """
+        self.pages = {}
+        self.templates = {}
+        self.references = {}
+        self.checked = {}
+
+        with closing(self.connect()) as connection:
+            version = connection.execute(
+                "SELECT value FROM meta WHERE name = 'version'"
+            ).fetchone()
+
+            if version is None or version[0] != __version__:
+                self.clear(connection)
+                return
+
+            for destination, template in connection.execute(
+                "SELECT destination, template FROM pages"
+            ):
+                self.pages[destination] = (template, [])
+
+            for destination, data in connection.execute(
+                "SELECT destination, data FROM page_datas ORDER BY data"
+            ):
+                if destination in self.pages:
+                    self.pages[destination][1].append(data)
+
+            for name, filename, mtime in connection.execute(
+                "SELECT name, filename, mtime FROM templates"
+            ):
+                self.templates[name] = (filename, mtime)
+                self.references[name] = []
+
+            for template, reference in connection.execute(
+                "SELECT template, reference FROM template_references"
+            ):
+                self.references.setdefault(template, []).append(reference)
+
+        msg = "Loaded {} pages from registry database: {}"
+        self.logger.debug(msg.format(len(self.pages), self.path))
+
+    def clear(self, connection):
+        """
+        Remove every entries from database.
+
+        Arguments:
+            connection (sqlite3.Connection): Database connection.
+        """
+        with connection:
+            for table in ("meta", "pages", "page_datas", "templates",
+                          "template_references"):
+                connection.execute("DELETE FROM {}".format(table))
+            connection.execute(
+                "INSERT INTO meta (name, value) VALUES ('version', ?)",
+                (__version__,),
+            )
+
+    def is_valid_template(self, template_name):
+        """
+        Check if a saved template source file has not been modified.
+
+        Arguments:
+            template_name (string): Template name.
+
+        Returns:
+            boolean: ``True`` if template source file has not been modified,
+            ``False`` if it has been modified, if it has no source file or if
+            template has not been saved.
+        """
+        if template_name not in self.checked:
+            filename, mtime = self.templates.get(template_name, (None, None))
+
+            valid = False
+            if filename:
+                try:
+                    valid = os.stat(filename).st_mtime_ns == mtime
+                except OSError:
+                    pass
+
+            self.checked[template_name] = valid
+
+        return self.checked[template_name]
+
+    def get_page(self, page):
+        """
+        Get page templates from its saved entry.
+
+        Arguments:
+            page (optimus.pages.views.PageViewBase): Page instance.
+
+        Returns:
+            tuple: Page templates, the first one is the page template, and names of
+            templates directly referenced indexed on template names, like expected
+            from ``PageRegistry.add_page``. It is ``None`` if page has no saved
+            entry or if its entry is outdated.
+        """
+        entry = self.pages.get(page.get_destination())
+        if entry is None:
+            return None
+
+        root = None
+        if hasattr(page, "get_template_name"):
+            root = page.get_template_name()
+
+        if root != entry[0]:
+            return None
+
+        templates = []
+        references = {}
+        pending = [root] if root else []
+
+        while pending:
+            name = pending.pop(0)
+            if name in references:
+                continue
+            if not self.is_valid_template(name):
+                return None
+
+            templates.append(name)
+            references[name] = self.references[name]
+            pending.extend(self.references[name])
+
+        return templates, references
+
+    def add_page(self, page, scanned=True):
+        """
+        Mark a registered page to be written on the next save.
+
+        Arguments:
+            page (optimus.pages.views.PageViewBase): Page instance.
+
+        Keyword Arguments:
+            scanned (boolean): If ``False``, page has been registered from its saved
+                entry and it is only written if its datas have changed. Default to
+                ``True``.
+        """
+        destination = page.get_destination()
+        datas = sorted(set(page.get_datas()))
+
+        if not scanned and self.pages[destination][1] == datas:
+            return
+
+        self.changed[destination] = page
+
+    def get_template_source(self, env, template_name):
+        """
+        Get template source file path and its modification time.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+            template_name (string): Template name.
+
+        Returns:
+            tuple: Source file path and modification time, both are ``None`` if
+            template has no source file.
+        """
+        if self.is_valid_template(template_name):
+            return self.templates[template_name]
+
+        try:
+            filename = env.loader.get_source(env, template_name)[1]
+        except TemplateNotFound:
+            filename = None
+
+        if filename and os.path.exists(filename):
+            return filename, os.stat(filename).st_mtime_ns
+
+        return None, None
+
+    def save(self, registry, env):
+        """
+        Write pages registered from scanning since the last save and every
+        registry templates to database.
+
+        Arguments:
+            registry (optimus.pages.registry.PageRegistry): Page registry.
+            env (jinja2.Jinja2Environment): Jinja environment to find template
+                source files.
+        """
+        if not self.changed:
+            return
+
+        msg = "Writing {} pages to registry database: {}"
+        self.logger.debug(msg.format(len(self.changed), self.path))
+
+        with closing(self.connect()) as connection, connection:
+            for destination, page in self.changed.items():
+                template = registry.get_page_template(destination)
+                datas = sorted(set(page.get_datas()))
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO pages (destination, template) "
+                    "VALUES (?, ?)",
+                    (destination, template),
+                )
+                connection.execute(
+                    "DELETE FROM page_datas WHERE destination = ?", (destination,)
+                )
+                connection.executemany(
+                    "INSERT INTO page_datas (destination, data) VALUES (?, ?)",
+                    [(destination, data) for data in datas],
+                )
+                self.pages[destination] = (template, datas)
+
+            for name, items in registry.references.items():
+                source = self.get_template_source(env, name)
+                if name not in self.templates or source != self.templates[name]:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO templates (name, filename, mtime) "
+                        "VALUES (?, ?, ?)",
+                        (name,) + source,
+                    )
+                    self.templates[name] = source
+                    self.checked.pop(name, None)
+
+                if set(items) != set(self.references.get(name, [])):
+                    connection.execute(
+                        "DELETE FROM template_references WHERE template = ?",
+                        (name,),
+                    )
+                    connection.executemany(
+                        "INSERT INTO template_references (template, reference) "
+                        "VALUES (?, ?)",
+                        [(name, item) for item in sorted(items)],
+                    )
+                    self.references[name] = sorted(items)
+
+        self.changed = {}
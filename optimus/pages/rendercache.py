@@ -0,0 +1,96 @@
+"""
+Render cache
+============
+
+The render cache stores rendered page contents in a local directory under a key
+computed from every page input, so a later build can reuse them instead of
+rendering pages again.
+
+Keys do not depend on the project location, the cache directory can be shared
+between checkouts of a project, like a continuous integration cache directory
+restored on a fresh runner.
+
+"""
+import io
+import logging
+import os
+import uuid
+
+
+class RenderCache(object):
+    """
+    Content addressed cache of rendered page contents.
+
+    Contents are stored in files named from their key and distributed in
+    subdirectories named from the two first key characters. Files are always
+    written through a temporary file so concurrent builds never read a partial
+    content.
+
+    Arguments:
+        directory (string): Path to the cache directory, it is created if it does
+            not exist yet.
+
+    Attributes:
+        directory (string): Path to the cache directory.
+        logger (logging.Logger): Optimus logger.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.logger = logging.getLogger("optimus")
+
+    def get_path(self, key):
+        """
+        Get the file path for a cache key.
+
+        Arguments:
+            key (string): Cache key, an hexadecimal digest.
+
+        Returns:
+            string: File path.
+        """
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """
+        Get the cached content for a key.
+
+        Arguments:
+            key (string): Cache key.
+
+        Returns:
+            bytes: Cached content or ``None`` if key is not in cache.
+        """
+        try:
+            with io.open(self.get_path(key), "rb") as fp:
+                return fp.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, path):
+        """
+        Store a file content in cache.
+
+        Arguments:
+            key (string): Cache key.
+            path (string): Path of the file to store.
+        """
+        cache_path = self.get_path(key)
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        temp_path = os.path.join(
+            cache_dir, ".{}.{}.tmp".format(key, uuid.uuid4().hex)
+        )
+
+        try:
+            with io.open(path, "rb") as source, io.open(temp_path, "xb") as fp:
+                for chunk in iter(lambda: source.read(65536), b""):
+                    fp.write(chunk)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.logger.debug(" - Stored in render cache: {}".format(cache_path))
+        os.replace(temp_path, cache_path)
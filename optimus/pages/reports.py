@@ -0,0 +1,182 @@
+"""
+Build reports
+=============
+
+Helpers to exploit page timings recorded by the builder, to find the slowest pages
+and templates from a build.
+
+A page timing is a dictionnary with the following items:
+
+destination
+    Page destination relative to the publish directory.
+view
+    Python path of the page view class.
+template
+    Page template name or ``None`` for views without template.
+context
+    Time in seconds spent to build the page context.
+render
+    Time in seconds spent to render the page content, without the context time.
+write
+    Time in seconds spent to write the page content.
+total
+    Sum of the context, render and write times.
+length
+    Rendered content length in characters.
+size
+    Written content size in bytes.
+
+"""
+import json
+
+from optimus.exceptions import DestinationCollisionError
+from optimus.utils.jsons import ExtendedJsonEncoder
+
+
+TIMING_FIELDS = ("context", "render", "write", "total")
+
+
+def get_slowest_pages(timings, limit=10):
+    """
+    Get the slowest pages from page timings.
+
+    Arguments:
+        timings (list): List of page timings.
+
+    Keyword Arguments:
+        limit (integer): Maximum number of pages to return.
+
+    Returns:
+        list: Page timings sorted from the slowest to the fastest page.
+    """
+    return sorted(timings, key=lambda item: item["total"], reverse=True)[:limit]
+
+
+def get_template_timings(timings):
+    """
+    Aggregate page timings on their template.
+
+    Pages without template are ignored.
+
+    Arguments:
+        timings (list): List of page timings.
+
+    Returns:
+        dict: Aggregated timings indexed on template names, sorted from the slowest
+        to the fastest template. Each aggregate has the number of pages
+        (``pages`` item) and the sum of every timing fields.
+    """
+    templates = {}
+
+    for item in timings:
+        if item["template"] is None:
+            continue
+
+        aggregate = templates.setdefault(
+            item["template"],
+            dict({"pages": 0}, **{name: 0.0 for name in TIMING_FIELDS}),
+        )
+        aggregate["pages"] += 1
+        for name in TIMING_FIELDS:
+            aggregate[name] += item[name]
+
+    return dict(
+        sorted(templates.items(), key=lambda item: item[1]["total"], reverse=True)
+    )
+
+
+def get_build_report(timings, destinations=None, shard=None):
+    """
+    Get a build report from page timings.
+
+    Arguments:
+        timings (list): List of page timings.
+
+    Keyword Arguments:
+        destinations (list): Every page destinations from build, including the
+            reused and unchanged ones which have no timing. Default to ``None``.
+        shard (tuple): Shard number and number of shards of build, if any.
+            Default to ``None``.
+
+    Returns:
+        dict: Build report with the sum of every timing fields (``total`` item),
+        the aggregated template timings (``templates`` item), the page timings
+        sorted from the slowest to the fastest page (``pages`` item), the sorted
+        page destinations (``destinations`` item) and the build shard (``shard``
+        item).
+    """
+    return {
+        "shard": list(shard) if shard else None,
+        "total": {
+            name: sum([item[name] for item in timings]) for name in TIMING_FIELDS
+        },
+        "templates": get_template_timings(timings),
+        "pages": get_slowest_pages(timings, limit=len(timings)),
+        "destinations": sorted(destinations or []),
+    }
+
+
+def write_build_report(path, timings, destinations=None, shard=None):
+    """
+    Write a build report to a JSON file.
+
+    Arguments:
+        path (string): Report file path.
+        timings (list): List of page timings.
+
+    Keyword Arguments:
+        destinations (list): Every page destinations from build. Default to
+            ``None``.
+        shard (tuple): Shard number and number of shards of build, if any.
+            Default to ``None``.
+
+    Returns:
+        dict: Written build report.
+    """
+    report = get_build_report(timings, destinations=destinations, shard=shard)
+
+    with open(path, "w") as fp:
+        json.dump(report, fp, indent=4, cls=ExtendedJsonEncoder)
+
+    return report
+
+
+def merge_build_reports(reports):
+    """
+    Merge build reports from sharded builds into a single build report.
+
+    Arguments:
+        reports (list): Build reports to merge.
+
+    Raises:
+        DestinationCollisionError: If a destination has been built from more than
+        one report.
+
+    Returns:
+        dict: Merged build report, its ``shard`` item is ``None`` and it has an
+        additional ``shards`` item with the shard of every merged reports.
+    """
+    timings = []
+    builders = {}
+
+    for report in reports:
+        timings.extend(report["pages"])
+        for destination in report["destinations"]:
+            builders.setdefault(destination, []).append(report["shard"])
+
+    collisions = {
+        destination: shards
+        for destination, shards in builders.items()
+        if len(shards) > 1
+    }
+    if collisions:
+        msg = "Some destinations have been built more than once: {}"
+        raise DestinationCollisionError(
+            msg.format(", ".join(sorted(collisions))),
+            collisions=collisions,
+        )
+
+    merged = get_build_report(timings, destinations=list(builders))
+    merged["shards"] = [report["shard"] for report in reports]
+
+    return merged
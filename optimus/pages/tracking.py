@@ -0,0 +1,75 @@
+"""
+Dependency tracking
+===================
+
+The tracking environment is a Jinja environment which records the templates loaded
+while a page is rendered, including the templates loaded from ``extends``,
+``include`` and ``import`` tags. Recorded dependencies are exact, even for
+templates loaded from a variable name that page introspection can not find.
+
+"""
+from jinja2 import Environment as Jinja2Environment
+
+
+class TrackingEnvironment(Jinja2Environment):
+    """
+    Jinja environment which records loaded templates while tracking is active.
+
+    Attributes:
+        tracked (dict): Names of templates directly loaded from a template, indexed
+            on names of every loaded templates in their loading order. It is
+            ``None`` when tracking is not active.
+    """
+
+    tracked = None
+
+    def start_tracking(self):
+        """
+        Start to record loaded templates, forgetting the previously recorded ones.
+        """
+        self.tracked = {}
+
+    def stop_tracking(self):
+        """
+        Stop to record loaded templates.
+
+        Returns:
+            dict: Recorded templates, see ``tracked`` attribute.
+        """
+        tracked = self.tracked or {}
+        self.tracked = None
+
+        return tracked
+
+    def track(self, template_name, parent=None):
+        """
+        Record a loaded template.
+
+        Arguments:
+            template_name (string): Loaded template name.
+
+        Keyword Arguments:
+            parent (string): Name of the template which has loaded it, if any.
+        """
+        self.tracked.setdefault(template_name, [])
+
+        if parent is not None:
+            references = self.tracked.setdefault(parent, [])
+            if template_name not in references:
+                references.append(template_name)
+
+    def get_template(self, name, parent=None, globals=None):
+        template = super().get_template(name, parent=parent, globals=globals)
+
+        if self.tracked is not None:
+            self.track(template.name, parent=parent)
+
+        return template
+
+    def select_template(self, names, parent=None, globals=None):
+        template = super().select_template(names, parent=parent, globals=globals)
+
+        if self.tracked is not None:
+            self.track(template.name, parent=parent)
+
+        return template
@@ -1,8 +1,12 @@
 import logging
 import os
+import time
+from collections import ChainMap
+from types import MappingProxyType
 
 from ...exceptions import ViewImproperlyConfigured
 from ...i18n.lang import LangBase
+from ..datas import DataLoader
 
 
 class PageViewBase:
@@ -31,6 +35,13 @@ class PageViewBase:
     not be overriden from the ``context`` class attribute, only from the
     ``get_context`` class method.
 
+    The ``context`` attribute given on class or init is a read-only default
+    context which is never modified. On init, the ``context`` instance attribute
+    is set to a page layer over the default context where page variables are set,
+    so variables from a page never leak to another page, even for pages rendered
+    concurrently. A new ``context`` assigned to instance becomes the default
+    context of a new page layer on the next ``get_context`` call.
+
     View need settings to be defined either as argument on instance init or
     later through attribute setter.
 
@@ -44,10 +55,28 @@ class PageViewBase:
             these files to perform a rendering build, they should be defined here so
             the watcher will be able to know them and trigger a new build when
             these files are modified.
-        context (dict): Initial page view context.
+        context (dict): Initial page view context. Once view is initialized, it
+            is a ``collections.ChainMap`` of page variables over the read-only
+            initial context.
+        streaming (boolean): If enabled, the builder renders the page with
+            ``render_stream()`` and writes its content chunks as they come,
+            instead of rendering the whole content with ``render()``. Default
+            to ``False``.
         logger (logging.Logger): Optimus logger.
+        data_loader (optimus.pages.datas.DataLoader): Data loader used from
+            ``load_data()``. It is connected by the builder to share parsed data
+            between every page. Default to ``None``.
+        context_time (float): Time in seconds spent to build context from the last
+            ``get_timed_context()`` call. Default to ``0.0``.
         _used_templates (list): List of every used templates. Only filled when
-            ``introspect()`` method is executed. Default to ``None``.
+            ``introspect()`` method is executed with an environment without
+            builder introspection cache. Default to ``None``.
+        _template_references (dict): Names of templates directly referenced,
+            indexed on every used template names. Filled like
+            ``_used_templates``. Default to ``None``.
+        _dynamic_templates (list): Names of used templates which reference
+            templates from a variable, like ``{% include partial %}``. Filled like
+            ``_used_templates``. Default to ``None``.
         __settings (conf.model.SettingsModel): Settings registry instance when
             given in kwargs. Default to ``None``.
 
@@ -61,10 +90,15 @@ class PageViewBase:
     lang = None
     context = {}
     datas = []
+    streaming = False
+    data_loader = None
     _required_page_attributes = ["title", "destination"]
 
     def __init__(self, **kwargs):
         self._used_templates = None
+        self._template_references = None
+        self._dynamic_templates = None
+        self.context_time = 0.0
         self.logger = logging.getLogger("optimus")
         self.__settings = kwargs.pop("settings", None)
 
@@ -74,6 +108,9 @@ class PageViewBase:
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+        # Page layer over a read-only view on initial context, without any copy
+        self.set_page_context()
+
         self.validate()
 
     def __str__(self):
@@ -189,6 +226,29 @@ class PageViewBase:
         """
         return self.datas
 
+    def load_data(self, path):
+        """
+        Load parsed data from a data file.
+
+        Data files are parsed once and cached by the data loader, parsed data are
+        shared between pages so they must not be modified. Data files should also
+        be listed in ``datas`` attribute so the watcher knows about them.
+
+        Arguments:
+            path (string): Data file path, relative paths are resolved from
+                setting ``DATAS_DIR``.
+
+        Returns:
+            object: Parsed data.
+        """
+        if self.data_loader is None:
+            self.data_loader = DataLoader(
+                basedir=self.settings.DATAS_DIR,
+                parsers=getattr(self.settings, "DATAS_PARSERS", {}),
+            )
+
+        return self.data_loader.load(path)
+
     def get_relative_position(self):
         """
         Get relative path position from the destination file to the root.
@@ -200,13 +260,28 @@ class PageViewBase:
         """
         return (len(self.get_destination().split("/")) - 1) * "../" or "./"
 
+    def set_page_context(self):
+        """
+        Set ``context`` attribute to a new page layer over the current ``context``
+        attribute used as the read-only initial context.
+        """
+        self._default_context = MappingProxyType(self.context)
+        self.context = self._page_context = ChainMap({}, self._default_context)
+
     def get_context(self):
         """
         Get view context.
 
+        Variables are set into the page layer, so a subclass may update
+        ``context`` before calling this method. If ``context`` attribute has been
+        assigned, it is the initial context of a new page layer.
+
         Returns:
-            dict: Template context of variables.
+            collections.ChainMap: Template context of variables.
         """
+        if self.context is not self._page_context:
+            self.set_page_context()
+
         self.context.update(
             {
                 "page_title": self.get_title(),
@@ -221,6 +296,23 @@ class PageViewBase:
 
         return self.context
 
+    def get_timed_context(self):
+        """
+        Get view context from ``get_context()`` and record the time spent to build
+        it in attribute ``context_time``.
+
+        Rendering methods should use it instead of ``get_context()`` so the builder
+        is able to distinguish context time from render time.
+
+        Returns:
+            dict: Template context of variables.
+        """
+        started = time.perf_counter()
+        context = self.get_context()
+        self.context_time = time.perf_counter() - started
+
+        return context
+
     def render(self, env):
         """
         Base rendering method does not render anything and always return an empty
@@ -240,6 +332,21 @@ class PageViewBase:
 
         return ""
 
+    def render_stream(self, env):
+        """
+        Render page content as an iterable of string chunks.
+
+        Base implementation just yields the content from ``render()`` as a single
+        chunk, views have to implement it to really stream their content.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+
+        Returns:
+            iterable: Content chunks.
+        """
+        yield self.render(env)
+
     def introspect(self, env):
         """
         Dummy introspect method for base view required for internal code like watchers
@@ -255,3 +362,29 @@ class PageViewBase:
             list: Empty list.
         """
         return []
+
+    def get_template_references(self, env):
+        """
+        Dummy method for base view to get the templates directly referenced by
+        every used templates.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+
+        Returns:
+            dict: Empty dict.
+        """
+        return {}
+
+    def get_dynamic_templates(self, env):
+        """
+        Dummy method for base view to get the used templates which reference
+        templates from a variable.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+
+        Returns:
+            list: Empty list.
+        """
+        return []
@@ -30,25 +30,54 @@ class PageTemplateView(PageViewBase):
         """
         return self.template_name.format(language_code=self.get_lang().code)
 
-    def _recurse_template_search(self, env, template_name):
+    def _recurse_template_search(self, env, template_name, references=None,
+                                 dynamic=None):
         """
         Load involved template sources from given template file path then find
         their template references.
 
+        References which can not be resolved from template sources, like a template
+        included from a variable, are ignored.
+
         Arguments:
             env (jinja2.Jinja2Environment): Jinja environment.
             template_name (string): Template file path.
 
+        Keyword Arguments:
+            references (dict): If given, it is filled with the names of templates
+                directly referenced, indexed on every involved template names. With
+                the builder introspection cache, they are the cache lists shared by
+                every pages so they must not be modified.
+            dynamic (list): If given, it is filled with the names of involved
+                templates which have references that can not be resolved.
+
         Returns:
             list: List of involved templates sources files.
         """
-        template_source = env.loader.get_source(env, template_name)[0]
-        parsed_content = env.parse(template_source)
+        # Use the builder introspection cache if any
+        introspection = getattr(env, "optimus_introspection", None)
+        if introspection is not None:
+            found = introspection.get_references(env, template_name)
+            unresolved = introspection.is_dynamic(template_name)
+        else:
+            template_source = env.loader.get_source(env, template_name)[0]
+            parsed_content = env.parse(template_source)
+            found = list(Jinja2Meta.find_referenced_templates(parsed_content))
+            unresolved = None in found
+            found = [item for item in found if item is not None]
+
+        if references is not None:
+            references[template_name] = found
+
+        if unresolved and dynamic is not None:
+            dynamic.append(template_name)
 
         deps = []
-        for item in Jinja2Meta.find_referenced_templates(parsed_content):
+        for item in found:
             deps.append(item)
-            deps += self._recurse_template_search(env, item)
+            deps += self._recurse_template_search(
+                env, item, references=references, dynamic=dynamic
+            )
 
         return deps
 
@@ -57,7 +86,7 @@ class PageTemplateView(PageViewBase):
         Augment method from base view to insert variables related to templates.
 
         Returns:
-            dict: Template context of variables.
+            collections.ChainMap: Template context of variables.
         """
         super().get_context()
 
@@ -71,6 +100,50 @@ class PageTemplateView(PageViewBase):
 
         return self.context
 
+    def _introspect(self, env):
+        """
+        Find every templates dependancies from page.
+
+        Introspection is kept on page only when the environment has no builder
+        introspection cache, else it is done again from the cache on every call so
+        it follows template changes from a build to another.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+
+        Returns:
+            tuple: List of involved templates, names of templates directly
+            referenced indexed on involved template names and names of involved
+            templates which reference templates from a variable.
+        """
+        if self._used_templates is not None:
+            return (
+                self._used_templates,
+                self._template_references,
+                self._dynamic_templates,
+            )
+
+        self.env = env
+
+        references = {}
+        dynamic = []
+        found = self._recurse_template_search(
+            env,
+            self.get_template_name(),
+            references=references,
+            dynamic=dynamic,
+        )
+        used_templates = [self.get_template_name()] + found
+
+        self.logger.debug(" - Used templates: {}".format(used_templates))
+
+        if getattr(env, "optimus_introspection", None) is None:
+            self._used_templates = used_templates
+            self._template_references = references
+            self._dynamic_templates = dynamic
+
+        return used_templates, references, dynamic
+
     def introspect(self, env):
         """
         Take the Jinja2 environment as required argument to find every
@@ -82,16 +155,34 @@ class PageTemplateView(PageViewBase):
         Returns:
             list: List of involved templates sources files.
         """
-        if self._used_templates is None:
-            self.env = env
+        return self._introspect(env)[0]
+
+    def get_template_references(self, env):
+        """
+        Get the templates directly referenced by every used templates.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
 
-            found = self._recurse_template_search(env, self.get_template_name())
+        Returns:
+            dict: Names of templates directly referenced, indexed on every used
+            template names. Reference lists may be shared with other pages and
+            must not be modified.
+        """
+        return self._introspect(env)[1]
 
-            self._used_templates = [self.get_template_name()] + found
+    def get_dynamic_templates(self, env):
+        """
+        Get the used templates which reference templates from a variable, their
+        referenced templates can not be known without to render page.
 
-            self.logger.debug(" - Used templates: {}".format(self._used_templates))
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
 
-        return self._used_templates
+        Returns:
+            list: Template names.
+        """
+        return self._introspect(env)[2]
 
     def render(self, env):
         """
@@ -104,8 +195,25 @@ class PageTemplateView(PageViewBase):
             string: HTML builded from page template with its context.
         """
         super().render(env)
-        context = self.get_context()
+        context = self.get_timed_context()
 
         template = self.env.get_template(self.get_template_name())
 
         return template.render(lang=self.get_lang(), **context)
+
+    def render_stream(self, env):
+        """
+        Take the Jinja2 environment as required argument.
+
+        Arguments:
+            env (jinja2.Jinja2Environment): Jinja environment.
+
+        Returns:
+            generator: HTML chunks generated from page template with its context.
+        """
+        super().render(env)
+        context = self.get_timed_context()
+
+        template = self.env.get_template(self.get_template_name())
+
+        return template.generate(lang=self.get_lang(), **context)
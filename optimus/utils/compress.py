@@ -0,0 +1,168 @@
+import gzip
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+def get_sidecar_path(path):
+    """
+    Get the path of gzip sidecar file for a file.
+
+    Arguments:
+        path (str): File path.
+
+    Returns:
+        str: Sidecar file path.
+    """
+    return path + ".gz"
+
+
+def need_sidecar(path, min_size=0):
+    """
+    Check if a file needs a new gzip sidecar file.
+
+    Arguments:
+        path (str): File path.
+
+    Keyword Arguments:
+        min_size (int): Minimal file size in bytes to compress. Default to ``0``.
+
+    Returns:
+        bool: ``False`` if file is smaller than minimal size or if its sidecar
+        file is newer than the file, else ``True``.
+    """
+    stat = os.stat(path)
+    if stat.st_size < min_size:
+        return False
+
+    try:
+        sidecar_stat = os.stat(get_sidecar_path(path))
+    except FileNotFoundError:
+        return True
+
+    return sidecar_stat.st_mtime < stat.st_mtime
+
+
+def compress_file(path, level=9):
+    """
+    Write a gzip sidecar file for a file.
+
+    Sidecar is written to a temporary file then renamed, so a reader never get a
+    truncated sidecar. The file modification time is stored in the gzip header so
+    the sidecar content is reproducible.
+
+    Arguments:
+        path (str): File path.
+
+    Keyword Arguments:
+        level (int): Compression level from ``1`` to ``9``. Default to ``9``.
+
+    Returns:
+        str: Sidecar file path.
+    """
+    sidecar_path = get_sidecar_path(path)
+    directory, filename = os.path.split(sidecar_path)
+    temp_path = os.path.join(
+        directory, ".{}.{}.tmp".format(filename, uuid.uuid4().hex)
+    )
+
+    try:
+        with open(path, "rb") as source, open(temp_path, "xb") as fp:
+            with gzip.GzipFile(
+                filename=os.path.basename(path),
+                mode="wb",
+                compresslevel=level,
+                fileobj=fp,
+                mtime=int(os.fstat(source.fileno()).st_mtime),
+            ) as archive:
+                for chunk in iter(lambda: source.read(65536), b""):
+                    archive.write(chunk)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    os.replace(temp_path, sidecar_path)
+
+    return sidecar_path
+
+
+def find_files(directory, extensions=None):
+    """
+    Recursively find files from a directory.
+
+    Gzip files are always ignored.
+
+    Arguments:
+        directory (str): Directory path to search.
+
+    Keyword Arguments:
+        extensions (list): File extensions to retain, like ``.css``. If empty,
+            every files are retained. Default to ``None``.
+
+    Returns:
+        list: Sorted file paths.
+    """
+    found = []
+
+    for root, dirs, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith(".gz"):
+                continue
+            if extensions and not filename.endswith(tuple(extensions)):
+                continue
+            found.append(os.path.join(root, filename))
+
+    return sorted(found)
+
+
+def compress_files(paths, min_size=0, level=9, jobs=None):
+    """
+    Write gzip sidecar files for given files in a pool of worker threads.
+
+    Files which do not need a new sidecar (see ``need_sidecar``) are skipped and
+    an existing sidecar from a file smaller than minimal size is removed since it
+    is outdated. Compression is done with ``zlib`` which releases the GIL so threads are
+    compressing files in parallel.
+
+    Arguments:
+        paths (list): File paths to compress.
+
+    Keyword Arguments:
+        min_size (int): Minimal file size in bytes to compress. Default to ``0``.
+        level (int): Compression level from ``1`` to ``9``. Default to ``9``.
+        jobs (int): Number of worker threads. Default to ``None`` to let the pool
+            choose it from the number of processors.
+
+    Returns:
+        list: Written sidecar file paths.
+    """
+    logger = logging.getLogger("optimus")
+
+    retained = []
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+
+        if need_sidecar(path, min_size=min_size):
+            retained.append(path)
+        elif os.path.getsize(path) < min_size:
+            sidecar_path = get_sidecar_path(path)
+            if os.path.exists(sidecar_path):
+                os.remove(sidecar_path)
+                logger.debug(" - Removed outdated: {}".format(sidecar_path))
+
+    paths = retained
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        compressed = list(
+            executor.map(lambda path: compress_file(path, level=level), paths)
+        )
+
+    for path in compressed:
+        logger.debug(" - Compressed to: {}".format(path))
+
+    return compressed
@@ -58,6 +58,9 @@ class DatasWatchEventHandler(BaseHandler, PatternMatchingEventHandler):
             msg = "--- Changes detected on: {} ---"
             self.logger.warning(msg.format(rel_path))
 
+            # Parsed data from previous builds are outdated
+            self.builder.data_loader.invalidate(path)
+
             requires = self.builder.registry.get_pages_from_data(rel_path)
 
             self.logger.debug("Requires for rebuild: {}".format(requires))
@@ -56,7 +56,7 @@ class TemplatesWatchEventHandler(BaseHandler, PatternMatchingEventHandler):
         rel_path = self.get_relative_template_path(path)
         built = []
         # Search in the registry if the file is a knowed template dependancy
-        if rel_path in self.builder.registry.templates:
+        if self.builder.registry.has_template(rel_path):
             msg = "--- Changes detected on: {} ---"
             self.logger.warning(msg.format(rel_path))
 
@@ -0,0 +1,101 @@
+import gzip
+import os
+
+from optimus.utils.compress import (
+    compress_file,
+    compress_files,
+    find_files,
+    get_sidecar_path,
+    need_sidecar,
+)
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(content)
+
+
+def test_compress_file(temp_builds_dir):
+    """
+    Sidecar should be a gzip file of the source content.
+    """
+    basepath = temp_builds_dir.join("compress_file")
+    source = os.path.join(basepath.strpath, "index.html")
+    write(source, "<p>Hello</p>" * 100)
+
+    assert need_sidecar(source) is True
+
+    sidecar = compress_file(source)
+
+    assert sidecar == get_sidecar_path(source) == source + ".gz"
+    with gzip.open(sidecar, "rt") as fp:
+        assert fp.read() == "<p>Hello</p>" * 100
+
+    assert sorted(os.listdir(basepath.strpath)) == ["index.html", "index.html.gz"]
+
+
+def test_need_sidecar(temp_builds_dir):
+    """
+    Files smaller than minimal size or with a newer sidecar do not need a sidecar.
+    """
+    basepath = temp_builds_dir.join("need_sidecar")
+    source = os.path.join(basepath.strpath, "app.css")
+    write(source, "body{color:red}")
+
+    assert need_sidecar(source, min_size=1024) is False
+    assert need_sidecar(source, min_size=10) is True
+
+    sidecar = compress_file(source)
+    assert need_sidecar(source) is False
+
+    # Source modified after its sidecar
+    mtime = os.stat(sidecar).st_mtime
+    os.utime(source, (mtime + 10, mtime + 10))
+    assert need_sidecar(source) is True
+
+
+def test_find_files(temp_builds_dir):
+    """
+    Find files recursively filtered on extensions, except gzip files.
+    """
+    basepath = temp_builds_dir.join("compress_find_files")
+    write(os.path.join(basepath.strpath, "css", "app.css"), "")
+    write(os.path.join(basepath.strpath, "css", "app.css.gz"), "")
+    write(os.path.join(basepath.strpath, "js", "app.js"), "")
+    write(os.path.join(basepath.strpath, "images", "logo.png"), "")
+
+    assert find_files(basepath.strpath) == [
+        os.path.join(basepath.strpath, "css", "app.css"),
+        os.path.join(basepath.strpath, "images", "logo.png"),
+        os.path.join(basepath.strpath, "js", "app.js"),
+    ]
+
+    assert find_files(basepath.strpath, [".css", ".js"]) == [
+        os.path.join(basepath.strpath, "css", "app.css"),
+        os.path.join(basepath.strpath, "js", "app.js"),
+    ]
+
+
+def test_compress_files(temp_builds_dir):
+    """
+    Only files which need a sidecar are compressed.
+    """
+    basepath = temp_builds_dir.join("compress_files")
+    big = os.path.join(basepath.strpath, "big.html")
+    small = os.path.join(basepath.strpath, "small.html")
+    missing = os.path.join(basepath.strpath, "missing.html")
+    write(big, "Foo" * 1000)
+    write(small, "Foo")
+
+    assert compress_files([big, small, missing], min_size=100, jobs=2) == [
+        big + ".gz",
+    ]
+
+    # Sidecar is newer than source
+    assert compress_files([big, small], min_size=100) == []
+
+    # Sidecar from a file which became too small is removed
+    write(big, "Foo")
+    assert compress_files([big], min_size=100) == []
+    assert os.path.exists(big + ".gz") is False
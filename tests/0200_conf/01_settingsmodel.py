@@ -141,8 +141,30 @@ def test_apply_defaults():
 
     assert settings.JINJA_FILTERS == {}
 
+    assert settings.JINJA_BYTECODE_CACHE is None
+
+    assert settings.JINJA_PRECOMPILED is None
+
+    assert settings.JINJA_INTROSPECTION_CACHE is None
+
     assert settings.WEBASSETS_CACHE == os.path.join(projectdir, ".webassets-cache")
 
+    assert settings.BUILD_MANIFEST == os.path.join(
+        projectdir, ".build-manifest.json"
+    )
+
+    assert settings.BUILD_HOOKS == {}
+
+    assert settings.BUILD_DURABILITY is None
+
+    assert settings.GZIP_SIDECARS is False
+
+    assert settings.POST_RENDER_PROCESSORS == []
+
+    assert settings.DATAS_PARSERS == {}
+
+    assert settings.RENDER_CACHE is None
+
     assert settings.LOCALES_DIR == os.path.join(projectdir, "locale")
 
     assert settings.PAGES_MAP == "pages"
@@ -365,6 +365,85 @@ def test_get_context_nonempty():
     }
 
 
+def test_get_context_isolation():
+    """
+    Context variables set for a page should not leak to other pages nor to the
+    initial context.
+    """
+    settings = DummySettings()
+
+    class DummyView(PageTemplateView):
+        context = {
+            "myvar": True,
+        }
+
+        def get_context(self):
+            super().get_context()
+            if self.title == "Foo":
+                self.context.update({"foo": True})
+            return self.context
+
+    foo = DummyView(
+        title="Foo",
+        destination="foo.html",
+        template_name="foo.html",
+        settings=settings,
+    )
+    bar = DummyView(
+        title="Bar",
+        destination="bar.html",
+        template_name="bar.html",
+        settings=settings,
+    )
+
+    assert foo.get_context()["foo"] is True
+    assert "foo" not in bar.get_context()
+    assert bar.get_context()["myvar"] is True
+
+    assert foo.context is not bar.context
+    assert DummyView.context == {"myvar": True}
+
+    # Initial context can not be modified from view
+    with pytest.raises(TypeError):
+        foo._default_context["myvar"] = False
+
+    # Context assigned after instanciation is the new initial context
+    bar.context = {"bar": True}
+    assert bar.get_context()["bar"] is True
+    assert "myvar" not in bar.get_context()
+    assert "foo" not in bar.get_context()
+    assert DummyView.context == {"myvar": True}
+
+    # Context updated before calling the base method
+    class EarlyView(PageTemplateView):
+        context = {
+            "myvar": True,
+        }
+
+        def get_context(self):
+            self.context.update({"early": self.title})
+            return super().get_context()
+
+    early = EarlyView(
+        title="Early",
+        destination="early.html",
+        template_name="early.html",
+        settings=settings,
+    )
+    late = EarlyView(
+        title="Late",
+        destination="late.html",
+        template_name="late.html",
+        settings=settings,
+    )
+
+    assert early.get_context()["early"] == "Early"
+    assert late.get_context()["early"] == "Late"
+    assert early.get_context()["early"] == "Early"
+    assert EarlyView.context == {"myvar": True}
+    assert PageTemplateView.context == {}
+
+
 def test_render(temp_builds_dir):
     """
     Render a basic page
@@ -412,6 +491,11 @@ def test_render(temp_builds_dir):
 
     assert view.render(jinja_env) == "<html><body>Hello World!</body></html>"
 
+    # Streamed render yields the same content in chunks
+    chunks = list(view.render_stream(jinja_env))
+    assert len(chunks) > 1
+    assert "".join(chunks) == "<html><body>Hello World!</body></html>"
+
 
 def test_introspect(temp_builds_dir):
     """
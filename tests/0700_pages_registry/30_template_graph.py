@@ -0,0 +1,124 @@
+import logging
+
+from jinja2 import DictLoader
+from jinja2 import Environment as Jinja2Environment
+
+from optimus.pages.views import PageTemplateView
+from optimus.pages.registry import PageRegistry
+
+
+class DummySettings:
+    """
+    Dummy object with needed settings
+    """
+    LANGUAGE_CODE = "en"
+
+
+TEMPLATES = {
+    "skeleton.html": "<html>{% block content %}{% endblock %}</html>",
+    "index.html": (
+        "{% extends 'skeleton.html' %}"
+        "{% block content %}{% include '_menu.html' %}{% endblock %}"
+    ),
+    "article.html": (
+        "{% extends 'skeleton.html' %}"
+        "{% import '_macros.html' as macros %}"
+        "{% block content %}{% include '_menu.html' %}{% endblock %}"
+    ),
+    "_menu.html": "{% include '_link.html' %}",
+    "_link.html": "<a>",
+    "_macros.html": "{% macro foo() %}{% endmacro %}",
+    "unused.html": "Nope",
+}
+
+
+def get_view(destination, template_name):
+    return PageTemplateView(
+        title=destination,
+        destination=destination,
+        template_name=template_name,
+        settings=DummySettings(),
+    )
+
+
+def test_template_graph(caplog):
+    """
+    Registry should store template references and find pages from reverse
+    traversal.
+    """
+    jinja_env = Jinja2Environment(loader=DictLoader(TEMPLATES))
+
+    index_view = get_view("index.html", "index.html")
+    foo_view = get_view("foo.html", "article.html")
+    bar_view = get_view("bar.html", "article.html")
+
+    assert index_view.get_template_references(jinja_env) == {
+        "index.html": ["skeleton.html", "_menu.html"],
+        "skeleton.html": [],
+        "_menu.html": ["_link.html"],
+        "_link.html": [],
+    }
+
+    reg = PageRegistry()
+    for view in (index_view, foo_view, bar_view):
+        reg.add_page(
+            view,
+            view.introspect(jinja_env),
+            references=view.get_template_references(jinja_env),
+        )
+
+    # Pages are only linked to their own template
+    assert reg.roots == {
+        "index.html": {"index.html"},
+        "article.html": {"foo.html", "bar.html"},
+    }
+    assert reg.references["_menu.html"] == {"_link.html"}
+    assert reg.referrers["_menu.html"] == {"index.html", "article.html"}
+
+    assert reg.has_template("_link.html") is True
+    assert reg.has_template("unused.html") is False
+
+    assert reg.get_destinations_from_template("_link.html") == {
+        "index.html", "foo.html", "bar.html",
+    }
+    assert reg.get_destinations_from_template("_macros.html") == {
+        "foo.html", "bar.html",
+    }
+    assert set(reg.get_pages_from_template("article.html")) == {foo_view, bar_view}
+
+    assert reg.templates["skeleton.html"] == {"index.html", "foo.html", "bar.html"}
+    assert reg.templates["index.html"] == {"index.html"}
+
+    assert reg.get_orphan_templates() == []
+    assert reg.get_orphan_templates(jinja_env.list_templates()) == ["unused.html"]
+
+    # Page template change leaves the previous one orphaned
+    index_view.template_name = "skeleton.html"
+    reg.add_page(index_view, ["skeleton.html"], references={"skeleton.html": []})
+
+    assert reg.get_destinations_from_template("_menu.html") == {"foo.html", "bar.html"}
+    assert reg.get_orphan_templates() == ["index.html"]
+
+    assert reg.get_pages_from_template("nope.html") == []
+    assert caplog.record_tuples[-1] == (
+        "optimus",
+        logging.WARNING,
+        "Given template name is not registered: nope.html",
+    )
+
+
+def test_template_graph_without_references():
+    """
+    Without references, every templates should be linked to the page template.
+    """
+    index_view = get_view("index.html", "index.html")
+
+    reg = PageRegistry()
+    reg.add_page(index_view, ["index.html", "skeleton.html", "_menu.html"])
+
+    assert reg.references == {
+        "index.html": {"skeleton.html", "_menu.html"},
+        "skeleton.html": set(),
+        "_menu.html": set(),
+    }
+    assert reg.get_pages_from_template("_menu.html") == [index_view]
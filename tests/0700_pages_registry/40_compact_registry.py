@@ -0,0 +1,139 @@
+from array import array
+
+import pytest
+
+from optimus.pages.views import PageTemplateView
+from optimus.pages.registry import CompactPageRegistry, PageRegistry
+
+
+class DummySettings:
+    """
+    Dummy object with needed settings
+    """
+    LANGUAGE_CODE = "en"
+
+
+def get_view(destination, template_name, datas=None):
+    return PageTemplateView(
+        title=destination,
+        destination=destination,
+        template_name=template_name,
+        datas=datas or [],
+        settings=DummySettings(),
+    )
+
+
+def fill_registry(registry):
+    """
+    Fill registry with some pages and return them.
+    """
+    index_view = get_view("index.html", "index.html", datas=["menu.json"])
+    foo_view = get_view("foo.html", "article.html", datas=["menu.json", "foo.json"])
+    bar_view = get_view("bar.html", "article.html")
+
+    registry.add_page(
+        index_view,
+        ["index.html", "skeleton.html", "_menu.html"],
+        references={
+            "index.html": ["skeleton.html", "_menu.html"],
+            "skeleton.html": [],
+            "_menu.html": [],
+        },
+    )
+    registry.add_page(foo_view, ["article.html", "skeleton.html"])
+    registry.add_page(bar_view, ["article.html", "skeleton.html"])
+
+    for view in (index_view, foo_view, bar_view):
+        registry.add_data(view, view.get_datas())
+
+    return index_view, foo_view, bar_view
+
+
+@pytest.mark.parametrize("template_name", [
+    "index.html",
+    "article.html",
+    "skeleton.html",
+    "_menu.html",
+])
+def test_compact_registry_parity(template_name):
+    """
+    Compact registry should return the same pages than the default registry.
+    """
+    registry = PageRegistry()
+    compact = CompactPageRegistry()
+    fill_registry(registry)
+    fill_registry(compact)
+
+    assert compact.get_destinations_from_template(template_name) == (
+        registry.get_destinations_from_template(template_name)
+    )
+    assert sorted([
+        page.get_destination()
+        for page in compact.get_pages_from_template(template_name)
+    ]) == sorted([
+        page.get_destination()
+        for page in registry.get_pages_from_template(template_name)
+    ])
+    assert compact.templates == registry.templates
+    assert compact.destinations_templates_index == (
+        registry.destinations_templates_index
+    )
+    assert compact.get_orphan_templates() == registry.get_orphan_templates()
+
+
+def test_compact_registry(caplog):
+    """
+    Compact registry should store pages with interned identifiers.
+    """
+    registry = CompactPageRegistry()
+    index_view, foo_view, bar_view = fill_registry(registry)
+
+    assert registry.destinations == ["index.html", "foo.html", "bar.html"]
+    assert registry.roots == {
+        "index.html": array("I", [0]),
+        "article.html": array("I", [1, 2]),
+    }
+    assert registry.datas == {
+        "menu.json": array("I", [0, 1]),
+        "foo.json": array("I", [1]),
+    }
+
+    assert registry.get_pages_from_template("skeleton.html") == [
+        index_view, foo_view, bar_view,
+    ]
+    assert registry.get_pages_from_data("menu.json") == [index_view, foo_view]
+    assert registry.get_all_destinations() == ["index.html", "foo.html", "bar.html"]
+    assert registry.get_all_pages() == [index_view, foo_view, bar_view]
+    assert registry.get_page("foo.html") is foo_view
+    assert registry.get_page("nope.html") is None
+    assert registry.get_page_template("foo.html") == "article.html"
+
+    # Registering a page again does not duplicate it
+    registry.add_page(bar_view, ["article.html"])
+    registry.add_data(bar_view, ["menu.json"])
+    assert registry.destinations == ["index.html", "foo.html", "bar.html"]
+    assert registry.roots["article.html"] == array("I", [1, 2])
+    assert registry.datas["menu.json"] == array("I", [0, 1, 2])
+
+    # Page template may change
+    registry.add_page(foo_view, ["index.html"])
+    assert registry.roots == {
+        "index.html": array("I", [0, 1]),
+        "article.html": array("I", [2]),
+    }
+    assert registry.get_pages_from_template("_menu.html") == [index_view, foo_view]
+
+    assert registry.get_pages_from_template("nope.html") == []
+    assert registry.get_pages_from_data("nope.json") == []
+    assert caplog.record_tuples[-2:] == [
+        (
+            "optimus",
+            30,
+            "Given template name is not registered: nope.html",
+        ),
+        (
+            "optimus",
+            30,
+            "Given data is not registered: nope.json",
+        ),
+    ]
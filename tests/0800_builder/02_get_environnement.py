@@ -1,8 +1,11 @@
 import os
 import logging
 
+from jinja2 import __version__ as jinja2_version
+from jinja2 import FileSystemBytecodeCache
 from jinja2.ext import Extension
 
+from optimus import __version__
 from optimus.pages.builder import PageBuilder
 
 
@@ -56,3 +59,34 @@ def test_get_environnement(minimal_basic_settings, fixtures_settings, caplog):
             ("No Jinja2 environment given, initializing a new environment"),
         ),
     ]
+
+
+def test_get_environnement_bytecode_cache(minimal_basic_settings, fixtures_settings,
+                                          tmp_path):
+    """
+    Environment should use a bytecode cache in a directory named from versions
+    when enabled from settings.
+    """
+    projectdir = os.path.join(fixtures_settings.fixtures_path, "basic_template")
+    settings = minimal_basic_settings(projectdir)
+
+    # Disabled by default
+    builder = PageBuilder(settings)
+    assert builder.jinja_env.bytecode_cache is None
+
+    settings.JINJA_BYTECODE_CACHE = str(tmp_path / "jinja-cache")
+    settings.TEMPLATES_DIR = str(tmp_path / "templates")
+    os.makedirs(settings.TEMPLATES_DIR)
+    (tmp_path / "templates" / "index.html").write_text("Hello {{ name }}")
+
+    builder = PageBuilder(settings)
+    assert isinstance(builder.jinja_env.bytecode_cache, FileSystemBytecodeCache)
+
+    cache_dir = tmp_path / "jinja-cache" / "optimus-{}_jinja-{}".format(
+        __version__, jinja2_version
+    )
+    assert builder.jinja_env.bytecode_cache.directory == str(cache_dir)
+
+    # Compiled template is stored in cache
+    builder.jinja_env.get_template("index.html")
+    assert len(list(cache_dir.iterdir())) == 1
@@ -0,0 +1,134 @@
+import io
+import importlib
+import os
+import shutil
+
+import pytest
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.exceptions import PageBuildError
+from optimus.pages.builder import PageBuilder
+from optimus.pages.views import PageViewBase
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+class BrokenView(PageViewBase):
+    """
+    A view which always fails to render.
+    """
+    title = "Broken"
+
+    def render(self, env):
+        raise ValueError("Nope")
+
+
+@pytest.mark.parametrize("sample_fixture_name, expected_destinations", [
+    ("basic_template", ["index.html"]),
+    (
+        "basic2_template",
+        [
+            "index.html",
+            "sub/foo.html",
+            "sub/bar.html",
+            "pure-data.html",
+            "entrypoint.json"
+        ]
+    ),
+    ("i18n_template", ["index.html", "index_fr_FR.html"]),
+])
+def test_build_bulk_parallel(
+    minimal_basic_settings,
+    fixtures_settings,
+    temp_builds_dir,
+    sample_fixture_name,
+    expected_destinations,
+):
+    """
+    Parallel build should return the same destinations than the serial build and
+    write the same contents.
+    """
+    basepath = temp_builds_dir.join(
+        "builder_build_parallel_{}".format(sample_fixture_name)
+    )
+    projectdir = os.path.join(basepath.strpath, sample_fixture_name)
+
+    attempts_dir = os.path.join(
+        fixtures_settings.fixtures_path, "builds", sample_fixture_name
+    )
+
+    # Copy sample from fixtures dir
+    templatedir = os.path.join(fixtures_settings.fixtures_path, sample_fixture_name)
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+
+        # Production mode for stable asset filenames, see 'test_build_item'
+        cache_dir = os.path.join(projectdir, "webassets-cache")
+        os.makedirs(cache_dir)
+        settings.DEBUG = False
+        settings.WEBASSETS_CACHE = cache_dir
+        settings.WEBASSETS_URLEXPIRE = False
+        settings.JINJA_FILTERS = {
+            "dummy_filter": lambda content: "DummyFilter: {}".format(content),
+        }
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(settings, assets_env=assets_env, jobs=2)
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        pages_map = importlib.reload(pages_map)
+
+        buildeds = builder.build_bulk(pages_map.PAGES)
+
+        assert buildeds == [
+            os.path.join(settings.PUBLISH_DIR, path) for path in expected_destinations
+        ]
+
+        for path in expected_destinations:
+            with io.open(os.path.join(settings.PUBLISH_DIR, path), "r") as fp:
+                built = fp.read()
+
+            with io.open(os.path.join(attempts_dir, path), "r") as fp:
+                attempted = fp.read()
+
+            assert built == attempted
+
+
+def test_build_bulk_parallel_failure(minimal_basic_settings, fixtures_settings,
+                                     temp_builds_dir):
+    """
+    Failures from workers should be collected and raised from the parent process.
+    """
+    basepath = temp_builds_dir.join("builder_build_parallel_failure")
+    projectdir = os.path.join(basepath.strpath, "basic_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic_template")
+    shutil.copytree(templatedir, projectdir)
+
+    settings = minimal_basic_settings(projectdir)
+
+    builder = PageBuilder(settings, jobs=2)
+
+    pages = [
+        PageViewBase(title="Ok", destination="ok.html"),
+        BrokenView(destination="broken.html"),
+    ]
+
+    with pytest.raises(PageBuildError) as excinfo:
+        builder.build_bulk(pages)
+
+    assert len(excinfo.value.failures) == 1
+
+    failure = excinfo.value.failures[0]
+    assert failure["index"] == 1
+    assert failure["page"] == "<BrokenView broken.html>"
+    assert failure["error"] == "ValueError: Nope"
+    assert "Traceback" in failure["traceback"]
+    assert isinstance(failure["pid"], int)
+
+    # Pages from successful partitions have been built
+    assert os.path.exists(os.path.join(settings.PUBLISH_DIR, "ok.html")) is True
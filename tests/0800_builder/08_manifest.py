@@ -0,0 +1,109 @@
+import json
+
+from webassets import Bundle
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.manifest import (
+    BuildManifest,
+    get_file_digest,
+    get_fingerprint,
+)
+
+
+def dummy_callable():
+    return "Nope"
+
+
+def test_get_fingerprint():
+    """
+    Fingerprint should be stable for the same items and support any object.
+    """
+    assert get_fingerprint("foo", {"a": 1, "b": 2}) == get_fingerprint(
+        "foo", {"b": 2, "a": 1}
+    )
+    assert get_fingerprint("foo") != get_fingerprint("bar")
+
+    # Callables are serialized to their Python path
+    assert get_fingerprint(dummy_callable) == get_fingerprint(
+        "{}.dummy_callable".format(__name__)
+    )
+
+    # Bundles are serialized without their filter instances
+    def get_bundle(filters):
+        return Bundle("css/app.css", filters=filters, output="css/app.min.css")
+
+    assert get_fingerprint(get_bundle("rcssmin")) == get_fingerprint(
+        get_bundle("rcssmin")
+    )
+    assert get_fingerprint(get_bundle("rcssmin")) != get_fingerprint(
+        get_bundle(None)
+    )
+
+
+def test_build_fingerprint_bundles(minimal_basic_settings, tmpdir):
+    """
+    Build fingerprint should not change from a builder to another with the same
+    filtered bundles in settings.
+    """
+    def get_build_fingerprint():
+        settings = minimal_basic_settings(tmpdir.strpath)
+        settings.BUNDLES = {
+            "app_css": Bundle(
+                "css/app.css", filters="rcssmin", output="css/app.min.css"
+            ),
+        }
+
+        return PageBuilder(settings).get_build_fingerprint()
+
+    assert get_build_fingerprint() == get_build_fingerprint()
+
+
+def test_get_file_digest(tmp_path):
+    """
+    File digest should change with file content and be None for missing files.
+    """
+    path = tmp_path / "foo.txt"
+
+    assert get_file_digest(str(path)) is None
+
+    path.write_text("Foo")
+    first = get_file_digest(str(path))
+
+    path.write_text("Bar")
+    assert get_file_digest(str(path)) != first
+
+
+def test_manifest(tmp_path):
+    """
+    Manifest should write its entries and load them back.
+    """
+    path = tmp_path / "manifest.json"
+
+    manifest = BuildManifest(str(path))
+    assert manifest.load() == {}
+
+    manifest.set("index.html", "foo")
+    manifest.update({"bar.html": "bar"})
+    assert manifest.get("index.html") == "foo"
+    assert manifest.get("nope.html") is None
+    assert manifest.updated == {"index.html": "foo", "bar.html": "bar"}
+
+    manifest.save()
+
+    manifest = BuildManifest(str(path))
+    assert manifest.load() == {"index.html": "foo", "bar.html": "bar"}
+    assert manifest.updated == {}
+
+
+def test_manifest_invalid(tmp_path, caplog):
+    """
+    An invalid manifest file should be ignored.
+    """
+    path = tmp_path / "manifest.json"
+    path.write_text("{nope")
+
+    manifest = BuildManifest(str(path))
+    assert manifest.load() == {}
+
+    path.write_text(json.dumps({"index.html": "foo"}))
+    assert manifest.load() == {"index.html": "foo"}
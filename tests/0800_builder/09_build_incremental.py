@@ -0,0 +1,204 @@
+import importlib
+import os
+import shutil
+
+import pytest
+from jinja2 import FileSystemLoader
+from jinja2 import Environment as Jinja2Environment
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.pages.builder import PageBuilder
+from optimus.pages.views import PageTemplateView
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_bulk_incremental(minimal_basic_settings, fixtures_settings,
+                                temp_builds_dir, jobs):
+    """
+    Incremental build should only rebuild pages whose inputs have changed.
+    """
+    basepath = temp_builds_dir.join("builder_build_incremental")
+    projectdir = os.path.join(basepath.strpath, "basic2_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic2_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+
+        def build():
+            """
+            Build pages with a new builder like a new command would do.
+            """
+            builder = PageBuilder(
+                settings,
+                assets_env=register_assets(settings),
+                jobs=jobs,
+                incremental=True,
+            )
+            pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+            pages_map = importlib.reload(pages_map)
+
+            builded = builder.build_bulk(pages_map.PAGES)
+
+            return builder, builded
+
+        # First build writes every page and the manifest
+        builder, builded = build()
+        assert len(builded) == 5
+        assert builder.summary == {"built": 5}
+        assert os.path.exists(settings.BUILD_MANIFEST) is True
+
+        # Nothing changed, every page is reused
+        builder, reused = build()
+        assert reused == builded
+        assert builder.summary == {"reused": 5}
+
+        # Template change only rebuild the pages using it
+        with open(os.path.join(settings.TEMPLATES_DIR, "sub", "base.html"), "a") as fp:
+            fp.write("\n")
+
+        builder, rebuilded = build()
+        assert rebuilded == builded
+        assert builder.summary == {"built": 2, "reused": 3}
+
+        # Data change only rebuild the pages using it
+        with open(os.path.join(settings.DATAS_DIR, "sample.json"), "a") as fp:
+            fp.write("\n")
+
+        builder, rebuilded = build()
+        assert builder.summary == {"built": 1, "reused": 4}
+
+        # Missing destination is rebuilt
+        os.remove(os.path.join(settings.PUBLISH_DIR, "index.html"))
+
+        builder, rebuilded = build()
+        assert builder.summary == {"built": 1, "reused": 4}
+        assert os.path.exists(os.path.join(settings.PUBLISH_DIR, "index.html"))
+
+        # Settings change rebuild every pages
+        settings.SITE_NAME = "Changed"
+
+        builder, rebuilded = build()
+        assert builder.summary == {"built": 5}
+
+
+def test_build_bulk_incremental_dynamic_include(minimal_basic_settings, tmpdir):
+    """
+    Pages including a template from a variable should be built in incremental
+    mode and always rebuilt since their templates are not all known.
+    """
+    templates_dir = tmpdir.mkdir("templates")
+    templates_dir.join("index.html").write(
+        "{% extends 'skeleton.html' %}"
+        "{% block content %}{% include partial %}{% endblock %}"
+    )
+    templates_dir.join("skeleton.html").write(
+        "<html>{% block content %}{% endblock %}</html>"
+    )
+    templates_dir.join("_menu.html").write("Menu")
+
+    settings = minimal_basic_settings(tmpdir.strpath)
+    settings.PUBLISH_DIR = tmpdir.join("_build").strpath
+    settings.BUILD_MANIFEST = tmpdir.join("manifest.json").strpath
+
+    def build():
+        builder = PageBuilder(
+            settings,
+            jinja_env=Jinja2Environment(loader=FileSystemLoader(templates_dir.strpath)),
+            incremental=True,
+        )
+        page = PageTemplateView(
+            title="Index",
+            destination="index.html",
+            template_name="index.html",
+            context={"partial": "_menu.html"},
+        )
+        builder.build_bulk([page])
+
+        return builder, page
+
+    builder, page = build()
+    assert builder.summary == {"built": 1}
+    assert page.get_dynamic_templates(builder.jinja_env) == ["index.html"]
+    assert page.get_template_references(builder.jinja_env) == {
+        "index.html": ["skeleton.html"],
+        "skeleton.html": [],
+    }
+
+    with open(os.path.join(settings.PUBLISH_DIR, "index.html")) as fp:
+        assert fp.read() == "<html>Menu</html>"
+
+    builder, page = build()
+    assert builder.summary == {"built": 1}
+
+    # Without builder introspection cache
+    page = PageTemplateView(
+        title="Index",
+        destination="index.html",
+        template_name="index.html",
+        settings=settings,
+    )
+    env = Jinja2Environment(loader=FileSystemLoader(templates_dir.strpath))
+    assert page.introspect(env) == ["index.html", "skeleton.html"]
+    assert page.get_dynamic_templates(env) == ["index.html"]
+
+
+@pytest.mark.parametrize("mode", ["incremental", "render_cache"])
+def test_build_bulk_reused_builder(minimal_basic_settings, tmpdir, mode):
+    """
+    A builder reused for many builds should follow template changes so a page is
+    rebuilt when a template it has started to include is modified.
+    """
+    templates_dir = tmpdir.mkdir("templates")
+
+    def write_template(name, content):
+        path = templates_dir.join(name)
+        previous = path.mtime() if path.exists() else 0
+        path.write(content)
+        path.setmtime(previous + 1)
+
+    write_template("index.html", "{% include 'skeleton.html' %}")
+    write_template("skeleton.html", "<html></html>")
+
+    settings = minimal_basic_settings(tmpdir.strpath)
+    settings.PUBLISH_DIR = tmpdir.join("_build").strpath
+    if mode == "incremental":
+        settings.BUILD_MANIFEST = tmpdir.join("manifest.json").strpath
+    else:
+        settings.RENDER_CACHE = tmpdir.join("render-cache").strpath
+
+    builder = PageBuilder(
+        settings,
+        jinja_env=Jinja2Environment(loader=FileSystemLoader(templates_dir.strpath)),
+        incremental=(mode == "incremental"),
+    )
+    page = PageTemplateView(
+        title="Index", destination="index.html", template_name="index.html",
+    )
+
+    def build():
+        builder.build_bulk([page])
+
+        with open(os.path.join(settings.PUBLISH_DIR, "index.html")) as fp:
+            return fp.read()
+
+    assert build() == "<html></html>"
+
+    write_template("skeleton.html", "<html>{% include 'new.html' %}</html>")
+    write_template("new.html", "First")
+
+    assert build() == "<html>First</html>"
+    assert page.introspect(builder.jinja_env) == [
+        "index.html", "skeleton.html", "new.html",
+    ]
+
+    write_template("new.html", "Second")
+
+    assert build() == "<html>Second</html>"
+    assert builder.summary["built"] == 1
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import shutil
+
+import pytest
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.views import PageViewBase
+
+
+class ContentView(PageViewBase):
+    """
+    A view which renders its 'content' attribute.
+    """
+    title = "Content"
+    content = ""
+
+    def render(self, env):
+        super().render(env)
+
+        return self.content
+
+
+def test_is_unchanged(minimal_basic_settings, fixtures_settings, tmp_path):
+    """
+    Destination content should be compared by size then by digest.
+    """
+    projectdir = os.path.join(fixtures_settings.fixtures_path, "minimal_basic")
+    builder = PageBuilder(minimal_basic_settings(projectdir))
+
+    def is_unchanged(path, data):
+        return builder.is_unchanged(
+            path, len(data), hashlib.sha256(data).hexdigest()
+        )
+
+    path = tmp_path / "foo.html"
+
+    assert is_unchanged(str(path), b"Foo") is False
+
+    path.write_bytes(b"Foo")
+
+    assert is_unchanged(str(path), b"Foo") is True
+    assert is_unchanged(str(path), b"Bar") is False
+    assert is_unchanged(str(path), b"Foobar") is False
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_build_write_if_changed(minimal_basic_settings, fixtures_settings,
+                                temp_builds_dir, streaming):
+    """
+    Identical destination files should be left untouched.
+    """
+    basepath = temp_builds_dir.join("builder_build_write_if_changed")
+    projectdir = os.path.join(basepath.strpath, "basic_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic_template")
+    shutil.copytree(templatedir, projectdir)
+
+    settings = minimal_basic_settings(projectdir)
+
+    builder = PageBuilder(settings, write_if_changed=True)
+
+    pages = [
+        ContentView(destination="foo.html", content="Foo", streaming=streaming),
+        ContentView(destination="bar.html", content="Bar", streaming=streaming),
+    ]
+    foo_path = os.path.join(settings.PUBLISH_DIR, "foo.html")
+    bar_path = os.path.join(settings.PUBLISH_DIR, "bar.html")
+
+    builder.build_bulk(pages)
+    assert builder.summary == {"built": 2}
+
+    # Age files to check their modification time afterwards
+    os.utime(foo_path, (1000, 1000))
+    os.utime(bar_path, (1000, 1000))
+
+    # Change content of a single page
+    pages[1].content = "Bar changed"
+
+    builder.build_bulk(pages)
+    assert builder.summary == {"built": 2, "unchanged": 1}
+
+    assert os.stat(foo_path).st_mtime == 1000
+    assert os.stat(bar_path).st_mtime != 1000
+
+    with open(bar_path, "r") as fp:
+        assert fp.read() == "Bar changed"
+
+    # No temporary files are left
+    assert sorted(os.listdir(settings.PUBLISH_DIR)) == ["bar.html", "foo.html"]
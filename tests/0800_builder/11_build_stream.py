@@ -0,0 +1,64 @@
+import io
+import importlib
+import os
+import shutil
+
+import pytest
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.pages.builder import PageBuilder
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+@pytest.mark.parametrize("write_if_changed", [False, True])
+def test_build_bulk_stream(minimal_basic_settings, fixtures_settings,
+                           temp_builds_dir, write_if_changed):
+    """
+    Streamed pages should be written with the same content than rendered pages.
+    """
+    basepath = temp_builds_dir.join("builder_build_stream")
+    projectdir = os.path.join(basepath.strpath, "basic2_template")
+
+    attempts_dir = os.path.join(
+        fixtures_settings.fixtures_path, "builds", "basic2_template"
+    )
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic2_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+
+        # Production mode for stable asset filenames, see 'test_build_item'
+        cache_dir = os.path.join(projectdir, "webassets-cache")
+        os.makedirs(cache_dir)
+        settings.DEBUG = False
+        settings.WEBASSETS_CACHE = cache_dir
+        settings.WEBASSETS_URLEXPIRE = False
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(
+            settings,
+            assets_env=assets_env,
+            write_if_changed=write_if_changed,
+        )
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        pages_map = importlib.reload(pages_map)
+
+        for page in pages_map.PAGES:
+            page.streaming = True
+
+        builder.build_bulk(pages_map.PAGES)
+
+        for path in ["index.html", "sub/foo.html", "entrypoint.json"]:
+            with io.open(os.path.join(settings.PUBLISH_DIR, path), "r") as fp:
+                built = fp.read()
+
+            with io.open(os.path.join(attempts_dir, path), "r") as fp:
+                attempted = fp.read()
+
+            assert built == attempted
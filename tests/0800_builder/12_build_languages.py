@@ -0,0 +1,76 @@
+import importlib
+import os
+import shutil
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.pages.builder import PageBuilder
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+def test_build_bulk_language_groups(
+    i18n_template_settings, fixtures_settings, temp_builds_dir
+):
+    """
+    Pages are built grouped by language so translations are installed once per
+    language, while returned destinations keep the page list order.
+    """
+    basepath = temp_builds_dir.join("builder_build_bulk_language_groups")
+    projectdir = os.path.join(basepath.strpath, "i18n_sample")
+
+    # Copy sample from fixtures dir
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "i18n_template")
+    shutil.copytree(templatedir, projectdir)
+
+    settings = i18n_template_settings(projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value", set_envvar=False)
+
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        # Force reloading since another test may have imported a 'pages' module
+        pages_map = importlib.reload(pages_map)
+        Index = pages_map.Index
+
+        # Interleave languages
+        pages = [
+            Index(destination="index.html"),
+            Index(lang="fr_FR"),
+            Index(destination="foo_{language_code}.html"),
+            Index(lang="fr_FR", destination="foo_{language_code}.html"),
+            Index(destination="bar_{language_code}.html"),
+        ]
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(settings, assets_env=assets_env)
+
+        # Count translation installs
+        installed = []
+        install = builder.jinja_env.install_gettext_translations
+
+        def counted_install(translations, **kwargs):
+            installed.append(translations.info()["language-team"])
+            return install(translations, **kwargs)
+
+        builder.jinja_env.install_gettext_translations = counted_install
+
+        assert builder.get_build_order(pages) == [0, 2, 4, 1, 3]
+
+        builded = builder.build_bulk(pages)
+
+        assert builded == [
+            os.path.join(settings.PUBLISH_DIR, "index.html"),
+            os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html"),
+            os.path.join(settings.PUBLISH_DIR, "foo_en_US.html"),
+            os.path.join(settings.PUBLISH_DIR, "foo_fr_FR.html"),
+            os.path.join(settings.PUBLISH_DIR, "bar_en_US.html"),
+        ]
+
+        assert installed == [
+            "en_US <LL@li.org>",
+            "fr_FR <LL@li.org>",
+        ]
+
+        for path in builded:
+            assert os.path.exists(path) is True
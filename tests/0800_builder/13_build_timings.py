@@ -0,0 +1,170 @@
+import importlib
+import json
+import os
+import shutil
+
+import pytest
+
+from optimus.exceptions import DestinationCollisionError
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.pages.builder import PageBuilder
+from optimus.pages.reports import (
+    get_build_report,
+    get_slowest_pages,
+    get_template_timings,
+    merge_build_reports,
+    write_build_report,
+)
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+def timing(destination, template, context, render, write):
+    return {
+        "destination": destination,
+        "view": "pages.Index",
+        "template": template,
+        "context": context,
+        "render": render,
+        "write": write,
+        "total": context + render + write,
+    }
+
+
+def test_get_slowest_pages():
+    """
+    Slowest pages are sorted on their total time.
+    """
+    timings = [
+        timing("a.html", "a.html", 0.0, 1.0, 0.0),
+        timing("b.html", "b.html", 0.0, 3.0, 0.0),
+        timing("c.html", None, 2.0, 0.0, 0.0),
+    ]
+
+    assert [item["destination"] for item in get_slowest_pages(timings)] == [
+        "b.html",
+        "c.html",
+        "a.html",
+    ]
+
+    assert [item["destination"] for item in get_slowest_pages(timings, 1)] == [
+        "b.html",
+    ]
+
+
+def test_get_template_timings():
+    """
+    Template timings are aggregated from their pages, pages without template
+    are ignored.
+    """
+    timings = [
+        timing("a.html", "a.html", 1.0, 1.0, 0.0),
+        timing("b.html", "b.html", 0.0, 3.0, 0.5),
+        timing("a_fr.html", "a.html", 1.0, 2.0, 0.5),
+        timing("c.html", None, 2.0, 0.0, 0.0),
+    ]
+
+    assert get_template_timings(timings) == {
+        "a.html": {
+            "pages": 2,
+            "context": 2.0,
+            "render": 3.0,
+            "write": 0.5,
+            "total": 5.5,
+        },
+        "b.html": {
+            "pages": 1,
+            "context": 0.0,
+            "render": 3.0,
+            "write": 0.5,
+            "total": 3.5,
+        },
+    }
+
+
+def test_merge_build_reports():
+    """
+    Reports should be merged and colliding destinations should raise an error.
+    """
+    first = get_build_report(
+        [timing("a.html", "a.html", 0.0, 1.0, 0.0)],
+        destinations=["a.html", "reused.html"],
+        shard=(1, 2),
+    )
+    second = get_build_report(
+        [timing("b.html", "a.html", 0.0, 2.0, 0.0)],
+        destinations=["b.html"],
+        shard=(2, 2),
+    )
+
+    merged = merge_build_reports([first, second])
+
+    assert merged["shard"] is None
+    assert merged["shards"] == [[1, 2], [2, 2]]
+    assert merged["destinations"] == ["a.html", "b.html", "reused.html"]
+    assert [item["destination"] for item in merged["pages"]] == ["b.html", "a.html"]
+    assert merged["templates"]["a.html"]["pages"] == 2
+    assert merged["total"]["render"] == 3.0
+
+    colliding = get_build_report([], destinations=["b.html"], shard=(1, 2))
+
+    with pytest.raises(DestinationCollisionError) as excinfo:
+        merge_build_reports([first, second, colliding])
+
+    assert excinfo.value.collisions == {"b.html": [[2, 2], [1, 2]]}
+
+
+def test_build_timings(minimal_basic_settings, fixtures_settings, temp_builds_dir):
+    """
+    Builder records a timing for every built page.
+    """
+    basepath = temp_builds_dir.join("builder_build_timings")
+    projectdir = os.path.join(basepath.strpath, "basic2_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic2_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+        settings.JINJA_FILTERS = {
+            "dummy_filter": lambda content: "DummyFilter: {}".format(content),
+        }
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(settings, assets_env=assets_env)
+
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        # Force reloading since another test may have imported a 'pages' module
+        pages_map = importlib.reload(pages_map)
+        for pageview in pages_map.PAGES:
+            pageview.settings = settings
+
+        builder.build_bulk(pages_map.PAGES)
+
+        assert [item["destination"] for item in builder.timings] == [
+            page.get_destination() for page in pages_map.PAGES
+        ]
+
+        for item in builder.timings:
+            assert item["total"] > 0
+            assert item["total"] == (
+                item["context"] + item["render"] + item["write"]
+            )
+
+        # Template views have a context time
+        index = builder.timings[0]
+        assert index["template"] == "index.html"
+        assert index["context"] > 0
+
+        report_path = os.path.join(projectdir, "report.json")
+        write_build_report(report_path, builder.timings)
+
+        with open(report_path) as fp:
+            report = json.load(fp)
+
+        assert len(report["pages"]) == len(pages_map.PAGES)
+        assert "index.html" in report["templates"]
+        assert report["total"]["total"] > 0
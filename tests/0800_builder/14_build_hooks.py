@@ -0,0 +1,99 @@
+import importlib
+import os
+import shutil
+
+import pytest
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.exceptions import InvalidSettings
+from optimus.pages.builder import PageBuilder
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+def test_add_hook_invalid_event(minimal_basic_settings, fixtures_settings):
+    """
+    Registering a hook for an unknown event should raise an exception.
+    """
+    settings = minimal_basic_settings(fixtures_settings.fixtures_path)
+
+    builder = PageBuilder(settings)
+
+    assert builder.hooks == {}
+
+    with pytest.raises(InvalidSettings):
+        builder.add_hook("nope", print)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_build_hooks(
+    minimal_basic_settings, fixtures_settings, temp_builds_dir, streaming
+):
+    """
+    Scan and page events should be emitted with their payload.
+    """
+    basepath = temp_builds_dir.join(
+        "builder_build_hooks_{}".format(streaming)
+    )
+    projectdir = os.path.join(basepath.strpath, "basic_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+        settings.JINJA_FILTERS = {
+            "dummy_filter": lambda content: "DummyFilter: {}".format(content),
+        }
+
+        payloads = []
+
+        def record(builder, **payload):
+            payloads.append(payload)
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(
+            settings,
+            assets_env=assets_env,
+            hooks={
+                event: [record]
+                for event in ("before_scan", "after_scan", "before_render",
+                              "after_render", "after_write")
+            },
+        )
+
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        # Force reloading since another test may have imported a 'pages' module
+        pages_map = importlib.reload(pages_map)
+        for pageview in pages_map.PAGES:
+            pageview.settings = settings
+            pageview.streaming = streaming
+
+        builder.scan_bulk(pages_map.PAGES)
+        builder.build_bulk(pages_map.PAGES)
+
+        assert [item["event"] for item in payloads] == [
+            "before_scan",
+            "after_scan",
+            "before_render",
+            "after_render",
+            "after_write",
+        ]
+
+        after_scan = payloads[1]
+        assert after_scan["templates"] == {"index.html", "skeleton.html"}
+        assert after_scan["time"] > 0
+
+        after_render = payloads[3]
+        assert after_render["destination"] == "index.html"
+        assert after_render["length"] > 0
+        assert after_render["time"] >= after_render["context_time"] > 0
+
+        after_write = payloads[4]
+        destination_path = os.path.join(settings.PUBLISH_DIR, "index.html")
+        assert after_write["destination_path"] == destination_path
+        assert after_write["written"] is True
+        assert after_write["size"] == os.path.getsize(destination_path)
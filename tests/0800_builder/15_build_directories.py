@@ -0,0 +1,69 @@
+import importlib
+import logging
+import os
+import shutil
+
+import pytest
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.pages.builder import PageBuilder
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_build_bulk_directories(minimal_basic_settings, fixtures_settings,
+                                temp_builds_dir, caplog, dry_run):
+    """
+    Destination directory tree should be created once before page builds, then
+    page builds should not check directories anymore.
+    """
+    basepath = temp_builds_dir.join("builder_build_directories_{}".format(dry_run))
+    projectdir = os.path.join(basepath.strpath, "basic2_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic2_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+        settings.JINJA_FILTERS = {
+            "dummy_filter": lambda content: "DummyFilter: {}".format(content),
+        }
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(settings, assets_env=assets_env, dry_run=dry_run)
+
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        # Force reloading since another test may have imported a 'pages' module
+        pages_map = importlib.reload(pages_map)
+
+        # Count directory creations
+        created = []
+        create_directory = builder.create_directory
+
+        def counted_create_directory(path):
+            created.append(path)
+            return create_directory(path)
+
+        builder.create_directory = counted_create_directory
+
+        with caplog.at_level(logging.INFO, logger="optimus"):
+            builder.build_bulk(pages_map.PAGES)
+
+        # Every directory has been processed once before builds
+        assert created == [
+            settings.PUBLISH_DIR,
+            os.path.join(settings.PUBLISH_DIR, "sub"),
+        ]
+        assert builder.known_dirs == set()
+
+        subdir = os.path.join(settings.PUBLISH_DIR, "sub")
+        assert os.path.exists(subdir) is (not dry_run)
+
+        messages = [record.message for record in caplog.records]
+        assert ("Planned directory tree:" in messages) is dry_run
+        if dry_run:
+            assert " - {} (new)".format(subdir) in messages
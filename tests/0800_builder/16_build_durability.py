@@ -0,0 +1,145 @@
+import importlib
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from optimus.setup_project import setup_project
+from optimus.conf.loader import import_pages_module
+from optimus.exceptions import InvalidSettings
+from optimus.pages import builder as builder_module
+from optimus.pages.builder import PageBuilder
+from optimus.pages.views import PageViewBase
+from optimus.assets.registry import register_assets
+from optimus.utils.cleaning_system import ResetSyspath
+
+
+class BrokenStreamView(PageViewBase):
+    """
+    A streamed view which fails in the middle of its content.
+    """
+    title = "Broken"
+    streaming = True
+
+    def render_stream(self, env):
+        yield "Partial content"
+        raise ValueError("Nope")
+
+
+def test_invalid_durability(minimal_basic_settings, fixtures_settings):
+    """
+    An invalid durability mode should raise an exception.
+    """
+    settings = minimal_basic_settings(fixtures_settings.fixtures_path)
+    settings.BUILD_DURABILITY = "nope"
+
+    with pytest.raises(InvalidSettings):
+        PageBuilder(settings)
+
+
+@pytest.mark.parametrize("durability, file_syncs, directory_syncs", [
+    (None, 0, 0),
+    ("file", 5, 0),
+    ("directory", 5, 2),
+])
+def test_build_bulk_durability(minimal_basic_settings, fixtures_settings,
+                               temp_builds_dir, monkeypatch, durability,
+                               file_syncs, directory_syncs):
+    """
+    Written pages should be synchronized to disk according to durability mode.
+    """
+    basepath = temp_builds_dir.join("builder_build_durability")
+    projectdir = os.path.join(basepath.strpath, "basic2_template")
+
+    templatedir = os.path.join(fixtures_settings.fixtures_path, "basic2_template")
+    shutil.copytree(templatedir, projectdir)
+
+    with ResetSyspath(projectdir):
+        setup_project(projectdir, "dummy_value")
+
+        settings = minimal_basic_settings(projectdir)
+        settings.JINJA_FILTERS = {
+            "dummy_filter": lambda content: "DummyFilter: {}".format(content),
+        }
+        settings.BUILD_DURABILITY = durability
+
+        assets_env = register_assets(settings)
+        builder = PageBuilder(settings, assets_env=assets_env)
+
+        pages_map = import_pages_module(settings.PAGES_MAP, basedir=projectdir)
+        # Force reloading since another test may have imported a 'pages' module
+        pages_map = importlib.reload(pages_map)
+
+        # Count synchronized files and directories, the whole filesystem is never
+        # synchronized
+        synced = []
+        monkeypatch.setattr(os, "sync", lambda: synced.append(None), raising=False)
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(
+            os.path.isdir("/proc/self/fd/{}".format(fd))
+        ))
+
+        builded = builder.build_bulk(pages_map.PAGES)
+
+        assert synced.count(False) == file_syncs
+        assert synced.count(True) == directory_syncs
+        assert None not in synced
+        assert builder.written_files == set()
+        assert builder.written_dirs == set()
+
+        for path in builded:
+            assert os.path.exists(path) is True
+
+
+@pytest.mark.parametrize("write_if_changed", [False, True])
+def test_build_item_atomic(minimal_basic_settings, temp_builds_dir,
+                           write_if_changed):
+    """
+    A failing page build should leave its previous destination file untouched and
+    no temporary file.
+    """
+    basepath = temp_builds_dir.join("builder_build_item_atomic")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+    os.makedirs(publish_dir)
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+
+    destination_path = os.path.join(publish_dir, "broken.html")
+    with open(destination_path, "w") as fp:
+        fp.write("Previous content")
+
+    builder = PageBuilder(settings, write_if_changed=write_if_changed)
+
+    with pytest.raises(ValueError):
+        builder.build_item(BrokenStreamView(destination="broken.html"))
+
+    assert os.listdir(publish_dir) == ["broken.html"]
+
+    with open(destination_path) as fp:
+        assert fp.read() == "Previous content"
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_write_page_open_error(minimal_basic_settings, temp_builds_dir,
+                               monkeypatch, streaming):
+    """
+    An error from temporary file creation should not be hidden by its cleanup.
+    """
+    basepath = temp_builds_dir.join("builder_write_page_open_error")
+
+    settings = minimal_basic_settings(basepath.strpath)
+
+    def denied(*args, **kwargs):
+        raise PermissionError("Denied")
+
+    monkeypatch.setattr(builder_module, "io", SimpleNamespace(open=denied))
+
+    builder = PageBuilder(settings)
+    destination_path = os.path.join(basepath.strpath, "index.html")
+
+    with pytest.raises(PermissionError):
+        if streaming:
+            builder.write_page_stream(destination_path, ["Hello"])
+        else:
+            builder.write_page(destination_path, "Hello")
@@ -0,0 +1,108 @@
+import hashlib
+import os
+
+import pytest
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.processors import minify_html
+from optimus.pages.views import PageViewBase
+
+
+class ContentView(PageViewBase):
+    """
+    A view which renders its content attribute.
+    """
+    title = "Content"
+    content = ""
+
+    def render(self, env):
+        super().render(env)
+        return self.content
+
+
+@pytest.mark.parametrize("content, expected", [
+    (
+        "<html>\n    <body>\n        <p>Hello   World</p>\n    </body>\n</html>",
+        "<html>\n<body>\n<p>Hello World</p>\n</body>\n</html>",
+    ),
+    (
+        "<p>Foo</p><!-- Comment\n with lines --> <b>bar</b>",
+        "<p>Foo</p> <b>bar</b>",
+    ),
+    (
+        "<!--[if IE]><p>IE</p><![endif]-->  <p>Foo</p>",
+        "<!--[if IE]><p>IE</p><![endif]--> <p>Foo</p>",
+    ),
+    (
+        "<div>\n  <pre>\n  keep   this\n</pre>\n  <TEXTAREA>  a\n  b </TEXTAREA></div>",
+        "<div>\n<pre>\n  keep   this\n</pre>\n<TEXTAREA>  a\n  b </TEXTAREA></div>",
+    ),
+    (
+        "<script>\n  var a = '<!-- no -->';\n</script>\n  <style> a  { } </style>",
+        "<script>\n  var a = '<!-- no -->';\n</script>\n<style> a  { } </style>",
+    ),
+    (
+        "<p>Non\xa0breaking\xa0\xa0space</p>",
+        "<p>Non\xa0breaking\xa0\xa0space</p>",
+    ),
+    (
+        "<input  value=\"a   b\"\n  title='c >  d'>  <div data-json='{\"a\":  1}'>",
+        "<input  value=\"a   b\"\n  title='c >  d'> <div data-json='{\"a\":  1}'>",
+    ),
+])
+def test_minify_html(content, expected):
+    """
+    Minifier should collapse whitespaces and remove comments except in preserved
+    elements.
+    """
+    assert minify_html(content) == expected
+
+
+def test_build_item_processors(minimal_basic_settings, temp_builds_dir):
+    """
+    Processors should be applied in order to page contents and their results
+    cached on rendered content.
+    """
+    basepath = temp_builds_dir.join("builder_build_item_processors")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+
+    calls = []
+
+    def upper(content, page):
+        calls.append(page.get_destination())
+        return content.upper()
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+    settings.POST_RENDER_PROCESSORS = [minify_html, upper]
+
+    builder = PageBuilder(settings)
+
+    page = ContentView(destination="index.html", content="<p>\n  Hello  </p>")
+
+    destination_path = builder.build_item(page)
+    with open(destination_path) as fp:
+        assert fp.read() == "<P>\nHELLO </P>"
+
+    # Unchanged content is not processed again
+    builder.build_item(page)
+    assert calls == ["index.html"]
+
+    # Processed contents are not kept in memory
+    assert builder.processed["index.html"][1] == hashlib.sha256(
+        b"<P>\nHELLO </P>"
+    ).hexdigest()
+
+    # Content is processed again if destination file has been changed
+    with open(destination_path, "w") as fp:
+        fp.write("Changed")
+    builder.build_item(page)
+    assert calls == ["index.html", "index.html"]
+    with open(destination_path) as fp:
+        assert fp.read() == "<P>\nHELLO </P>"
+
+    page.content = "<p>Bye</p>"
+    builder.build_item(page)
+    assert calls == ["index.html", "index.html", "index.html"]
+    with open(destination_path) as fp:
+        assert fp.read() == "<P>BYE</P>"
@@ -0,0 +1,82 @@
+import os
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.views import PageViewBase
+
+
+class ContentView(PageViewBase):
+    """
+    A view which renders its title.
+    """
+    title = "Content"
+
+    def render(self, env):
+        super().render(env)
+        return self.title
+
+
+def test_iter_build(minimal_basic_settings, temp_builds_dir):
+    """
+    Pages from an iterable should be built as soon as they are given.
+    """
+    basepath = temp_builds_dir.join("builder_iter_build")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+
+    builder = PageBuilder(settings)
+
+    produced = []
+
+    def generate_pages():
+        for name in ("foo", "bar", "sub/ping"):
+            # Previous page is already written before this one is created
+            if produced:
+                assert os.path.exists(
+                    os.path.join(publish_dir, produced[-1] + ".html")
+                ) is True
+            produced.append(name)
+            yield ContentView(title=name, destination=name + ".html")
+
+    builded = builder.iter_build(generate_pages())
+    assert produced == []
+
+    assert next(builded) == os.path.join(publish_dir, "foo.html")
+    assert produced == ["foo"]
+
+    assert list(builded) == [
+        os.path.join(publish_dir, "bar.html"),
+        os.path.join(publish_dir, "sub/ping.html"),
+    ]
+    assert builder.summary["built"] == 3
+    assert builder.known_dirs == set()
+
+
+def test_build_bulk_iterable(minimal_basic_settings, temp_builds_dir):
+    """
+    Bulk build should accept any iterable of pages.
+    """
+    basepath = temp_builds_dir.join("builder_build_bulk_iterable")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+
+    builder = PageBuilder(settings)
+
+    pages = (
+        ContentView(title=name, destination=name + ".html")
+        for name in ("foo", "bar")
+    )
+
+    assert builder.build_bulk(pages) == [
+        os.path.join(publish_dir, "foo.html"),
+        os.path.join(publish_dir, "bar.html"),
+    ]
+
+    with open(os.path.join(publish_dir, "bar.html")) as fp:
+        assert fp.read() == "bar"
+
+    # Empty iterable
+    assert builder.build_bulk(iter([])) is None
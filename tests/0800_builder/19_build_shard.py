@@ -0,0 +1,64 @@
+import os
+
+from optimus.pages.builder import PageBuilder, get_destination_shard
+from optimus.pages.views import PageViewBase
+
+
+class ContentView(PageViewBase):
+    """
+    A view which renders its title.
+    """
+    title = "Content"
+
+    def render(self, env):
+        super().render(env)
+        return self.title
+
+
+def test_get_destination_shard():
+    """
+    Destination shard should be deterministic and in shard range.
+    """
+    destinations = ["page_{}.html".format(i) for i in range(100)]
+
+    shards = [get_destination_shard(item, 4) for item in destinations]
+
+    assert set(shards) == {1, 2, 3, 4}
+    assert shards == [get_destination_shard(item, 4) for item in destinations]
+    assert get_destination_shard("index.html", 1) == 1
+
+
+def test_build_bulk_shard(minimal_basic_settings, temp_builds_dir):
+    """
+    Each shard build should only build its pages and every pages should be built
+    once from all shards.
+    """
+    basepath = temp_builds_dir.join("builder_build_bulk_shard")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+
+    def get_pages():
+        return [
+            ContentView(title=str(i), destination="page_{}.html".format(i))
+            for i in range(20)
+        ]
+
+    builded = []
+    for number in (1, 2, 3):
+        builder = PageBuilder(settings, shard=(number, 3))
+
+        paths = builder.build_bulk(get_pages())
+        for path in paths:
+            destination = os.path.relpath(path, publish_dir)
+            assert get_destination_shard(destination, 3) == number
+
+        # Iterable are sharded the same way
+        assert builder.build_bulk(iter(get_pages())) == paths
+
+        builded.extend(paths)
+
+    assert sorted(builded) == sorted([
+        os.path.join(publish_dir, "page_{}.html".format(i)) for i in range(20)
+    ])
@@ -0,0 +1,143 @@
+import json
+import os
+
+import pytest
+
+from optimus.exceptions import DataProcessError
+from optimus.pages import datas as datas_module
+from optimus.pages.builder import PageBuilder
+from optimus.pages.datas import DataLoader
+from optimus.pages.views import PageViewBase
+
+
+class DataView(PageViewBase):
+    """
+    A view which renders items from a data file.
+    """
+    title = "Data"
+    datas = ["catalog.json"]
+
+    def render(self, env):
+        super().render(env)
+        return ",".join(self.load_data("catalog.json")["items"])
+
+
+def write_data(path, content):
+    """
+    Write data file with a modification time different from the previous one.
+    """
+    previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write(content)
+
+    os.utime(path, ns=(previous + 10 ** 9, previous + 10 ** 9))
+
+
+def test_data_loader_cache(tmpdir):
+    """
+    Data files should be parsed once until they change or are invalidated.
+    """
+    path = tmpdir.join("catalog.json").strpath
+    write_data(path, json.dumps({"items": ["foo"]}))
+
+    calls = []
+
+    def parser(content):
+        calls.append(content)
+        return json.loads(content)
+
+    loader = DataLoader(basedir=tmpdir.strpath, parsers={".json": parser})
+
+    assert loader.load("catalog.json") == {"items": ["foo"]}
+    assert loader.load(path) is loader.load("catalog.json")
+    assert len(calls) == 1
+
+    write_data(path, json.dumps({"items": ["bar"]}))
+    assert loader.load("catalog.json") == {"items": ["bar"]}
+    assert len(calls) == 2
+
+    loader.invalidate("catalog.json")
+    loader.load("catalog.json")
+    assert len(calls) == 3
+
+    loader.invalidate()
+    assert loader.cache == {}
+
+
+def test_data_loader_formats(tmpdir):
+    """
+    Registered formats should be used from file extension and unknown formats or
+    invalid contents should raise an error.
+    """
+    path = tmpdir.join("items.txt").strpath
+    write_data(path, "foo\nbar\n")
+
+    loader = DataLoader(basedir=tmpdir.strpath)
+
+    with pytest.raises(DataProcessError) as excinfo:
+        loader.load("items.txt")
+    assert excinfo.value.name == path
+
+    loader.register_format(".TXT", str.splitlines)
+    assert loader.load("items.txt") == ["foo", "bar"]
+
+    broken = tmpdir.join("broken.json").strpath
+    write_data(broken, "{nope")
+
+    with pytest.raises(DataProcessError) as excinfo:
+        loader.load("broken.json")
+    assert excinfo.value.name == broken
+
+
+def test_data_loader_encoding(tmpdir, monkeypatch):
+    """
+    Data files should be decoded from UTF-8 whatever the locale encoding is.
+    """
+    path = tmpdir.join("catalog.json").strpath
+    write_data(path, json.dumps({"items": ["Café ✓"]}, ensure_ascii=False))
+
+    def locale_open(file, mode="r", encoding="latin-1", **kwargs):
+        return open(file, mode, encoding=encoding, **kwargs)
+
+    # Mime a non UTF-8 locale encoding
+    monkeypatch.setattr(datas_module, "open", locale_open, raising=False)
+
+    loader = DataLoader(basedir=tmpdir.strpath)
+    assert loader.load("catalog.json") == {"items": ["Café ✓"]}
+
+
+def test_build_data_loader(minimal_basic_settings, temp_builds_dir):
+    """
+    Pages should share parsed data from the builder data loader.
+    """
+    basepath = temp_builds_dir.join("builder_build_data_loader")
+    publish_dir = os.path.join(basepath.strpath, "_build")
+    datas_dir = os.path.join(basepath.strpath, "datas")
+    os.makedirs(datas_dir)
+    catalog_path = os.path.join(datas_dir, "catalog.json")
+    write_data(catalog_path, json.dumps({"items": ["foo", "bar"]}))
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = publish_dir
+    settings.DATAS_DIR = datas_dir
+
+    builder = PageBuilder(settings)
+
+    pages = [
+        DataView(destination="one.html"),
+        DataView(destination="two.html"),
+    ]
+
+    builder.build_bulk(pages)
+
+    assert list(builder.data_loader.cache) == [catalog_path]
+    assert pages[0].data_loader is builder.data_loader
+    with open(os.path.join(publish_dir, "two.html")) as fp:
+        assert fp.read() == "foo,bar"
+
+    write_data(catalog_path, json.dumps({"items": ["ping"]}))
+    builder.build_bulk(pages)
+
+    with open(os.path.join(publish_dir, "one.html")) as fp:
+        assert fp.read() == "ping"
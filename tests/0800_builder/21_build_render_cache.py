@@ -0,0 +1,118 @@
+import os
+
+from jinja2 import DictLoader
+from jinja2 import Environment as Jinja2Environment
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.rendercache import RenderCache
+from optimus.pages.views import PageTemplateView, PageViewBase
+
+
+RENDERED = []
+
+
+class NameView(PageViewBase):
+    """
+    A view which renders the name from its context.
+    """
+    title = "Name"
+
+    def render(self, env):
+        super().render(env)
+        RENDERED.append(self.get_destination())
+        return "Hello {}".format(self.get_timed_context()["name"])
+
+
+def test_render_cache(tmpdir):
+    """
+    Render cache should store and return file contents from their key.
+    """
+    source = tmpdir.join("source.html")
+    source.write("Hello")
+
+    cache = RenderCache(tmpdir.join("cache").strpath)
+    key = "ab" + "0" * 62
+
+    assert cache.get(key) is None
+
+    cache.set(key, source.strpath)
+
+    assert cache.get(key) == b"Hello"
+    assert os.listdir(tmpdir.join("cache", "ab").strpath) == [key]
+
+
+def test_build_render_cache(minimal_basic_settings, temp_builds_dir):
+    """
+    Pages should be restored from the render cache from another checkout when
+    their inputs are identical.
+    """
+    basepath = temp_builds_dir.join("builder_build_render_cache")
+    cache_dir = os.path.join(basepath.strpath, "render-cache")
+
+    def get_builder(checkout):
+        settings = minimal_basic_settings(os.path.join(basepath.strpath, checkout))
+        settings.RENDER_CACHE = cache_dir
+
+        return PageBuilder(settings)
+
+    del RENDERED[:]
+
+    builder = get_builder("first")
+    builder.build_bulk([
+        NameView(destination="foo.html", context={"name": "foo"}),
+        NameView(destination="bar.html", context={"name": "bar"}),
+    ])
+    assert RENDERED == ["foo.html", "bar.html"]
+    assert builder.summary["built"] == 2
+
+    # Another checkout only renders the changed page
+    del RENDERED[:]
+
+    builder = get_builder("second")
+    builder.build_bulk([
+        NameView(destination="foo.html", context={"name": "foo"}),
+        NameView(destination="bar.html", context={"name": "ping"}),
+    ])
+    assert RENDERED == ["bar.html"]
+    assert builder.summary["built"] == 1
+    assert builder.summary["restored"] == 1
+
+    publish_dir = builder.settings.PUBLISH_DIR
+    with open(os.path.join(publish_dir, "foo.html")) as fp:
+        assert fp.read() == "Hello foo"
+    with open(os.path.join(publish_dir, "bar.html")) as fp:
+        assert fp.read() == "Hello ping"
+
+
+def test_build_render_cache_dynamic_include(minimal_basic_settings, tmpdir):
+    """
+    Pages including a template from a variable should bypass render cache.
+    """
+    templates = {
+        "index.html": "{% include partial %}",
+        "_menu.html": "Menu",
+    }
+
+    settings = minimal_basic_settings(tmpdir.strpath)
+    settings.PUBLISH_DIR = tmpdir.join("_build").strpath
+    settings.RENDER_CACHE = tmpdir.join("render-cache").strpath
+
+    for i in range(2):
+        builder = PageBuilder(
+            settings, jinja_env=Jinja2Environment(loader=DictLoader(templates))
+        )
+        builder.build_bulk([
+            PageTemplateView(
+                title="Index",
+                destination="index.html",
+                template_name="index.html",
+                context={"partial": "_menu.html"},
+            )
+        ])
+
+        assert builder.summary == {"built": 1}
+
+    with open(os.path.join(settings.PUBLISH_DIR, "index.html")) as fp:
+        assert fp.read() == "Menu"
+
+    assert os.path.exists(settings.RENDER_CACHE) is False
@@ -0,0 +1,162 @@
+import json
+import os
+
+from jinja2 import DictLoader, FileSystemLoader
+from jinja2 import Environment as Jinja2Environment
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.introspection import IntrospectionCache
+from optimus.pages.views import PageTemplateView
+
+
+class CountingEnvironment(Jinja2Environment):
+    """
+    Jinja environment which records parsed template sources.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed = []
+
+    def parse(self, source, *args, **kwargs):
+        self.parsed.append(source)
+        return super().parse(source, *args, **kwargs)
+
+
+def write_template(path, content):
+    """
+    Write template with a modification time different from the previous one.
+    """
+    previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+
+    with open(path, "w") as fp:
+        fp.write(content)
+
+    os.utime(path, ns=(previous + 10 ** 9, previous + 10 ** 9))
+
+
+def test_introspection_cache(tmpdir):
+    """
+    References should be parsed once until their template change and be persisted
+    to cache file.
+    """
+    templates_dir = tmpdir.mkdir("templates").strpath
+    index_path = os.path.join(templates_dir, "index.html")
+    write_template(index_path, "{% extends 'skeleton.html' %}")
+    write_template(os.path.join(templates_dir, "skeleton.html"), "<html>")
+
+    env = CountingEnvironment(loader=FileSystemLoader(templates_dir))
+    cache_path = tmpdir.join("introspection.json").strpath
+    cache = IntrospectionCache(path=cache_path)
+
+    assert cache.get_references(env, "index.html") == ["skeleton.html"]
+    assert cache.get_references(env, "index.html") == ["skeleton.html"]
+    assert len(env.parsed) == 1
+
+    # Validated entries are not checked again until reset
+    write_template(index_path, "{% include '_menu.html' %}")
+    assert cache.get_references(env, "index.html") == ["skeleton.html"]
+
+    cache.reset()
+    assert cache.get_references(env, "index.html") == ["_menu.html"]
+    assert len(env.parsed) == 2
+
+    cache.save()
+    assert cache.updated is False
+
+    # Persisted cache is reused from a new cache
+    cache = IntrospectionCache(path=cache_path)
+    cache.load()
+    assert cache.get_references(env, "index.html") == ["_menu.html"]
+    assert len(env.parsed) == 2
+
+    # Cache from other versions is ignored
+    with open(cache_path) as fp:
+        payload = json.load(fp)
+    payload["versions"] = ["0.0.0", "0.0.0"]
+    with open(cache_path, "w") as fp:
+        json.dump(payload, fp)
+
+    assert IntrospectionCache(path=cache_path).load() == {}
+
+
+def test_introspection_cache_without_file():
+    """
+    References of templates without source file should be validated from their
+    source.
+    """
+    templates = {"index.html": "{% extends 'skeleton.html' %}"}
+    env = CountingEnvironment(loader=DictLoader(templates))
+    cache = IntrospectionCache()
+
+    assert cache.get_references(env, "index.html") == ["skeleton.html"]
+    cache.reset()
+    assert cache.get_references(env, "index.html") == ["skeleton.html"]
+    assert len(env.parsed) == 1
+
+    templates["index.html"] = "Nope"
+    cache.reset()
+    assert cache.get_references(env, "index.html") == []
+    assert len(env.parsed) == 2
+
+
+def test_scan_introspection(minimal_basic_settings, temp_builds_dir):
+    """
+    Builder scan should parse shared templates once for every pages and persist
+    the introspection cache.
+    """
+    basepath = temp_builds_dir.join("builder_scan_introspection")
+    templates_dir = os.path.join(basepath.strpath, "templates")
+    cache_path = os.path.join(basepath.strpath, "introspection.json")
+    os.makedirs(templates_dir)
+    write_template(
+        os.path.join(templates_dir, "index.html"), "{% extends 'skeleton.html' %}"
+    )
+    write_template(os.path.join(templates_dir, "skeleton.html"), "<html>")
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.TEMPLATES_DIR = templates_dir
+    settings.JINJA_INTROSPECTION_CACHE = cache_path
+
+    env = CountingEnvironment(loader=FileSystemLoader(templates_dir))
+    builder = PageBuilder(settings, jinja_env=env)
+
+    pages = [
+        PageTemplateView(
+            title="Page",
+            destination="page-{}.html".format(i),
+            template_name="index.html",
+        )
+        for i in range(5)
+    ]
+
+    builder.scan_bulk(pages)
+
+    assert env.parsed == ["{% extends 'skeleton.html' %}", "<html>"]
+    assert builder.registry.get_destinations_from_template("skeleton.html") == set(
+        ["page-{}.html".format(i) for i in range(5)]
+    )
+    assert os.path.exists(cache_path) is True
+
+    # Pages do not hold their own introspection, references are the shared cache
+    # lists
+    assert [page._used_templates for page in pages] == [None] * 5
+    assert [page._template_references for page in pages] == [None] * 5
+    references = [page.get_template_references(env) for page in pages]
+    assert references[0] == {"index.html": ["skeleton.html"], "skeleton.html": []}
+    assert all(
+        item["index.html"] is builder.introspection.entries["index.html"][
+            "references"
+        ]
+        for item in references
+    )
+
+    # Another builder reuses the persisted cache
+    env = CountingEnvironment(loader=FileSystemLoader(templates_dir))
+    builder = PageBuilder(settings, jinja_env=env)
+    builder.scan_bulk([
+        PageTemplateView(
+            title="Page", destination="foo.html", template_name="index.html"
+        ),
+    ])
+
+    assert env.parsed == []
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+from jinja2 import DictLoader
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.tracking import TrackingEnvironment
+from optimus.pages.views import PageTemplateView
+
+
+TEMPLATES = {
+    "skeleton.html": "<html>{% block content %}{% endblock %}</html>",
+    "index.html": (
+        "{% extends 'skeleton.html' %}"
+        "{% block content %}{% include partial %}{% endblock %}"
+    ),
+    "_menu.html": "{% import '_macros.html' as macros %}Menu",
+    "_macros.html": "{% macro foo() %}{% endmacro %}",
+    "_footer.html": "Footer",
+}
+
+
+class PartialView(PageTemplateView):
+    """
+    A view which includes a partial template from its context.
+    """
+    title = "Partial"
+    template_name = "index.html"
+    partial = "_menu.html"
+
+    def get_context(self):
+        super().get_context()
+        self.context.update({"partial": self.partial})
+        return self.context
+
+
+def test_tracking_environment():
+    """
+    Tracking environment should record templates loaded while tracking is
+    active, including the dynamic ones.
+    """
+    env = TrackingEnvironment(loader=DictLoader(TEMPLATES))
+
+    env.get_template("skeleton.html")
+    assert env.tracked is None
+
+    env.start_tracking()
+    env.get_template("index.html").render(partial="_menu.html")
+    tracked = env.stop_tracking()
+
+    assert tracked == {
+        "index.html": ["skeleton.html", "_menu.html"],
+        "skeleton.html": [],
+        "_menu.html": ["_macros.html"],
+        "_macros.html": [],
+    }
+    assert env.tracked is None
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_tracking(minimal_basic_settings, temp_builds_dir, jobs):
+    """
+    Pages should be registered from dependencies tracked while they are built.
+    """
+    basepath = temp_builds_dir.join("builder_build_tracking_{}".format(jobs))
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = os.path.join(basepath.strpath, "_build")
+
+    env = TrackingEnvironment(loader=DictLoader(TEMPLATES))
+    builder = PageBuilder(settings, jinja_env=env, jobs=jobs, track_dependencies=True)
+
+    menu_view = PartialView(destination="menu.html")
+    footer_view = PartialView(destination="footer.html", partial="_footer.html")
+
+    builder.build_bulk([menu_view, footer_view])
+
+    registry = builder.registry
+    assert registry.references["index.html"] == {
+        "skeleton.html", "_menu.html", "_footer.html",
+    }
+    assert registry.references["_menu.html"] == {"_macros.html"}
+    # Dynamic includes are merged on the template which loads them, so every
+    # page using it depends from them
+    for name in ("skeleton.html", "_macros.html", "_footer.html"):
+        assert registry.get_destinations_from_template(name) == {
+            "menu.html", "footer.html",
+        }
+    assert registry.get_orphan_templates() == []
+
+
+def test_build_tracking_reused(minimal_basic_settings, fixtures_settings,
+                               temp_builds_dir):
+    """
+    Pages reused from a previous build should be registered from a scan.
+    """
+    basepath = temp_builds_dir.join("builder_build_tracking_reused")
+
+    settings = minimal_basic_settings(basepath.strpath)
+    settings.PUBLISH_DIR = os.path.join(basepath.strpath, "_build")
+    settings.BUILD_MANIFEST = os.path.join(basepath.strpath, "manifest.json")
+
+    templates = {
+        "index.html": "{% extends 'skeleton.html' %}",
+        "skeleton.html": "<html>",
+    }
+
+    def get_builder():
+        return PageBuilder(
+            settings,
+            jinja_env=TrackingEnvironment(loader=DictLoader(templates)),
+            incremental=True,
+            track_dependencies=True,
+        )
+
+    page = PageTemplateView(
+        title="Index", destination="index.html", template_name="index.html"
+    )
+
+    get_builder().build_bulk([page])
+
+    builder = get_builder()
+    builder.build_bulk([page])
+
+    assert builder.summary["reused"] == 1
+    assert builder.registry.get_pages_from_template("skeleton.html") == [page]
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+
+import pytest
+from jinja2 import FileSystemLoader
+from jinja2 import Environment as Jinja2Environment
+
+from optimus.pages.builder import PageBuilder
+from optimus.pages.registry import CompactPageRegistry
+from optimus.pages.views import PageTemplateView
+
+
+def write_template(path, content):
+    """
+    Write template with a modification time different from the previous one.
+    """
+    previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+
+    with open(path, "w") as fp:
+        fp.write(content)
+
+    os.utime(path, ns=(previous + 10 ** 9, previous + 10 ** 9))
+
+
+def get_pages():
+    """
+    Return new page instances, they are not scanned yet.
+    """
+    return [
+        PageTemplateView(
+            title="Index", destination="index.html", template_name="index.html",
+            datas=["foo.json"],
+        ),
+        PageTemplateView(
+            title="About", destination="about.html", template_name="about.html",
+        ),
+    ]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_registry_database(minimal_basic_settings, tmpdir, compact):
+    """
+    Registry should be persisted to database and pages with a valid saved entry
+    should be registered without to be scanned.
+    """
+    templates_dir = tmpdir.mkdir("templates").strpath
+    write_template(
+        os.path.join(templates_dir, "index.html"),
+        "{% extends 'skeleton.html' %}{% block content %}"
+        "{% include '_menu.html' %}{% endblock %}",
+    )
+    write_template(os.path.join(templates_dir, "about.html"), "About")
+    write_template(
+        os.path.join(templates_dir, "skeleton.html"),
+        "<html>{% block content %}{% endblock %}</html>",
+    )
+    write_template(os.path.join(templates_dir, "_menu.html"), "Menu")
+
+    settings = minimal_basic_settings(tmpdir.strpath)
+    settings.REGISTRY_DATABASE = tmpdir.join("registry.sqlite").strpath
+    settings.REGISTRY_COMPACT = compact
+
+    scanned = []
+
+    def get_builder():
+        builder = PageBuilder(
+            settings,
+            jinja_env=Jinja2Environment(loader=FileSystemLoader(templates_dir)),
+        )
+        scan_item = builder.scan_item
+
+        def tracked_scan_item(page_item):
+            templates = scan_item(page_item)
+            scanned.append((page_item.get_destination(), templates))
+            return templates
+
+        builder.scan_item = tracked_scan_item
+        del scanned[:]
+
+        return builder
+
+    get_builder().scan_bulk(get_pages())
+
+    # Database can be queried without Optimus
+    with sqlite3.connect(settings.REGISTRY_DATABASE) as connection:
+        assert sorted(connection.execute(
+            "SELECT destination, template FROM pages"
+        )) == [("about.html", "about.html"), ("index.html", "index.html")]
+        assert sorted(connection.execute(
+            "SELECT destination, data FROM page_datas"
+        )) == [("index.html", "foo.json")]
+        assert sorted(connection.execute(
+            "SELECT template, reference FROM template_references"
+        )) == [("index.html", "_menu.html"), ("index.html", "skeleton.html")]
+
+    # Pages are registered from database without to be scanned
+    builder = get_builder()
+    pages = get_pages()
+    builder.scan_bulk(pages)
+
+    assert scanned == []
+    assert builder.registry_database.changed == {}
+    assert isinstance(builder.registry, CompactPageRegistry) is compact
+    assert builder.registry.get_pages_from_template("_menu.html") == [pages[0]]
+    assert builder.registry.get_pages_from_data("foo.json") == [pages[0]]
+
+    # Only pages depending from a modified template are scanned again
+    write_template(os.path.join(templates_dir, "_menu.html"), "{{ foo }}")
+
+    builder = get_builder()
+    pages = get_pages()
+    builder.scan_bulk(pages)
+
+    assert scanned == [
+        ("index.html", ["index.html", "skeleton.html", "_menu.html"]),
+    ]
+    assert builder.registry.get_pages_from_template("skeleton.html") == [pages[0]]
+
+    # Modified template has been saved again
+    builder = get_builder()
+    pages = get_pages()
+    builder.scan_bulk(pages)
+
+    assert scanned == []
+
+    # A page with another template is scanned again
+    pages = get_pages()
+    pages[1].template_name = "skeleton.html"
+    builder = get_builder()
+    builder.scan_bulk(pages)
+
+    assert scanned == [("about.html", ["skeleton.html"])]
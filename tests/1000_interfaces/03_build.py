@@ -75,3 +75,130 @@ def test_build_interface(tmpdir, fixtures_settings, starter_basic_settings):
     assert (
         os.path.exists(os.path.join(builddir_path, "static", "css", "app.css")) is True
     )
+
+
+def test_build_interface_hooks(tmpdir, fixtures_settings, starter_basic_settings):
+    """
+    Build interface should emit build lifecycle events to hooks from settings and
+    arguments.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+
+    settings = starter_basic_settings(project_path)
+
+    starter_interface(template_path, sample_name, basedir)
+
+    events = []
+
+    def record(builder, event, **payload):
+        events.append((event, payload.get("destination")))
+
+    def check_write(builder, event, size, written, timing, **payload):
+        assert size > 0
+        assert written is True
+        assert timing["size"] == size
+
+    settings.BUILD_HOOKS = {
+        "after_assets": [record],
+        "before_render": [record],
+        "after_render": [record],
+        "after_write": [record],
+    }
+
+    builder_interface(
+        settings,
+        DummyViewsModule(),
+        hooks={"after_write": [check_write]},
+    )
+
+    assert events == [
+        ("after_assets", None),
+        ("before_render", "index.html"),
+        ("after_render", "index.html"),
+        ("after_write", "index.html"),
+        ("before_render", "index_fr_FR.html"),
+        ("after_render", "index_fr_FR.html"),
+        ("after_write", "index_fr_FR.html"),
+    ]
+
+
+def test_build_interface_gzip(tmpdir, fixtures_settings, starter_basic_settings):
+    """
+    Build interface should write gzip sidecar files when enabled.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+
+    settings = starter_basic_settings(project_path)
+    settings.GZIP_SIDECARS = True
+    settings.GZIP_MIN_SIZE = 0
+
+    starter_interface(template_path, sample_name, basedir)
+
+    result = builder_interface(settings, DummyViewsModule())
+
+    builddir_path = settings.PUBLISH_DIR
+    assert os.path.join(builddir_path, "index.html.gz") in result["compressed"]
+    assert os.path.join(builddir_path, "index_fr_FR.html.gz") in result["compressed"]
+    assert (
+        os.path.join(builddir_path, "static", "css", "app.css.gz")
+        in result["compressed"]
+    )
+
+    for path in result["compressed"]:
+        assert os.path.exists(path) is True
+
+    # Untouched pages are not compressed again
+    result = builder_interface(settings, DummyViewsModule(), write_if_changed=True)
+    assert os.path.join(builddir_path, "index.html.gz") not in result["compressed"]
+
+    # Pages rebuilt later from builder, like from watcher, are compressed again
+    sidecar_path = os.path.join(builddir_path, "index.html.gz")
+    os.utime(sidecar_path, (0, 0))
+
+    builder = result["builder"]
+    builder.build_bulk([DummyView(destination="index.html")])
+    assert builder.compressed == [sidecar_path]
+    assert os.stat(sidecar_path).st_mtime > 0
+
+
+def test_build_interface_pages_callable(tmpdir, fixtures_settings,
+                                        starter_basic_settings):
+    """
+    Build interface should accept pages from a callable returning a generator.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+
+    settings = starter_basic_settings(project_path)
+
+    starter_interface(template_path, sample_name, basedir)
+
+    class GeneratedViewsModule:
+        @staticmethod
+        def PAGES():
+            for lang in ("en_US", "fr_FR"):
+                yield DummyView(lang=lang)
+
+    result = builder_interface(settings, GeneratedViewsModule())
+
+    assert result["builded"] == [
+        os.path.join(settings.PUBLISH_DIR, "index_en_US.html"),
+        os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html"),
+    ]
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from jinja2.exceptions import TemplateSyntaxError
+
+from optimus.interfaces.build import builder_interface
+from optimus.interfaces.starter import starter_interface
+from optimus.interfaces.templates import compile_templates_interface
+from optimus.logs import set_loggers_level
+from optimus.pages.loaders import PrecompiledLoader
+from optimus.pages.views import PageTemplateView
+
+
+class DummyView(PageTemplateView):
+    """
+    A dummy view similar to the one from "basic" starter.
+    """
+
+    title = "My project"
+    template_name = "index.html"
+    destination = "index_{language_code}.html"
+
+
+class DummyViewsModule:
+    """
+    Object to mime a page module.
+    """
+
+    PAGES = [
+        DummyView(destination="index.html"),
+        DummyView(lang="fr_FR"),
+    ]
+
+
+@pytest.mark.parametrize("zip_method, filename", [
+    ("deflated", "templates.zip"),
+    (None, "templates"),
+])
+def test_compile_templates_interface(tmpdir, fixtures_settings,
+                                     starter_basic_settings, zip_method, filename):
+    """
+    Compiled templates should be loaded to build the same pages than with template
+    sources.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+
+    settings = starter_basic_settings(project_path)
+    starter_interface(template_path, sample_name, basedir)
+
+    target = os.path.join(project_path, filename)
+    assert compile_templates_interface(
+        settings, target, zip_method=zip_method
+    ) == target
+    assert os.path.exists(target) is True
+
+    # Build from template sources
+    builder_interface(settings, DummyViewsModule())
+    with open(os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html")) as fp:
+        from_sources = fp.read()
+    os.remove(os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html"))
+
+    # Build from compiled templates, source changes are ignored
+    with open(os.path.join(settings.TEMPLATES_DIR, "index.html"), "a") as fp:
+        fp.write("Changed")
+
+    settings.JINJA_PRECOMPILED = target
+    build_env = builder_interface(settings, DummyViewsModule())
+    assert isinstance(build_env["builder"].jinja_env.loader, PrecompiledLoader)
+    with open(os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html")) as fp:
+        assert fp.read() == from_sources
+
+
+def test_compile_templates_interface_error(tmpdir, fixtures_settings,
+                                           starter_basic_settings):
+    """
+    Template syntax errors should be raised.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(basedir, sample_name, "project")
+
+    settings = starter_basic_settings(project_path)
+    starter_interface(template_path, sample_name, basedir)
+
+    with open(os.path.join(settings.TEMPLATES_DIR, "broken.html"), "w") as fp:
+        fp.write("{% block content %}Nope")
+
+    with pytest.raises(TemplateSyntaxError):
+        compile_templates_interface(
+            settings, os.path.join(project_path, "templates.zip")
+        )
@@ -0,0 +1,235 @@
+import importlib
+import os
+import socket
+import sys
+import threading
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from optimus.exceptions import BuildDaemonError
+from optimus.interfaces.build import builder_interface
+from optimus.interfaces.serve_builds import send_build_request, serve_builds_interface
+from optimus.interfaces.starter import starter_interface
+from optimus.logs import set_loggers_level
+from optimus.pages.views import PageTemplateView
+
+
+class DummyView(PageTemplateView):
+    """
+    A dummy view similar to the one from "basic" starter.
+    """
+
+    title = "My project"
+    template_name = "index.html"
+    destination = "index_{language_code}.html"
+
+
+class DummyViewsModule:
+    """
+    Object to mime a page module.
+    """
+
+    PAGES = [
+        DummyView(destination="index.html"),
+        DummyView(lang="fr_FR"),
+    ]
+
+
+def test_serve_builds_interface(tmpdir, fixtures_settings, starter_basic_settings):
+    """
+    Build server should process build requests until it is stopped.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+    socket_path = os.path.join(basedir, "builds.sock")
+
+    settings = starter_basic_settings(project_path)
+    builddir_path = settings.PUBLISH_DIR
+
+    starter_interface(template_path, sample_name, basedir)
+
+    views = DummyViewsModule()
+    build_env = builder_interface(settings, views)
+
+    server = serve_builds_interface(settings, views, build_env, socket_path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        assert send_build_request(socket_path, {"action": "ping"}) == {
+            "status": "ok"
+        }
+
+        # Only one daemon can serve a socket
+        with pytest.raises(BuildDaemonError):
+            serve_builds_interface(settings, views, build_env, socket_path)
+
+        response = send_build_request(socket_path, {
+            "action": "build",
+            "templates": ["index.html", "nope.html"],
+        })
+        assert response["status"] == "ok"
+        assert sorted(response["built"]) == [
+            os.path.join(builddir_path, "index.html"),
+            os.path.join(builddir_path, "index_fr_FR.html"),
+        ]
+        assert response["unknown"] == ["nope.html"]
+
+        response = send_build_request(socket_path, {
+            "action": "build",
+            "destinations": ["index_fr_FR.html"],
+        })
+        assert response["built"] == [
+            os.path.join(builddir_path, "index_fr_FR.html"),
+        ]
+
+        response = send_build_request(socket_path, {"action": "build"})
+        assert len(response["built"]) == 2
+
+        response = send_build_request(socket_path, {"action": "nope"})
+        assert response == {"status": "error", "error": "Unknown action: nope"}
+
+        assert send_build_request(socket_path, {"action": "stop"}) == {
+            "status": "ok"
+        }
+        thread.join(timeout=5)
+        assert thread.is_alive() is False
+    finally:
+        if thread.is_alive():
+            server.shutdown()
+            thread.join()
+        server.server_close()
+
+    assert os.path.exists(socket_path) is False
+
+    # A socket file left over is replaced
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server = serve_builds_interface(settings, views, build_env, socket_path)
+    server.server_close()
+
+    # Any other file is never removed
+    with open(socket_path, "w") as fp:
+        fp.write("Keep me")
+
+    with pytest.raises(BuildDaemonError):
+        serve_builds_interface(settings, views, build_env, socket_path)
+
+    with open(socket_path) as fp:
+        assert fp.read() == "Keep me"
+
+
+def test_serve_builds_interface_tracking(tmpdir, fixtures_settings,
+                                         starter_basic_settings):
+    """
+    Build daemon should use pages registered from the first build when builder
+    tracks dependencies and refuse pages which can only be loaded once.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+    socket_path = os.path.join(basedir, "builds.sock")
+
+    settings = starter_basic_settings(project_path)
+
+    starter_interface(template_path, sample_name, basedir)
+
+    views = DummyViewsModule()
+    build_env = builder_interface(settings, views, track_dependencies=True)
+    registry = build_env["builder"].registry
+
+    server = serve_builds_interface(settings, views, build_env, socket_path)
+    try:
+        assert server.daemon.builder.registry is registry
+        assert sorted(registry.get_all_destinations()) == [
+            "index.html", "index_fr_FR.html",
+        ]
+
+        # Full build request registers pages again
+        response = server.daemon.process({"action": "build"})
+        assert sorted(response["built"]) == [
+            os.path.join(settings.PUBLISH_DIR, "index.html"),
+            os.path.join(settings.PUBLISH_DIR, "index_fr_FR.html"),
+        ]
+        assert len(server.daemon.builder.registry.get_all_destinations()) == 2
+    finally:
+        server.server_close()
+
+    class GeneratorViewsModule:
+        PAGES = (page for page in DummyViewsModule.PAGES)
+
+    with pytest.raises(BuildDaemonError):
+        serve_builds_interface(settings, GeneratorViewsModule(), build_env, socket_path)
+
+
+def test_serve_builds_interface_reload(tmpdir, monkeypatch, fixtures_settings,
+                                       starter_basic_settings):
+    """
+    Full build request should reload pages module and its submodules, a failing
+    full build should keep the previous registry.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    basedir = tmpdir
+    sample_name = "basic"
+    destination = os.path.join(basedir, sample_name)
+    template_path = os.path.join(fixtures_settings.starters_path, sample_name)
+    project_path = os.path.join(destination, "project")
+    socket_path = os.path.join(basedir, "builds.sock")
+
+    settings = starter_basic_settings(project_path)
+
+    starter_interface(template_path, sample_name, basedir)
+
+    # A pages package which gets its pages from a submodule
+    package_dir = basedir.mkdir("modules").mkdir("daemon_pages")
+    package_dir.join("__init__.py").write("from .views import PAGES  # noqa\n")
+
+    def write_views(destination, template_name="index.html"):
+        package_dir.join("views.py").write(
+            "from optimus.pages.views import PageTemplateView\n"
+            "PAGES = [PageTemplateView(title='Foo', destination='{}', "
+            "template_name='{}')]\n".format(destination, template_name)
+        )
+
+    write_views("index.html")
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.syspath_prepend(basedir.join("modules").strpath)
+    try:
+        views = importlib.import_module("daemon_pages")
+        build_env = builder_interface(settings, views, track_dependencies=True)
+        server = serve_builds_interface(settings, views, build_env, socket_path)
+
+        try:
+            write_views("reloaded.html")
+
+            response = server.daemon.process({"action": "build"})
+            assert response["built"] == [
+                os.path.join(settings.PUBLISH_DIR, "reloaded.html"),
+            ]
+            registry = server.daemon.builder.registry
+            assert list(registry.get_all_destinations()) == ["reloaded.html"]
+
+            write_views("failing.html", template_name="missing.html")
+
+            with pytest.raises(TemplateNotFound):
+                server.daemon.process({"action": "build"})
+            assert server.daemon.builder.registry is registry
+        finally:
+            server.server_close()
+    finally:
+        for name in ("daemon_pages", "daemon_pages.views"):
+            sys.modules.pop(name, None)
@@ -1,5 +1,7 @@
+import json
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from optimus.cli.console_script import cli_frontend
@@ -8,7 +10,11 @@ from optimus.logs import set_loggers_level
 from optimus.utils.cleaning_system import FlushSettings, ResetSyspath
 
 
-def test_cli_builder(tmp_path, fixtures_settings):
+@pytest.mark.parametrize("options", [
+    [],
+    ["--jobs=2"],
+])
+def test_cli_builder(tmp_path, fixtures_settings, options):
     """
     Builder CLI should correctly build pages from project settings and map.
     """
@@ -37,7 +43,7 @@ def test_cli_builder(tmp_path, fixtures_settings):
                 "build",
                 "--settings-name=settings.base",
                 "--basedir={}".format(project_path),
-            ],
+            ] + options,
         )
         # print("result.exit_code:", result.exit_code)
         # print("result.exc_info:", result.exc_info)
@@ -54,3 +60,46 @@ def test_cli_builder(tmp_path, fixtures_settings):
         assert (builddir_path / "index.html").exists() is True
         assert (builddir_path / "index_fr_FR.html").exists() is True
         assert (builddir_path / "static" / "css" / "app.css").exists() is True
+
+
+def test_cli_builder_report(tmp_path, fixtures_settings):
+    """
+    Builder CLI should output the slowest pages and write a build report.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    sample_name = "basic_sample"
+    template_name = "basic"
+
+    destination = tmp_path / sample_name
+    template_path = Path(fixtures_settings.starters_path) / template_name
+    project_path = destination / "project"
+    report_path = tmp_path / "report.json"
+
+    with FlushSettings(), ResetSyspath(project_path):
+        starter_interface(str(template_path), sample_name, str(tmp_path))
+
+        runner = CliRunner()
+
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "build",
+                "--settings-name=settings.base",
+                "--basedir={}".format(project_path),
+                "--slowest=1",
+                "--report={}".format(report_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+
+        report = json.loads(report_path.read_text())
+
+        assert sorted([item["destination"] for item in report["pages"]]) == [
+            "index.html",
+            "index_fr_FR.html",
+        ]
+        assert list(report["templates"].keys()) == ["index.html"]
+        assert report["templates"]["index.html"]["pages"] == 2
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from optimus.cli.console_script import cli_frontend
+from optimus.interfaces.starter import starter_interface
+from optimus.logs import set_loggers_level
+from optimus.utils.cleaning_system import FlushSettings, ResetSyspath
+
+
+def test_cli_compile_templates(tmp_path, fixtures_settings):
+    """
+    Command should compile templates to the given target.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    sample_name = "basic_sample"
+    template_name = "basic"
+
+    destination = tmp_path / sample_name
+    template_path = Path(fixtures_settings.starters_path) / template_name
+    project_path = destination / "project"
+    target_path = project_path / "templates.zip"
+
+    with FlushSettings(), ResetSyspath(project_path):
+        starter_interface(str(template_path), sample_name, str(tmp_path))
+
+        runner = CliRunner()
+
+        # Without target from option or settings, command is aborted
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "compile-templates",
+                "--settings-name=settings.base",
+                "--basedir={}".format(project_path),
+            ],
+        )
+        assert result.exit_code == 1
+        assert target_path.exists() is False
+
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "compile-templates",
+                "--settings-name=settings.base",
+                "--basedir={}".format(project_path),
+                "--target={}".format(target_path),
+            ],
+        )
+        assert result.exit_code == 0
+        assert target_path.exists() is True
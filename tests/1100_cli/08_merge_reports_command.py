@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from optimus.cli.console_script import cli_frontend
+from optimus.interfaces.starter import starter_interface
+from optimus.logs import set_loggers_level
+from optimus.utils.cleaning_system import FlushSettings, ResetSyspath
+
+
+def test_cli_merge_reports(tmp_path, fixtures_settings):
+    """
+    Reports from sharded builds should be merged and colliding reports should
+    abort the command.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    sample_name = "basic_sample"
+    template_name = "basic"
+
+    destination = tmp_path / sample_name
+    template_path = Path(fixtures_settings.starters_path) / template_name
+    project_path = destination / "project"
+
+    with FlushSettings(), ResetSyspath(project_path):
+        starter_interface(str(template_path), sample_name, str(tmp_path))
+
+        runner = CliRunner()
+
+        # Build every shards
+        reports = []
+        for shard in ("1/2", "2/2"):
+            report_path = tmp_path / "report-{}.json".format(shard[0])
+            result = runner.invoke(
+                cli_frontend,
+                [
+                    "--test-env",
+                    "build",
+                    "--settings-name=settings.base",
+                    "--basedir={}".format(project_path),
+                    "--shard={}".format(shard),
+                    "--report={}".format(report_path),
+                ],
+            )
+            assert result.exit_code == 0
+            reports.append(str(report_path))
+
+        merged_path = tmp_path / "merged.json"
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "merge-reports",
+                "--output={}".format(merged_path),
+            ] + reports,
+        )
+        assert result.exit_code == 0
+
+        merged = json.loads(merged_path.read_text())
+        assert merged["destinations"] == ["index.html", "index_fr_FR.html"]
+        assert merged["shards"] == [[1, 2], [2, 2]]
+
+        # Merging a report twice is a collision
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "merge-reports",
+                "--output={}".format(merged_path),
+                str(merged_path),
+            ] + reports,
+        )
+        assert result.exit_code == 1
+
+
+def test_cli_build_invalid_shard(tmp_path):
+    """
+    Build command should refuse an invalid shard.
+    """
+    runner = CliRunner()
+
+    for value in ("1", "0/2", "3/2", "a/b"):
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "build",
+                "--basedir={}".format(tmp_path),
+                "--shard={}".format(value),
+            ],
+        )
+        assert result.exit_code == 2
@@ -0,0 +1,141 @@
+import logging
+import threading
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from optimus.cli.console_script import cli_frontend
+from optimus.interfaces.serve_builds import BuildServer
+from optimus.interfaces.starter import starter_interface
+from optimus.logs import set_loggers_level
+from optimus.utils.cleaning_system import FlushSettings, ResetSyspath
+
+
+class RecordingDaemon:
+    """
+    A daemon which records requests and returns a fixed build response.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def process(self, request):
+        self.requests.append(request)
+
+        if request["action"] == "stop":
+            return {"status": "ok"}
+
+        return {
+            "status": "ok",
+            "built": ["/build/index.html"],
+            "unknown": ["nope.html"],
+            "time": 0.1,
+        }
+
+
+def test_cli_serve_builds(caplog, tmp_path, fixtures_settings):
+    """
+    Daemon command should build pages and open the socket, in test environment it
+    does not serve requests.
+    """
+    set_loggers_level(["poyo", "cookiecutter", "binaryornot"])
+
+    sample_name = "basic_sample"
+    template_name = "basic"
+
+    destination = tmp_path / sample_name
+    template_path = Path(fixtures_settings.starters_path) / template_name
+    project_path = destination / "project"
+    builddir_path = project_path / "_build" / "dev"
+    socket_path = tmp_path / "builds.sock"
+
+    with FlushSettings(), ResetSyspath(project_path):
+        starter_interface(str(template_path), sample_name, str(tmp_path))
+
+        runner = CliRunner()
+
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "serve-builds",
+                "--settings-name=settings.base",
+                "--basedir={}".format(project_path),
+                "--socket={}".format(socket_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert (builddir_path / "index.html").exists() is True
+        assert socket_path.exists() is False
+        assert (
+            "optimus",
+            logging.WARNING,
+            "Serving build requests on: {}, use CTRL+C to stop it".format(socket_path),
+        ) in caplog.record_tuples
+
+
+def test_cli_request_build(caplog, tmp_path):
+    """
+    Client command should send build requests to daemon and abort when daemon is
+    not reachable.
+    """
+    socket_path = tmp_path / "builds.sock"
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli_frontend,
+        ["--test-env", "request-build", "--socket={}".format(socket_path)],
+    )
+    assert result.exit_code == 1
+
+    daemon = RecordingDaemon()
+    server = BuildServer(str(socket_path), daemon)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "request-build",
+                "--socket={}".format(socket_path),
+                "--template=index.html",
+                "--template=nope.html",
+                "--data=sample.json",
+            ],
+        )
+        assert result.exit_code == 0
+
+        result = runner.invoke(
+            cli_frontend,
+            [
+                "--test-env",
+                "request-build",
+                "--socket={}".format(socket_path),
+                "--stop",
+            ],
+        )
+        assert result.exit_code == 0
+        thread.join(timeout=5)
+    finally:
+        if thread.is_alive():
+            server.shutdown()
+            thread.join()
+        server.server_close()
+
+    assert daemon.requests == [
+        {
+            "action": "build",
+            "templates": ["index.html", "nope.html"],
+            "datas": ["sample.json"],
+            "destinations": [],
+        },
+        {"action": "stop"},
+    ]
+    assert (
+        "optimus", logging.WARNING, "Unknown template, data or destination: nope.html"
+    ) in caplog.record_tuples
+    assert ("optimus", logging.INFO, "Built 1 pages in 0.100s") in caplog.record_tuples
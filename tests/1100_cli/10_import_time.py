@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+# Maximum cumulative import time in microseconds for the command line entrypoint
+IMPORT_TIME_BUDGET = 100000
+
+# Heavy dependencies which must only be imported from the commands needing them
+HEAVY_MODULES = ["babel", "cherrypy", "cookiecutter", "jinja2", "watchdog", "webassets"]
+
+
+def get_imported_modules(code):
+    """
+    Run code in a new interpreter and return the top level names of imported
+    modules.
+    """
+    output = subprocess.check_output([
+        sys.executable,
+        "-c",
+        (
+            "import json, sys\n{}\n"
+            "print(json.dumps(sorted(set(name.split('.')[0] for name in sys.modules))))"
+        ).format(code),
+    ])
+
+    return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+def test_import_time_budget():
+    """
+    Command line entrypoint import should stay below the import time budget.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import optimus.cli.console_script"],
+        capture_output=True,
+        check=True,
+    )
+
+    cumulative = None
+    for line in process.stderr.decode("utf-8").splitlines():
+        if line.rstrip().endswith("| optimus.cli.console_script"):
+            cumulative = int(line.split("|")[1])
+
+    assert cumulative is not None
+    assert cumulative < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("code", [
+    "import optimus",
+    "import optimus.cli.console_script",
+    (
+        "from optimus.cli.console_script import cli_frontend\n"
+        "cli_frontend(['version'], standalone_mode=False)"
+    ),
+    "import optimus.cli.request_build",
+])
+def test_lazy_imports(code):
+    """
+    Heavy dependencies should not be imported from entrypoint and light commands.
+    """
+    imported = get_imported_modules(code)
+
+    assert [name for name in HEAVY_MODULES if name in imported] == []